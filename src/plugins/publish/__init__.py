@@ -1,4 +1,6 @@
-from nonebot import logger, on_type
+import logging
+
+from nonebot import get_driver, logger, on_type
 from nonebot.adapters.github import (
     GitHubBot,
     IssueCommentCreated,
@@ -7,35 +9,64 @@ from nonebot.adapters.github import (
     IssuesReopened,
     PullRequestClosed,
     PullRequestReviewSubmitted,
+    WorkflowDispatch,
 )
+from nonebot.log import LoguruHandler
 from nonebot.params import Depends
 
+from src.utils.validation.cache import URLCache, set_url_cache
+from src.utils.validation.constants import URL_CACHE_FILENAME
 from src.utils.validation.models import PublishType
+from src.utils.validation.utils import close_client, set_github_token
 
 from .config import plugin_config
-from .constants import BOT_MARKER, BRANCH_NAME_PREFIX, TITLE_MAX_LENGTH
+from .constants import BOT_MARKER, STATE_STORE_FILENAME, TEMPLATE_CACHE_DIRNAME
 from .depends import (
+    get_changed_fields,
     get_installation_id,
     get_issue_number,
     get_pull_requests_by_label,
     get_related_issue_number,
     get_repo_info,
     get_type_by_labels,
+    is_self_edit,
 )
 from .models import RepoInfo
+from .render import load_state, set_template_cache
+from .store import StateStore, get_state_store, set_state_store
 from .utils import (
-    comment_issue,
-    commit_and_push,
-    create_pull_request,
     ensure_issue_content,
+    find_bot_comment,
+    get_check_key,
+    get_plugin_test_result,
+    list_comments,
+    log_validation_result,
+    process_publish_check,
+    recheck_publish_issues,
     resolve_conflict_pull_requests,
     run_shell_command,
     should_skip_plugin_test,
-    update_file,
     validate_info_from_issue,
 )
 
 
+# 插件测试脚本使用标准库的日志，转发到 NoneBot 的日志中
+logging.getLogger("plugin_test").addHandler(LoguruHandler())
+
+# 检查网址相关的设置
+# 退出前需要关闭检查网址使用的 HTTP 客户端
+set_github_token(plugin_config.github_token)
+get_driver().on_shutdown(close_client)
+
+# 设置了缓存目录时，将网址检查结果、运行状态与模板编译结果保存至文件中，方便下次运行时复用
+if plugin_config.input_config.cache_dir:
+    set_url_cache(URLCache(plugin_config.input_config.cache_dir / URL_CACHE_FILENAME))
+    set_state_store(
+        StateStore(plugin_config.input_config.cache_dir / STATE_STORE_FILENAME)
+    )
+    set_template_cache(plugin_config.input_config.cache_dir / TEMPLATE_CACHE_DIRNAME)
+
+
 def bypass_git():
     """绕过检查"""
     # https://github.blog/2022-04-18-highlights-from-git-2-36/#stricter-repository-ownership-checks
@@ -127,7 +158,12 @@ async def handle_pr_close(
 async def check_rule(
     event: IssuesOpened | IssuesReopened | IssuesEdited | IssueCommentCreated,
     publish_type: PublishType | None = Depends(get_type_by_labels),
+    changed_fields: set[str] | None = Depends(get_changed_fields),
+    self_edit: bool = Depends(is_self_edit),
 ) -> bool:
+    if self_edit:
+        logger.info("议题修改来自机器人，已跳过")
+        return False
     if (
         isinstance(event, IssueCommentCreated)
         and event.payload.comment.user
@@ -141,6 +177,9 @@ async def check_rule(
     if not publish_type:
         logger.info("议题与发布无关，已跳过")
         await publish_check_matcher.finish()
+    if changed_fields is not None and not changed_fields:
+        logger.info("议题修改未涉及发布信息，已跳过")
+        return False
 
     return True
 
@@ -156,10 +195,12 @@ publish_check_matcher = on_type(
 )
 async def handle_publish_check(
     bot: GitHubBot,
+    event: IssuesOpened | IssuesReopened | IssuesEdited | IssueCommentCreated,
     installation_id: int = Depends(get_installation_id),
     repo_info: RepoInfo = Depends(get_repo_info),
     issue_number: int = Depends(get_issue_number),
     publish_type: PublishType = Depends(get_type_by_labels),
+    changed_fields: set[str] | None = Depends(get_changed_fields),
 ) -> None:
     async with bot.as_installation(installation_id):
         # 因为 Actions 会排队，触发事件相关的议题在 Actions 执行时可能已经被关闭
@@ -175,73 +216,62 @@ async def handle_publish_check(
             await publish_check_matcher.finish()
 
         # 是否需要跳过插件测试
-        plugin_config.skip_plugin_test = await should_skip_plugin_test(
-            bot, repo_info, issue_number
-        )
+        comments = await list_comments(bot, repo_info, issue_number)
+        plugin_config.skip_plugin_test = should_skip_plugin_test(comments)
+
+        # 议题在排队期间可能又被修改过，此时需要完整检查
+        if issue.body != event.payload.issue.body:
+            changed_fields = None
 
         # 如果需要跳过插件测试，则修改议题内容，确保其包含插件所需信息
+        # 修改后的内容直接用于本次检查，修改触发的运行会被跳过
         if publish_type == PublishType.PLUGIN and plugin_config.skip_plugin_test:
-            await ensure_issue_content(bot, repo_info, issue_number, issue.body or "")  # type: ignore
+            issue.body = await ensure_issue_content(
+                bot, repo_info, issue_number, issue.body or ""
+            )
+
+        # 检查所用数据与上次通过的检查完全相同时，检查结果也不会变化
+        # 直接跳过，不需要重新验证，也不需要 git 操作
+        # 检查状态只从机器人自己的评论中读取，避免被伪造的评论跳过检查
+        test_result = get_plugin_test_result()
+        key = get_check_key(issue, publish_type, test_result)
+        bot_comment = find_bot_comment(bot, comments)
+        state = load_state(bot_comment.body or "") if bot_comment else None
+        if state and state.valid and state.key == key:
+            skipped = get_state_store().incr("skipped_runs")
+            logger.info(f"检查数据无变化，已跳过（累计跳过 {skipped} 次）")
+            await publish_check_matcher.finish()
 
         # 检查是否满足发布要求
         # 仅在通过检查的情况下创建拉取请求
-        result = validate_info_from_issue(issue, publish_type)
-
-        # 设置拉取请求与议题的标题
-        # 限制标题长度，过长的标题不好看
-        title = f"{publish_type.value}: {result['name'][:TITLE_MAX_LENGTH]}"
-
-        # 分支命名示例 publish/issue123
-        branch_name = f"{BRANCH_NAME_PREFIX}{issue_number}"
-        logger.info(result)
-        if result["valid"]:
-            # 创建新分支
-            run_shell_command(["git", "switch", "-C", branch_name])
-            # 更新文件并提交更改
-            old_version, new_version = update_file(result)
-            commit_and_push(
-                result,
-                branch_name,
-                issue_number,
-                old_version,
-                new_version,
-            )
-            if old_version:
-                title += f" (v{old_version} -> v{new_version})"
-            # 创建拉取请求
-            await create_pull_request(
-                bot, repo_info, result, branch_name, issue_number, title
-            )
-        else:
-            # 如果之前已经创建了拉取请求，则将其转换为草稿
-            pulls = (
-                await bot.rest.pulls.async_list(
-                    **repo_info.model_dump(), head=f"{repo_info.owner}:{branch_name}"
-                )
-            ).parsed_data
-            if pulls and (pull := pulls[0]) and not pull.draft:
-                await bot.async_graphql(
-                    query="""mutation convertPullRequestToDraft($pullRequestId: ID!) {
-                        convertPullRequestToDraft(input: {pullRequestId: $pullRequestId}) {
-                            clientMutationId
-                        }
-                    }""",
-                    variables={"pullRequestId": pull.node_id},
-                )
-                logger.info("发布没通过检查，已将之前的拉取请求转换为草稿")
-            else:
-                logger.info("发布没通过检查，暂不创建拉取请求")
-
-        # 修改议题标题
-        # 需要等创建完拉取请求并打上标签后执行
-        # 不然会因为修改议题触发 Actions 导致标签没有正常打上
-        if issue.title != title:
-            await bot.rest.issues.async_update(
-                **repo_info.model_dump(), issue_number=issue_number, title=title
-            )
-            logger.info(f"议题标题已修改为 {title}")
+        result = await validate_info_from_issue(
+            issue, publish_type, test_result, changed_fields
+        )
+
+        log_validation_result(result)
+        await process_publish_check(
+            bot, repo_info, issue, publish_type, result, test_result, key, bot_comment
+        )
+
+
+publish_recheck_matcher = on_type(WorkflowDispatch)
+
 
-        await comment_issue(bot, repo_info, issue_number, result)
+@publish_recheck_matcher.handle(
+    parameterless=[Depends(bypass_git), Depends(install_pre_commit_hooks)]
+)
+async def handle_publish_recheck(
+    bot: GitHubBot,
+    installation_id: int = Depends(get_installation_id),
+    repo_info: RepoInfo = Depends(get_repo_info),
+) -> None:
+    """重新检查所有开启的发布议题
+
+    网址检查等临时错误恢复后，议题不需要作者修改也能更新检查结果
+    所有议题共用同一个会话、令牌与缓存
+    """
+    async with bot.as_installation(installation_id):
+        await recheck_publish_issues(bot, repo_info, PublishType.PLUGIN)
 
 
 async def review_submiited_rule(
@@ -2,14 +2,31 @@ from pathlib import Path
 
 from nonebot import get_driver
 from pydantic import BaseModel, ConfigDict, field_validator
-from typing_extensions import TypedDict
+from typing_extensions import NotRequired, TypedDict
 
-from src.utils.plugin_test import strip_ansi
+from src.utils.plugin_test import summarize_output
 
 
 class PublishConfig(BaseModel):
     base: str
     plugin_path: Path
+    cache_dir: Path | None = None
+    """缓存目录，持久化后可在多次运行间复用缓存
+
+    需要位于仓库之外，不然会被一起提交。未设置时只使用内存缓存
+    """
+
+
+class ImportTimeModule(TypedDict):
+    module: str
+    time: float
+
+
+class ImportTime(TypedDict):
+    """插件的导入耗时，单位为毫秒"""
+
+    total: float
+    modules: list[ImportTimeModule]
 
 
 class PluginTestMetadata(TypedDict):
@@ -17,6 +34,7 @@ class PluginTestMetadata(TypedDict):
     usage: str
     plugin_type: str
     version: str
+    import_time: NotRequired[ImportTime]
 
 
 class Config(BaseModel, extra="ignore"):
@@ -25,21 +43,32 @@ class Config(BaseModel, extra="ignore"):
     input_config: PublishConfig
     github_repository: str
     github_run_id: str
+    github_token: str | None = None
+    """检查 GitHub 仓库时使用的令牌，未设置时改用 git ls-remote 检查"""
     skip_plugin_test: bool = False
+    plugin_test_skipped: bool = False
+    """预检确认仓库成员要求跳过插件测试，此时测试既不算通过也不算失败"""
     plugin_test_result: bool = False
     plugin_test_output: str = ""
     plugin_test_metadata: PluginTestMetadata | None = None
+    plugin_test_static_metadata: PluginTestMetadata | None = None
+    """测试前静态提取的插件元数据，插件测试没有输出元数据时使用"""
+    plugin_test_import_time_warning: float = 1000
+    """插件导入耗时超过该值（毫秒）时在评论中提示"""
 
-    @field_validator("plugin_test_result", mode="before")
+    @field_validator("plugin_test_result", "plugin_test_skipped", mode="before")
     @classmethod
     def plugin_test_result_validator(cls, v):
         # 如果插件测试没有运行时，会得到一个空字符串
+        # 没有使用预检时，.env 中列出的变量会得到 None
         # 这里将其转换为布尔值，不然会报错
-        if v == "":
+        if v is None or v == "":
             return False
         return v
 
-    @field_validator("plugin_test_metadata", mode="before")
+    @field_validator(
+        "plugin_test_metadata", "plugin_test_static_metadata", mode="before"
+    )
     @classmethod
     def plugin_test_metadata_validator(cls, v):
         # 如果插件测试没有运行时，会得到一个空字符串
@@ -48,11 +77,23 @@ class Config(BaseModel, extra="ignore"):
             return None
         return v
 
+    @field_validator("plugin_test_import_time_warning", mode="before")
+    @classmethod
+    def plugin_test_import_time_warning_validator(cls, v):
+        # 没有设置时，.env 中列出的变量会得到 None，这里改用默认值
+        if v is None or v == "":
+            return cls.model_fields["plugin_test_import_time_warning"].default
+        return v
+
     @field_validator("plugin_test_output", mode="before")
     @classmethod
     def plugin_test_output_validator(cls, v):
-        """移除 ANSI 转义字符"""
-        return strip_ansi(v)
+        """过长时只保留摘要
+
+        插件测试输出时已经移除了 ANSI 转义字符，不需要再处理
+        插件测试没有运行时，.env 中列出的变量会得到 None
+        """
+        return summarize_output(v or "")
 
 
 plugin_config = Config.model_validate(dict(get_driver().config))
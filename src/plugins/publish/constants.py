@@ -1,7 +1,9 @@
-import re
-
 NONEFLOW_MARKER = "<!-- ZHENXUNFLOW -->"
 
+STATE_MARKER_PREFIX = "<!-- ZHENXUNFLOW_STATE "
+"""评论中保存插件测试结果的标记"""
+STATE_MARKER_SUFFIX = " -->"
+
 BOT_MARKER = "[bot]"
 """机器人的名字结尾都会带有这个"""
 
@@ -16,26 +18,32 @@ BRANCH_NAME_PREFIX = "publish/issue"
 TITLE_MAX_LENGTH = 50
 """标题最大长度"""
 
-# 匹配信息的正则表达式
+RECHECK_CONCURRENCY = 4
+"""重新检查议题时，同时检查的议题数量"""
+
+STATE_STORE_FILENAME = "state.db"
+"""运行状态存储的文件名"""
+
+TEMPLATE_CACHE_DIRNAME = "templates"
+"""模板编译结果的缓存目录名"""
+
+COMMENT_MAX_LENGTH = 65536
+"""评论的最大长度，超出时 GitHub 会拒绝创建评论"""
+
+LOG_MAX_LENGTH = 1000
+"""单条日志的最大长度，完整内容仅在调试日志中输出"""
+
+# 议题中的标题
 # 格式：### {标题}\n\n{内容}
-ISSUE_PATTERN = r"### {}\s+([^\s#].*?)(?=(?:\s+###|$))"
 ISSUE_FIELD_TEMPLATE = "### {}"
-ISSUE_FIELD_PATTERN = r"### {}\s+"
 
-# 基本信息
-TAGS_PATTERN = re.compile(ISSUE_PATTERN.format("标签"))
 # 插件
 PLUGIN_NAME_STRING = "插件名称"
-PLUGIN_NAME_PATTERN = re.compile(ISSUE_PATTERN.format(PLUGIN_NAME_STRING))
 PLUGIN_MODULE_NAME_STRING = "模块名称"
-PLUGIN_MODULE_NAME_PATTERN = re.compile(ISSUE_PATTERN.format(PLUGIN_MODULE_NAME_STRING))
 PLUGIN_MODULE_PATH_STRING = "模块路径"
-PLUGIN_MODULE_PATH_PATTERN = re.compile(ISSUE_PATTERN.format(PLUGIN_MODULE_PATH_STRING))
 PLUGIN_GITHUB_URL_STRING = "仓库地址"
-PLUGIN_GITHUB_URL_PATTERN = re.compile(ISSUE_PATTERN.format(PLUGIN_GITHUB_URL_STRING))
 PLUGIN_IS_DIR_STRING = "是否为目录"
-PLUGIN_IS_DIR_PATTERN = re.compile(ISSUE_PATTERN.format(PLUGIN_IS_DIR_STRING))
-PLUGIN_CONFIG_PATTERN = re.compile(r"### 插件配置项\s+```(?:\w+)?\s?([\s\S]*?)```")
+PLUGIN_CONFIG_STRING = "插件配置项"
 PLUGIN_STRING_LIST = [
     PLUGIN_NAME_STRING,
     PLUGIN_MODULE_PATH_STRING,
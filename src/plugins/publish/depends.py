@@ -17,12 +17,14 @@ from nonebot.adapters.github import (
     IssuesReopened,
     PullRequestClosed,
     PullRequestReviewSubmitted,
+    WorkflowDispatch,
 )
 from nonebot.params import Depends
 
 from src.utils.validation.models import PublishType
 
 from . import utils
+from .constants import BOT_MARKER, TITLE_MAX_LENGTH
 from .models import RepoInfo
 
 
@@ -32,7 +34,8 @@ def get_repo_info(
     | IssuesOpened
     | IssuesReopened
     | IssuesEdited
-    | IssueCommentCreated,
+    | IssueCommentCreated
+    | WorkflowDispatch,
 ) -> RepoInfo:
     """获取仓库信息"""
     repo = event.payload.repository
@@ -96,6 +99,56 @@ async def get_pull_requests_by_label(
     ]
 
 
+def get_changed_fields(
+    event: IssuesOpened | IssuesReopened | IssuesEdited | IssueCommentCreated,
+    publish_type: PublishType | None = Depends(get_type_by_labels),
+) -> set[str] | None:
+    """获取议题修改时发生变化的发布信息
+
+    只有议题内容被修改时才会比较，其他事件返回 None，表示需要完整检查
+    """
+    if not isinstance(event, IssuesEdited) or publish_type is None:
+        return None
+
+    changes = event.payload.changes
+    if not changes.body:
+        # 只修改了标题
+        return set()
+
+    return utils.get_changed_fields(
+        changes.body.from_, event.payload.issue.body or "", publish_type
+    )
+
+
+def is_self_edit(
+    bot: GitHubBot,
+    event: IssuesOpened | IssuesReopened | IssuesEdited | IssueCommentCreated,
+    publish_type: PublishType | None = Depends(get_type_by_labels),
+) -> bool:
+    """议题修改是否由机器人自己触发
+
+    修改者为当前应用的机器人账号，或者只是插入了缺失的标题，或者只是将标题改为机器人设置的标题
+    其他机器人的修改仍然需要检查
+    """
+    if not isinstance(event, IssuesEdited) or publish_type is None:
+        return False
+
+    # 应用的 slug 在启动时获取，没有获取到时不能确定是否为自己
+    app_slug = bot._app_slug
+    if app_slug and event.payload.sender.login == f"{app_slug}{BOT_MARKER}":
+        return True
+
+    changes = event.payload.changes
+    issue = event.payload.issue
+    if changes.body:
+        return utils.is_inserted_headers_only(changes.body.from_, issue.body or "")
+
+    name = utils.extract_publish_info(issue.body or "", publish_type)["name"]
+    return bool(name) and issue.title.startswith(
+        f"{publish_type.value}: {name[:TITLE_MAX_LENGTH]}"
+    )
+
+
 def get_issue_number(
     event: IssuesOpened | IssuesReopened | IssuesEdited | IssueCommentCreated,
 ) -> int:
@@ -1,8 +1,42 @@
 from pydantic import BaseModel
 
+from .config import PluginTestMetadata
+
 
 class RepoInfo(BaseModel):
     """仓库信息"""
 
     owner: str
     repo: str
+
+
+class PluginTestResult(BaseModel):
+    """插件测试结果
+
+    除测试输出外都会保存在评论中，重新检查议题时不需要再次测试
+    """
+
+    skip: bool = False
+    """是否跳过测试"""
+    result: bool = False
+    """测试是否通过"""
+    output: str = ""
+    """测试输出"""
+    metadata: PluginTestMetadata | None = None
+    """插件元数据"""
+    action_url: str | None = None
+    """测试所在的 Actions 运行地址"""
+
+
+class CheckState(BaseModel):
+    """检查状态
+
+    保存在评论中，下次运行时用于判断是否需要重新检查
+    """
+
+    key: str = ""
+    """检查所用数据的哈希值"""
+    valid: bool = False
+    """是否通过检查"""
+    test_result: PluginTestResult
+    """插件测试结果"""
@@ -6,10 +6,33 @@ import jinja2
 from src.utils.validation.models import PublishType
 
 from .config import plugin_config
-from .constants import LOC_NAME_MAP
+from .constants import (
+    COMMENT_MAX_LENGTH,
+    LOC_NAME_MAP,
+    NONEFLOW_MARKER,
+    STATE_MARKER_PREFIX,
+    STATE_MARKER_SUFFIX,
+)
+from .models import CheckState, PluginTestResult
 
 if TYPE_CHECKING:
-    from src.utils.validation import ValidationDict
+    from src.utils.validation import ValidationResult
+
+# 评论中不需要显示的数据
+HIDDEN_DATA_KEYS = {
+    "module",
+    "module_path",
+    "name",
+    "description",
+    "author",
+    "usage",
+    "is_dir",
+}
+
+# 测试输出过长时显示的提示
+OUTPUT_OMITTED = "测试输出过长，请前往 Actions 查看完整输出。"
+# 省略测试输出后评论仍然过长时，截断评论后显示的提示
+COMMENT_TRUNCATED = "\n\n……\n\n⚠️ 评论过长，部分内容已省略。\n\n"
 
 type2name = {
     "NORMAL": "普通插件",
@@ -50,47 +73,131 @@ def loc_to_name(loc: list[str | int]) -> str:
     return " > ".join([_loc_to_name(str(item)) for item in loc])
 
 
-env = jinja2.Environment(
-    loader=jinja2.FileSystemLoader(Path(__file__).parent / "templates"),
-    enable_async=True,
-    lstrip_blocks=True,
-    trim_blocks=True,
-    autoescape=True,
-    keep_trailing_newline=True,
-)
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+
+def create_environment(
+    bytecode_cache: jinja2.BytecodeCache | None = None,
+) -> jinja2.Environment:
+    """创建模板环境
+
+    模板中没有异步操作，使用同步环境即可，编译与渲染都更快
+    设置 bytecode_cache 后，编译结果会被保存，之后运行时不需要重新解析与编译模板
+    """
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATES_DIR),
+        bytecode_cache=bytecode_cache,
+        lstrip_blocks=True,
+        trim_blocks=True,
+        autoescape=True,
+        keep_trailing_newline=True,
+    )
+
+    env.filters["tags_to_str"] = tags_to_str
+    env.filters["supported_adapters_to_str"] = supported_adapters_to_str
+    env.filters["plugin_type_to_str"] = plugin_type_to_str
+    env.filters["loc_to_name"] = loc_to_name
+    return env
+
+
+env = create_environment()
 
-env.filters["tags_to_str"] = tags_to_str
-env.filters["supported_adapters_to_str"] = supported_adapters_to_str
-env.filters["plugin_type_to_str"] = plugin_type_to_str
-env.filters["loc_to_name"] = loc_to_name
 
+def set_template_cache(directory: Path) -> None:
+    """将模板的编译结果保存至目录中
 
-async def render_comment(result: "ValidationDict", reuse: bool = False) -> str:
-    """将验证结果转换为评论内容"""
-    title = f"{result['type'].value}: {result['name']}"
+    需要在第一次渲染前设置，模板修改后缓存会自动失效
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    env.bytecode_cache = jinja2.FileSystemBytecodeCache(str(directory))
+
+
+def dump_state(state: CheckState) -> str:
+    """将检查状态转换为评论中的标记
+
+    测试输出已经显示在评论中，不需要保存
+    JSON 中的 > 需要转义，避免提前结束 HTML 注释
+    """
+    content = state.model_dump_json(exclude={"test_result": {"output"}})
+    content = content.replace(">", "\\u003e")
+    return f"{STATE_MARKER_PREFIX}{content}{STATE_MARKER_SUFFIX}"
+
+
+def load_state(comment: str) -> CheckState | None:
+    """从评论中读取检查状态"""
+    _, found, content = comment.partition(STATE_MARKER_PREFIX)
+    if not found:
+        return None
+    content, found, _ = content.partition(STATE_MARKER_SUFFIX)
+    if not found:
+        return None
+    try:
+        return CheckState.model_validate_json(content)
+    except ValueError:
+        return None
+
+
+def render_comment_sync(
+    result: "ValidationResult",
+    test_result: PluginTestResult,
+    reuse: bool = False,
+    key: str = "",
+) -> str:
+    """将验证结果转换为评论内容
+
+    key 为检查所用数据的哈希值，会与检查状态一起保存在评论中
+    """
+    title = f"{result.type.value}: {result.name}"
 
     # 有些数据不需要显示
-    result["data"].pop("module", None)
-    result["data"].pop("module_path", None)
-    result["data"].pop("name", None)
-    result["data"].pop("description", None)
-    result["data"].pop("author", None)
-    result["data"].pop("usage", None)
-    result["data"].pop("is_dir", None)
-
-    if result["type"] == PublishType.PLUGIN:
-        # https://github.com/he0119/action-test/actions/runs/4469672520
-        if plugin_config.plugin_test_result or plugin_config.skip_plugin_test:
-            result["data"]["action_url"] = (
-                f"https://github.com/{plugin_config.github_repository}/actions/runs/{plugin_config.github_run_id}"
-            )
+    data = {
+        key: value for key, value in result.data.items() if key not in HIDDEN_DATA_KEYS
+    }
+
+    if result.type == PublishType.PLUGIN and test_result.action_url:
+        data["action_url"] = test_result.action_url
 
     template = env.get_template("comment.md.jinja")
-    return await template.render_async(
-        reuse=reuse,
-        title=title,
-        valid=result["valid"],
-        data=result["data"],
-        errors=result["errors"],
-        skip_plugin_test=plugin_config.skip_plugin_test,
-    )
+    context = {
+        "reuse": reuse,
+        "title": title,
+        "valid": result.valid,
+        "data": data,
+        "errors": result.errors,
+        "skip_plugin_test": test_result.skip,
+        "import_time": (test_result.metadata or {}).get("import_time"),
+        "import_time_warning": plugin_config.plugin_test_import_time_warning,
+        "state": dump_state(
+            CheckState(key=key, valid=result.valid, test_result=test_result)
+        ),
+    }
+    comment = template.render(context)
+    if len(comment) > COMMENT_MAX_LENGTH:
+        # 只有测试输出的长度没有限制，超出时改为提示前往 Actions 查看
+        context["errors"] = [
+            {**error, "ctx": {"output": OUTPUT_OMITTED}}
+            if error["type"] == "plugin_test"
+            else error
+            for error in result.errors
+        ]
+        comment = template.render(context)
+    if len(comment) > COMMENT_MAX_LENGTH:
+        # 其他内容仍然过长时直接截断，保留评论标记与检查状态
+        index = comment.rfind(NONEFLOW_MARKER)
+        tail = comment[index:] if index != -1 else ""
+        limit = COMMENT_MAX_LENGTH - len(COMMENT_TRUNCATED) - len(tail)
+        comment = comment[: max(limit, 0)] + COMMENT_TRUNCATED + tail
+    return comment
+
+
+async def render_comment(
+    result: "ValidationResult",
+    test_result: PluginTestResult,
+    reuse: bool = False,
+    key: str = "",
+) -> str:
+    """将验证结果转换为评论内容
+
+    与 render_comment_sync 相同，方便在异步代码中调用
+    """
+    return render_comment_sync(result, test_result, reuse, key)
@@ -0,0 +1,78 @@
+"""运行状态存储
+
+使用 SQLite 保存，只要持久化缓存所在的目录，就可以在多次运行间累计
+"""
+
+import sqlite3
+from pathlib import Path
+
+SCHEMA_VERSION = 1
+"""表结构版本，与文件中的版本不同时会重建"""
+
+
+class StateStore:
+    """运行状态存储"""
+
+    def __init__(self, path: Path | str = ":memory:") -> None:
+        if isinstance(path, Path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(path)
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS metrics")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS metrics (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    def incr(self, name: str, value: int = 1) -> int:
+        """增加计数，返回增加后的值"""
+        self._conn.execute(
+            """INSERT INTO metrics VALUES (?, ?)
+            ON CONFLICT (name) DO UPDATE SET value = value + excluded.value""",
+            (name, value),
+        )
+        self._conn.commit()
+        return self.get_metric(name)
+
+    def get_metric(self, name: str) -> int:
+        """获取计数"""
+        row = self._conn.execute(
+            "SELECT value FROM metrics WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def clear(self) -> None:
+        """清空所有状态"""
+        self._conn.execute("DELETE FROM metrics")
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_state_store: StateStore | None = None
+
+
+def get_state_store() -> StateStore:
+    """获取运行状态存储
+
+    未设置时使用内存存储，只在当前进程内有效
+    """
+    global _state_store
+    if _state_store is None:
+        _state_store = StateStore()
+    return _state_store
+
+
+def set_state_store(store: StateStore) -> None:
+    """设置运行状态存储"""
+    global _state_store
+    if _state_store is not None:
+        _state_store.close()
+    _state_store = store
@@ -1,37 +1,46 @@
+import asyncio
+import hashlib
 import json
 import re
 import subprocess
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any
 
 from githubkit.exception import RequestFailed
 from githubkit.typing import Missing
-from nonebot import logger
+from nonebot import get_driver, logger
 from nonebot.adapters.github import Bot
 
-from src.utils.validation import PublishType, ValidationDict, validate_info
+from src.utils.plugin_test import extract_code_block, parse_issue_sections
+from src.utils.validation import PublishType, ValidationResult, validate_info
 
 from .config import plugin_config
 from .constants import (
+    BOT_MARKER,
     BRANCH_NAME_PREFIX,
     COMMIT_MESSAGE_PREFIX,
-    ISSUE_FIELD_PATTERN,
     ISSUE_FIELD_TEMPLATE,
+    LOG_MAX_LENGTH,
     NONEFLOW_MARKER,
-    PLUGIN_GITHUB_URL_PATTERN,
-    PLUGIN_IS_DIR_PATTERN,
-    PLUGIN_MODULE_NAME_PATTERN,
-    PLUGIN_MODULE_PATH_PATTERN,
-    PLUGIN_NAME_PATTERN,
+    PLUGIN_CONFIG_STRING,
+    PLUGIN_GITHUB_URL_STRING,
+    PLUGIN_IS_DIR_STRING,
+    PLUGIN_MODULE_NAME_STRING,
+    PLUGIN_MODULE_PATH_STRING,
+    PLUGIN_NAME_STRING,
     PLUGIN_STRING_LIST,
+    RECHECK_CONCURRENCY,
     SKIP_PLUGIN_TEST_COMMENT,
+    TITLE_MAX_LENGTH,
     UPDATE_MESSAGE_PREFIX,
 )
-from .models import RepoInfo
-from .render import render_comment
+from .models import PluginTestResult, RepoInfo
+from .render import load_state, render_comment
 
 if TYPE_CHECKING:
     from githubkit.rest import (
         Issue,
+        IssueComment,
         PullRequest,
         PullRequestPropLabelsItems,
         PullRequestSimple,
@@ -98,7 +107,7 @@ def get_type_by_commit_message(message: str) -> PublishType | None:
 
 
 def commit_and_push(
-    result: ValidationDict,
+    result: ValidationResult,
     branch_name: str,
     issue_number: int,
     old_version: str,
@@ -106,12 +115,12 @@ def commit_and_push(
 ):
     """提交并推送"""
     if old_version:
-        commit_message = f"{UPDATE_MESSAGE_PREFIX} {result['type'].value.lower()} {result['name']} to v{new_version} (#{issue_number})"
+        commit_message = f"{UPDATE_MESSAGE_PREFIX} {result.type.value.lower()} {result.name} to v{new_version} (#{issue_number})"
     else:
-        commit_message = f"{COMMIT_MESSAGE_PREFIX} {result['type'].value.lower()} {result['name']} (#{issue_number})"
+        commit_message = f"{COMMIT_MESSAGE_PREFIX} {result.type.value.lower()} {result.name} (#{issue_number})"
 
-    run_shell_command(["git", "config", "--global", "user.name", result["author"]])
-    user_email = f"{result['author']}@users.noreply.github.com"
+    run_shell_command(["git", "config", "--global", "user.name", result.author])
+    user_email = f"{result.author}@users.noreply.github.com"
     run_shell_command(["git", "config", "--global", "user.email", user_email])
     run_shell_command(["git", "add", "-A"])
     try:
@@ -147,41 +156,96 @@ def extract_name_from_title(title: str, publish_type: PublishType) -> str | None
         return match.group(1)
 
 
-def validate_info_from_issue(
+def extract_publish_info(body: str, publish_type: PublishType) -> dict[str, Any]:
+    """从议题内容中提取发布信息
+
+    插件配置项不参与验证，但会影响插件测试结果，所以也一并提取
+    """
+    sections = parse_issue_sections(body)
+
+    match publish_type:
+        case PublishType.PLUGIN:
+            return {
+                "name": sections.get(PLUGIN_NAME_STRING) or None,
+                "module": sections.get(PLUGIN_MODULE_NAME_STRING) or None,
+                "module_path": sections.get(PLUGIN_MODULE_PATH_STRING) or None,
+                "github_url": sections.get(PLUGIN_GITHUB_URL_STRING) or None,
+                "is_dir": sections.get(PLUGIN_IS_DIR_STRING) == "是",
+                "config": extract_code_block(sections.get(PLUGIN_CONFIG_STRING, "")),
+            }
+
+
+def get_changed_fields(
+    old_body: str, new_body: str, publish_type: PublishType
+) -> set[str]:
+    """比较议题修改前后的发布信息，返回发生变化的字段"""
+    old_info = extract_publish_info(old_body, publish_type)
+    new_info = extract_publish_info(new_body, publish_type)
+    return {key for key, value in new_info.items() if old_info.get(key) != value}
+
+
+def get_plugin_test_result() -> PluginTestResult:
+    """获取本次运行的插件测试结果"""
+    action_url = None
+    # https://github.com/he0119/action-test/actions/runs/4469672520
+    # 仓库成员要求跳过时测试视为已跳过，预检也会确认这种情况
+    skip = plugin_config.skip_plugin_test or plugin_config.plugin_test_skipped
+    if plugin_config.plugin_test_result or skip:
+        action_url = f"https://github.com/{plugin_config.github_repository}/actions/runs/{plugin_config.github_run_id}"
+    return PluginTestResult(
+        skip=skip,
+        result=plugin_config.plugin_test_result,
+        output=plugin_config.plugin_test_output,
+        # 插件因为环境问题没能加载时，使用静态提取的元数据
+        metadata=plugin_config.plugin_test_metadata
+        or plugin_config.plugin_test_static_metadata,
+        action_url=action_url,
+    )
+
+
+def load_plugin_index() -> dict[str, dict[str, Any]]:
+    """读取仓库中的插件列表"""
+    with plugin_config.input_config.plugin_path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+async def validate_info_from_issue(
     issue: "Issue",
     publish_type: PublishType,
-) -> ValidationDict:
-    """从议题中提取发布所需数据"""
+    test_result: PluginTestResult,
+    changed_fields: set[str] | None = None,
+    index: dict[str, dict[str, Any]] | None = None,
+) -> ValidationResult:
+    """从议题中提取发布所需数据
+
+    changed_fields 为议题修改时变化的字段，为 None 时表示需要完整检查
+    index 为已经读取的插件列表，为 None 时从文件中读取
+    """
     body = issue.body if issue.body else ""
 
     match publish_type:
         case PublishType.PLUGIN:
             author = issue.user.login if issue.user else None
-            with plugin_config.input_config.plugin_path.open(
-                "r", encoding="utf-8"
-            ) as f:
-                data: list[dict[str, str]] = json.load(f)
-            plugin_name = PLUGIN_NAME_PATTERN.search(body)
-            module_name = PLUGIN_MODULE_NAME_PATTERN.search(body)
-            module_path = PLUGIN_MODULE_PATH_PATTERN.search(body)
-            github_url = PLUGIN_GITHUB_URL_PATTERN.search(body)
-            is_dir = PLUGIN_IS_DIR_PATTERN.search(body)
-            raw_data = {
-                "name": plugin_name.group(1).strip() if plugin_name else None,
-                "module": (module_name.group(1).strip() if module_name else None),
-                "module_path": (module_path.group(1).strip() if module_path else None),
-                "github_url": (github_url.group(1).strip() if github_url else None),
-                "is_dir": is_dir.group(1).strip() == "是" if is_dir else False,
-                "author": author,
-                "skip_plugin_test": plugin_config.skip_plugin_test,
-                "plugin_test_result": plugin_config.plugin_test_result,
-                "plugin_test_output": plugin_config.plugin_test_output,
-                "plugin_test_metadata": plugin_config.plugin_test_metadata,
-                "previous_data": data,
-            }
-            if plugin_config.plugin_test_metadata:
-                raw_data.update(plugin_config.plugin_test_metadata)
-    return validate_info(publish_type, raw_data)
+            if index is None:
+                index = load_plugin_index()
+            raw_data = extract_publish_info(body, publish_type)
+            raw_data.pop("config")
+            # 只需要同名插件之前发布的数据，不需要保留整个插件列表
+            name = raw_data["name"]
+            previous_data = {name: index[name]} if name in index else {}
+            raw_data.update(
+                {
+                    "author": author,
+                    "skip_plugin_test": test_result.skip,
+                    "plugin_test_result": test_result.result,
+                    "plugin_test_output": test_result.output,
+                    "plugin_test_metadata": test_result.metadata,
+                    "previous_data": previous_data,
+                }
+            )
+            if test_result.metadata:
+                raw_data.update(test_result.metadata)
+    return await validate_info(publish_type, raw_data, changed_fields)
 
 
 async def resolve_conflict_pull_requests(
@@ -230,10 +294,34 @@ async def resolve_conflict_pull_requests(
             logger.info("拉取请求更新完毕")
 
 
+def is_debug_enabled() -> bool:
+    """是否输出调试日志"""
+    log_level = get_driver().config.log_level
+    levelno = logger.level(log_level).no if isinstance(log_level, str) else log_level
+    return levelno <= logger.level("DEBUG").no
+
+
+def shorten(text: str, max_length: int = LOG_MAX_LENGTH) -> str:
+    """截断过长的日志内容"""
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}...（共 {len(text)} 个字符）"
+
+
+def log_validation_result(result: ValidationResult) -> None:
+    """输出验证结果
+
+    默认只输出截断后的结果，完整结果仅在调试日志中输出
+    """
+    logger.info(f"验证结果: {shorten(repr(result))}")
+    if is_debug_enabled():
+        logger.opt(lazy=True).debug("完整验证结果: {}", lambda: repr(result))
+
+
 def generate_validation_dict_from_file(
     publish_type: PublishType,
     name: str | None = None,
-) -> ValidationDict:
+) -> ValidationResult:
     """从文件中获取发布所需数据"""
     match publish_type:
         case PublishType.PLUGIN:
@@ -241,12 +329,14 @@ def generate_validation_dict_from_file(
                 "r", encoding="utf-8"
             ) as f:
                 data: dict[str, dict[str, str]] = json.load(f)
-            logger.info(f"插件数据: {data}")
+            if is_debug_enabled():
+                logger.opt(lazy=True).debug("插件数据: {}", lambda: repr(data))
             raw_data = next(iter(data.values()))
+            logger.info(f"插件数据: {shorten(repr(raw_data))}")
             assert name, "插件名称不能为空"
             raw_data["name"] = name
 
-    return ValidationDict(
+    return ValidationResult(
         valid=True,
         type=publish_type,
         name=raw_data["name"],
@@ -256,14 +346,14 @@ def generate_validation_dict_from_file(
     )
 
 
-def update_file(result: ValidationDict) -> tuple[str, str]:
+def update_file(result: ValidationResult) -> tuple[str, str]:
     """更新文件"""
-    new_data = result["data"]
+    new_data = result.data
     old_version, new_version = (
         "",
         new_data["version"],
     )
-    match result["type"]:
+    match result.type:
         case PublishType.PLUGIN:
             path = plugin_config.input_config.plugin_path
             # 仓库内只需要这部分数据
@@ -295,20 +385,24 @@ def update_file(result: ValidationDict) -> tuple[str, str]:
     return old_version, new_version
 
 
-async def should_skip_plugin_test(
-    bot: Bot,
-    repo_info: RepoInfo,
-    issue_number: int,
-) -> bool:
-    """判断是否跳过插件测试"""
-    comments = (
+async def list_comments(
+    bot: Bot, repo_info: RepoInfo, issue_number: int
+) -> list["IssueComment"]:
+    """获取议题下的所有评论"""
+    return (
         await bot.rest.issues.async_list_comments(
             **repo_info.model_dump(), issue_number=issue_number
         )
     ).parsed_data
+
+
+def should_skip_plugin_test(comments: list["IssueComment"]) -> bool:
+    """判断是否跳过插件测试"""
     for comment in comments:
         author_association = comment.author_association
-        if comment.body == SKIP_PLUGIN_TEST_COMMENT and author_association in [
+        # 与预检相同，忽略评论首尾的空白
+        body = (comment.body or "").strip()
+        if body == SKIP_PLUGIN_TEST_COMMENT and author_association in [
             "OWNER",
             "MEMBER",
         ]:
@@ -316,10 +410,97 @@ async def should_skip_plugin_test(
     return False
 
 
+def is_bot_comment(bot: Bot, comment: "IssueComment") -> bool:
+    """评论是否由当前应用的机器人账号发布
+
+    任何人都能发布带有标记的评论，只有机器人自己的评论才可信
+    """
+    app = comment.performed_via_github_app
+    if not app or str(app.id) != str(bot.app.app_id):
+        return False
+    user = comment.user
+    return bool(user and user.type == "Bot" and user.login == f"{app.slug}{BOT_MARKER}")
+
+
+def find_bot_comment(bot: Bot, comments: list["IssueComment"]) -> "IssueComment | None":
+    """找到机器人发布的检查结果评论"""
+    return next(
+        (
+            c
+            for c in comments
+            if NONEFLOW_MARKER in (c.body or "") and is_bot_comment(bot, c)
+        ),
+        None,
+    )
+
+
+def get_index_blob_id() -> str:
+    """获取插件列表文件的 git blob id
+
+    与 git hash-object 的结果相同，不需要调用 git
+    """
+    data = plugin_config.input_config.plugin_path.read_bytes()
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def is_import_slow(test_result: PluginTestResult) -> bool:
+    """插件导入耗时是否超过提示阈值"""
+    import_time = (test_result.metadata or {}).get("import_time")
+    return bool(
+        import_time
+        and import_time["total"] > plugin_config.plugin_test_import_time_warning
+    )
+
+
+def keep_import_time(test_result: PluginTestResult, body: str) -> PluginTestResult:
+    """沿用评论中保存的导入耗时
+
+    是否超过提示阈值不变时，导入耗时的波动不需要修改评论
+    """
+    state = load_state(body)
+    if state is None:
+        return test_result
+    old_import_time = (state.test_result.metadata or {}).get("import_time")
+    metadata = test_result.metadata
+    if (
+        not old_import_time
+        or not metadata
+        or "import_time" not in metadata
+        or is_import_slow(state.test_result) != is_import_slow(test_result)
+    ):
+        return test_result
+    return test_result.model_copy(
+        update={"metadata": {**metadata, "import_time": old_import_time}}
+    )
+
+
+def get_check_key(
+    issue: "Issue", publish_type: PublishType, test_result: PluginTestResult
+) -> str:
+    """计算检查所用数据的哈希值
+
+    包括议题中的发布信息、作者、插件测试结果、是否跳过测试与插件列表的 blob id
+    测试输出与 Actions 地址每次运行都不同，不参与计算
+    导入耗时每次测试都有波动，只记录是否超过提示阈值
+    """
+    test_data = test_result.model_dump(exclude={"output", "action_url"})
+    if test_data["metadata"] and "import_time" in test_data["metadata"]:
+        test_data["metadata"]["import_time"] = is_import_slow(test_result)
+    content = {
+        "info": extract_publish_info(issue.body or "", publish_type),
+        "author": issue.user.login if issue.user else None,
+        "test_result": test_data,
+        "index": get_index_blob_id(),
+    }
+    return hashlib.sha256(
+        json.dumps(content, ensure_ascii=False, sort_keys=True).encode()
+    ).hexdigest()
+
+
 async def create_pull_request(
     bot: Bot,
     repo_info: RepoInfo,
-    result: ValidationDict,
+    result: ValidationResult,
     branch_name: str,
     issue_number: int,
     title: str,
@@ -346,7 +527,7 @@ async def create_pull_request(
         await bot.rest.issues.async_add_labels(
             **repo_info.model_dump(),
             issue_number=pull.number,
-            labels=[result["type"].value],
+            labels=[result.type.value],
         )
         logger.info("拉取请求创建完毕")
     except RequestFailed:
@@ -374,30 +555,100 @@ async def create_pull_request(
             logger.info("拉取请求已标记为可评审")
 
 
-async def comment_issue(
-    bot: Bot, repo_info: RepoInfo, issue_number: int, result: ValidationDict
-):
-    """在议题中发布评论"""
-    logger.info("开始发布评论")
+async def process_publish_check(
+    bot: Bot,
+    repo_info: RepoInfo,
+    issue: "Issue",
+    publish_type: PublishType,
+    result: ValidationResult,
+    test_result: PluginTestResult,
+    key: str = "",
+    bot_comment: "IssueComment | None" = None,
+) -> None:
+    """根据验证结果更新拉取请求、议题标题与评论"""
+    issue_number = issue.number
+
+    # 设置拉取请求与议题的标题
+    # 限制标题长度，过长的标题不好看
+    title = f"{publish_type.value}: {result.name[:TITLE_MAX_LENGTH]}"
+
+    # 分支命名示例 publish/issue123
+    branch_name = f"{BRANCH_NAME_PREFIX}{issue_number}"
+    if result.valid:
+        # 创建新分支
+        run_shell_command(["git", "switch", "-C", branch_name])
+        # 更新文件并提交更改
+        old_version, new_version = update_file(result)
+        commit_and_push(
+            result,
+            branch_name,
+            issue_number,
+            old_version,
+            new_version,
+        )
+        if old_version:
+            title += f" (v{old_version} -> v{new_version})"
+        # 创建拉取请求
+        await create_pull_request(
+            bot, repo_info, result, branch_name, issue_number, title
+        )
+    else:
+        # 如果之前已经创建了拉取请求，则将其转换为草稿
+        pulls = (
+            await bot.rest.pulls.async_list(
+                **repo_info.model_dump(), head=f"{repo_info.owner}:{branch_name}"
+            )
+        ).parsed_data
+        if pulls and (pull := pulls[0]) and not pull.draft:
+            await bot.async_graphql(
+                query="""mutation convertPullRequestToDraft($pullRequestId: ID!) {
+                        convertPullRequestToDraft(input: {pullRequestId: $pullRequestId}) {
+                            clientMutationId
+                        }
+                    }""",
+                variables={"pullRequestId": pull.node_id},
+            )
+            logger.info("发布没通过检查，已将之前的拉取请求转换为草稿")
+        else:
+            logger.info("发布没通过检查，暂不创建拉取请求")
 
-    # 重复利用评论
-    # 如果发现之前评论过，直接修改之前的评论
-    comments = (
-        await bot.rest.issues.async_list_comments(
-            **repo_info.model_dump(), issue_number=issue_number
+    # 修改议题标题
+    # 需要等创建完拉取请求并打上标签后执行
+    # 不然会因为修改议题触发 Actions 导致标签没有正常打上
+    if issue.title != title:
+        await bot.rest.issues.async_update(
+            **repo_info.model_dump(), issue_number=issue_number, title=title
         )
-    ).parsed_data
-    reusable_comment = next(
-        filter(lambda x: NONEFLOW_MARKER in (x.body if x.body else ""), comments),
-        None,
+        logger.info(f"议题标题已修改为 {title}")
+
+    await comment_issue(
+        bot, repo_info, issue_number, result, test_result, key, bot_comment
     )
 
-    comment = await render_comment(result, bool(reusable_comment))
-    if reusable_comment:
-        logger.info(f"发现已有评论 {reusable_comment.id}，正在修改")
-        if reusable_comment.body != comment:
+
+async def comment_issue(
+    bot: Bot,
+    repo_info: RepoInfo,
+    issue_number: int,
+    result: ValidationResult,
+    test_result: PluginTestResult,
+    key: str = "",
+    bot_comment: "IssueComment | None" = None,
+):
+    """在议题中发布评论
+
+    bot_comment 为之前获取的机器人评论，存在时直接修改，不需要重新获取所有评论
+    """
+    logger.info("开始发布评论")
+
+    if bot_comment:
+        test_result = keep_import_time(test_result, bot_comment.body or "")
+    comment = await render_comment(result, test_result, bool(bot_comment), key)
+    if bot_comment:
+        logger.info(f"发现已有评论 {bot_comment.id}，正在修改")
+        if bot_comment.body != comment:
             await bot.rest.issues.async_update_comment(
-                **repo_info.model_dump(), comment_id=reusable_comment.id, body=comment
+                **repo_info.model_dump(), comment_id=bot_comment.id, body=comment
             )
             logger.info("评论修改完成")
         else:
@@ -411,20 +662,123 @@ async def comment_issue(
 
 async def ensure_issue_content(
     bot: Bot, repo_info: RepoInfo, issue_number: int, issue_body: str
-):
-    """确保议题内容中包含所需的插件信息"""
-    new_content = []
+) -> str:
+    """确保议题内容中包含所需的插件信息
 
-    for name in PLUGIN_STRING_LIST:
-        pattern = re.compile(ISSUE_FIELD_PATTERN.format(name))
-        if not pattern.search(issue_body):
-            new_content.append(ISSUE_FIELD_TEMPLATE.format(name))
+    返回修改后的议题内容，方便直接用于本次检查
+    """
+    sections = parse_issue_sections(issue_body)
+    new_content = [
+        ISSUE_FIELD_TEMPLATE.format(name)
+        for name in PLUGIN_STRING_LIST
+        if name not in sections
+    ]
 
     if new_content:
         new_content.append(issue_body)
+        issue_body = "\n\n".join(new_content)
         await bot.rest.issues.async_update(
             **repo_info.model_dump(),
             issue_number=issue_number,
-            body="\n\n".join(new_content),
+            body=issue_body,
         )
         logger.info("检测到议题内容缺失，已更新")
+    return issue_body
+
+
+def is_inserted_headers_only(old_body: str, new_body: str) -> bool:
+    """议题内容的修改是否只是插入了缺失的标题
+
+    即 ensure_issue_content 所做的修改
+    """
+    if old_body == new_body or not new_body.endswith(old_body):
+        return False
+    *headers, rest = new_body.removesuffix(old_body).split("\n\n")
+    valid_headers = {ISSUE_FIELD_TEMPLATE.format(name) for name in PLUGIN_STRING_LIST}
+    return not rest and bool(headers) and all(h in valid_headers for h in headers)
+
+
+async def list_open_issues(
+    bot: Bot, repo_info: RepoInfo, publish_type: PublishType
+) -> list["Issue"]:
+    """获取所有开启的发布议题"""
+    issues: list["Issue"] = []
+    page = 1
+    while True:
+        resp = await bot.rest.issues.async_list_for_repo(
+            **repo_info.model_dump(),
+            state="open",
+            labels=publish_type.value,
+            per_page=100,
+            page=page,
+        )
+        # 拉取请求也会出现在议题列表中
+        issues.extend(issue for issue in resp.parsed_data if not issue.pull_request)
+        if len(resp.parsed_data) < 100:
+            return issues
+        page += 1
+
+
+async def recheck_publish_issues(
+    bot: Bot,
+    repo_info: RepoInfo,
+    publish_type: PublishType,
+    concurrency: int = RECHECK_CONCURRENCY,
+) -> None:
+    """重新检查所有开启的发布议题
+
+    插件测试结果从之前的评论中读取，不会重新测试
+    只有评论内容会发生变化的议题才会更新，git 操作需要逐个执行
+    """
+    start = time.perf_counter()
+    issues = await list_open_issues(bot, repo_info, publish_type)
+    index = load_plugin_index()
+    semaphore = asyncio.Semaphore(concurrency)
+    git_lock = asyncio.Lock()
+
+    async def _recheck(issue: "Issue") -> bool:
+        async with semaphore:
+            comment = find_bot_comment(
+                bot, await list_comments(bot, repo_info, issue.number)
+            )
+            state = load_state(comment.body or "") if comment else None
+            if state is None or not (
+                state.test_result.result or state.test_result.skip
+            ):
+                # 没有可信的测试结果时不能沿用，需要等待议题触发插件测试
+                logger.info(f"议题 #{issue.number} 没有通过的插件测试结果，已跳过")
+                return False
+
+            test_result = state.test_result
+            result = await validate_info_from_issue(
+                issue, publish_type, test_result, index=index
+            )
+            comment_body = await render_comment(result, test_result, True, state.key)
+            if comment_body == comment.body:  # type: ignore
+                logger.info(f"议题 #{issue.number} 检查结果无变化，已跳过")
+                return False
+
+        async with git_lock:
+            logger.info(f"议题 #{issue.number} 检查结果发生变化，正在更新")
+            log_validation_result(result)
+            await process_publish_check(
+                bot,
+                repo_info,
+                issue,
+                publish_type,
+                result,
+                test_result,
+                state.key,
+                comment,
+            )
+            # 回到主分支，下一个议题的分支需要基于主分支创建
+            run_shell_command(["git", "checkout", plugin_config.input_config.base])
+        return True
+
+    updated = await asyncio.gather(*(_recheck(issue) for issue in issues))
+
+    elapsed = time.perf_counter() - start
+    logger.info(
+        f"共检查 {len(issues)} 个议题，更新 {sum(updated)} 个，"
+        f"耗时 {elapsed:.1f} 秒（每分钟 {len(issues) / elapsed * 60:.1f} 个）"
+    )
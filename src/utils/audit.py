@@ -0,0 +1,194 @@
+"""插件列表审计
+
+重新验证 plugins.json 中已经发布的所有插件，找出无法访问的仓库、不符合规范的插件类型与过长的名称等问题。
+
+使用与发布检查相同的验证规则。网址检查并发执行，结果保存在缓存文件中，多次运行间可以复用；
+数据验证按批次在子进程中执行。最终输出 JSON 格式的报告与 Markdown 格式的摘要。
+
+用法：python -m src.utils.audit plugins.json --report report.json --summary summary.md
+"""
+
+# ruff: noqa: T201
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from src.utils.validation import (
+    PublishType,
+    ValidationResult,
+    get_url_fields,
+    validate_many,
+)
+from src.utils.validation.cache import URLCache
+from src.utils.validation.constants import URL_CACHE_FILENAME, URL_CHECK_CONCURRENCY
+from src.utils.validation.models import URLCheckResult
+from src.utils.validation.utils import check_urls, close_client, set_github_token
+
+AUDIT_CHUNK_SIZE = 500
+"""每个子进程一次验证的插件数量"""
+
+
+def iter_index(path: Path) -> Iterator[dict[str, Any]]:
+    """逐个读取插件列表中的插件，转换为验证所需的数据"""
+    with path.open("r", encoding="utf-8") as f:
+        data: dict[str, dict[str, Any]] = json.load(f)
+    for name, info in data.items():
+        yield {**info, "name": name, "skip_plugin_test": True}
+
+
+def iter_chunks(
+    items: list[dict[str, Any]], size: int
+) -> Iterator[list[dict[str, Any]]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def validate_chunk(
+    raw_data_list: list[dict[str, Any]],
+    url_results: dict[str, URLCheckResult],
+) -> list[ValidationResult]:
+    """在子进程中验证一批插件"""
+    return validate_many(PublishType.PLUGIN, raw_data_list, url_results)
+
+
+def error_to_dict(error: dict[str, Any]) -> dict[str, Any]:
+    """只保留报告需要的错误信息"""
+    return {
+        "loc": [str(item) for item in error["loc"]],
+        "type": error["type"],
+        "msg": error["msg"],
+    }
+
+
+async def audit(
+    path: Path,
+    cache: URLCache,
+    concurrency: int = URL_CHECK_CONCURRENCY,
+    workers: int | None = None,
+    chunk_size: int = AUDIT_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """审计插件列表，返回审计报告"""
+    start = time.perf_counter()
+    raw_data_list = list(iter_index(path))
+
+    # 所有网址只检查一次，未过期的结果直接使用缓存
+    url_results = await check_urls(
+        (
+            raw_data[key]
+            for raw_data in raw_data_list
+            for key in get_url_fields(raw_data)
+        ),
+        concurrency=concurrency,
+        cache=cache,
+    )
+    url_elapsed = time.perf_counter() - start
+
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(workers) as executor:
+        futures = []
+        for chunk in iter_chunks(raw_data_list, chunk_size):
+            # 只传递当前批次需要的网址检查结果
+            chunk_url_results = {
+                raw_data[key]: url_results[raw_data[key]]
+                for raw_data in chunk
+                for key in get_url_fields(raw_data)
+            }
+            futures.append(
+                loop.run_in_executor(executor, validate_chunk, chunk, chunk_url_results)
+            )
+        chunks = await asyncio.gather(*futures)
+
+    plugins = [
+        {
+            "name": result.name,
+            "valid": result.valid,
+            "errors": [error_to_dict(error) for error in result.errors],  # type: ignore
+        }
+        for results in chunks
+        for result in results
+    ]
+    invalid = [plugin for plugin in plugins if not plugin["valid"]]
+    return {
+        "total": len(plugins),
+        "invalid": len(invalid),
+        "url_checked": len(url_results),
+        "url_elapsed": round(url_elapsed, 3),
+        "elapsed": round(time.perf_counter() - start, 3),
+        "plugins": invalid,
+    }
+
+
+def render_summary(report: dict[str, Any]) -> str:
+    """将审计报告转换为 Markdown 摘要"""
+    lines = [
+        "# 📃 插件列表审计结果",
+        "",
+        f"共 {report['total']} 个插件，其中 {report['invalid']} 个未通过检查。",
+        f"检查了 {report['url_checked']} 个网址，"
+        f"总耗时 {report['elapsed']:.1f} 秒（网址检查 {report['url_elapsed']:.1f} 秒）。",
+    ]
+    if report["plugins"]:
+        lines += ["", "| 插件 | 问题 |", "| --- | --- |"]
+        for plugin in report["plugins"]:
+            errors = "<br>".join(
+                f"{' > '.join(error['loc'])}: {error['msg']}"
+                for error in plugin["errors"]
+            )
+            # 表格中的竖线需要转义
+            name = plugin["name"].replace("|", "\\|")
+            errors = errors.replace("|", "\\|")
+            lines.append(f"| {name} | {errors} |")
+    return "\n".join(lines) + "\n"
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="审计插件列表")
+    parser.add_argument("path", type=Path, help="plugins.json 的路径")
+    parser.add_argument("--report", type=Path, help="JSON 报告的保存路径")
+    parser.add_argument(
+        "--summary",
+        type=Path,
+        default=os.environ.get("GITHUB_STEP_SUMMARY") or None,
+        help="Markdown 摘要的保存路径，默认为 GITHUB_STEP_SUMMARY",
+    )
+    parser.add_argument(
+        "--cache-dir", type=Path, help="网址检查结果缓存目录，默认不保存至文件"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=URL_CHECK_CONCURRENCY,
+        help="同时检查网址的最大数量",
+    )
+    parser.add_argument("--workers", type=int, help="验证数据的进程数量")
+    args = parser.parse_args()
+
+    set_github_token(os.environ.get("GITHUB_TOKEN"))
+    cache = (
+        URLCache(args.cache_dir / URL_CACHE_FILENAME) if args.cache_dir else URLCache()
+    )
+    try:
+        report = await audit(args.path, cache, args.concurrency, args.workers)
+    finally:
+        cache.close()
+        await close_client()
+
+    if args.report:
+        with args.report.open("w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    summary = render_summary(report)
+    if args.summary:
+        with args.summary.open("a", encoding="utf-8") as f:
+            f.write(summary)
+    print(summary)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
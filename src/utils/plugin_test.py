@@ -4,32 +4,173 @@
 
 在 GitHub Actions 中运行，通过 GitHub Event 文件获取所需信息。并将测试结果保存至 GitHub Action 的输出文件中。
 
-当前会输出 RESULT, OUTPUT, METADATA 三个数据，分别对应测试结果、测试输出、插件元数据。
+测试分为环境准备、启动、仓库下载、插件安装与插件加载几个阶段，每个阶段单独计时与限制时间。
+超时时结束整个进程组，不会留下仍在运行的 poetry、pip 或插件进程。
+
+测试输出会逐行读取，实时写入日志文件与作业摘要，测试超时时也会保留已有的输出。
+
+插件导入时会记录导入耗时，按顶层包汇总后保存在 METADATA 的 import_time 中。
+
+当前会输出 RESULT, OUTPUT, METADATA, LOG_PATH, TIMINGS, PEAK_RSS 六个数据，分别对应测试结果、测试输出摘要、插件元数据、完整测试输出的文件路径、各阶段耗时、测试脚本的峰值内存（KB）。
+测试前会静态提取插件元数据，提取成功时额外输出 STATIC_METADATA。
+
+启用缓存后，仓库最新提交、插件信息、插件配置、基础环境与运行模式都没有变化时直接使用缓存的测试结果，只有通过的结果会被缓存。
+评论 /retest 或者设置 PLUGIN_TEST_FORCE=true 可以强制重新测试。
+
+使用 --preflight 参数时只进行预检：检查议题信息是否完整、仓库能否访问、插件是否已经以相同的数据发布，
+以及仓库成员是否要求跳过测试。输出 SHOULD_TEST 与 SAVED_MINUTES，工作流可以据此跳过插件测试。
+跳过测试时还会输出静态提取的 STATIC_METADATA，只有仓库成员要求跳过时才输出 SKIPPED=True，传给机器人后测试会被视为已跳过。
+其他原因跳过测试时输出 OUTPUT 说明原因，机器人会将测试视为未通过。
+完整的测试输出可以通过 LOG_PATH 上传为 Artifact。
+
+设置 PLUGIN_TEST_CACHE_DIR 后会缓存测试所用的虚拟环境，依赖相同的插件可以直接复用，不需要重新安装。
+没有缓存时，插件依赖会安装在基础环境快照之上的叠加环境中，快照只包含真寻的依赖，可以被所有测试复用。
+设置 PLUGIN_TEST_RUNNER=minimal 后不加载真寻的内置插件，直接克隆仓库安装插件，测试更快，占用内存更少。
+
+使用 --batch plugins.json 参数时批量测试插件列表中的所有插件，例如真寻更新后检查所有插件的兼容性。
+每个插件在单独的目录与叠加环境中测试，同时运行的测试数量默认为 CPU 核心数，并限制每个测试的内存与 CPU 时间。
+最终输出 JSON 格式的报告（--report）与 Markdown 格式的摘要。
 
 经测试可以直接在 Python 3.10+ 环境下运行，无需额外依赖。
 """
 
 # ruff: noqa: T201, ASYNC101
 
+import argparse
+import ast
 import asyncio
+import hashlib
+import html
 import json
+import logging
 import os
 import re
-from asyncio import create_subprocess_shell, run, subprocess
+import shutil
+import signal
+import sys
+import tempfile
+import threading
+import time
+from asyncio import (
+    FIRST_COMPLETED,
+    StreamReader,
+    create_subprocess_shell,
+    run,
+    subprocess,
+)
+from collections import deque
+from collections.abc import Callable
 from pathlib import Path
-from urllib.request import urlopen
+from subprocess import CalledProcessError, check_call
+from typing import TextIO
+from urllib.error import URLError
+from urllib.request import Request, urlopen
+
+# 作为机器人的一部分导入时，日志会转发到机器人的日志中
+logger = logging.getLogger("plugin_test")
 
 # Plugin Store
 STORE_PLUGINS_URL = "https://raw.githubusercontent.com/zhenxun-org/zhenxun_bot_plugins_index/index/plugins.json"
-# 匹配信息的正则表达式
-ISSUE_PATTERN = r"### {}\s+([^\s#].*?)(?=(?:\s+###|$))"
+# 议题中的标题
+# 格式：### {标题}\n\n{内容}
+ISSUE_HEADING_PREFIX = "### "
+CODE_FENCE = "```"
+# GitHub 议题内容的最大长度，超出的部分不会解析
+ISSUE_BODY_MAX_LENGTH = 65536
+# 解析议题内容的耗时预算（秒），超出时输出内容的大小与形状，方便排查
+ISSUE_PARSE_BUDGET = 0.05
+# 测试输出摘要的最大长度，评论的最大长度为 65536
+OUTPUT_MAX_LENGTH = 30000
+# 测试输出摘要保留的开头与结尾行数
+OUTPUT_HEAD_LINES = 40
+OUTPUT_TAIL_LINES = 120
+# 完整测试输出的文件名
+OUTPUT_LOG_FILENAME = "plugin_test_output.log"
+# 插件测试各阶段的超时时间（秒），可以通过 PLUGIN_TEST_TIMEOUT_<阶段> 环境变量设置
+# 完整模式中插件商店同时下载仓库与安装依赖，计入依赖安装阶段
+PHASE_TIMEOUT_ENV_PREFIX = "PLUGIN_TEST_TIMEOUT_"
+PHASE_TIMEOUTS = {
+    "setup": 600,
+    "startup": 180,
+    "download": 120,
+    "install": 600,
+    "load": 180,
+}
+# 超时后先发送 SIGTERM，等待一段时间（秒）后仍未退出时发送 SIGKILL
+KILL_GRACE_PERIOD = 5
+# 内存中最多保留的测试输出行数，其中开头保留五分之一，完整输出保存在文件中
+OUTPUT_BUFFER_LINES = 5000
+# 读取测试脚本输出时每次读取的字节数
+OUTPUT_READ_SIZE = 64 * 1024
+# 虚拟环境缓存目录，未设置时不使用缓存
+VENV_CACHE_DIR_ENV = "PLUGIN_TEST_CACHE_DIR"
+# 虚拟环境缓存的最大大小（字节），超出时删除最久未使用的环境
+VENV_CACHE_SIZE_ENV = "PLUGIN_TEST_CACHE_SIZE"
+VENV_CACHE_MAX_SIZE = 5 * 1024**3
+# 真寻的依赖锁定文件与虚拟环境目录
+BASE_LOCK_FILENAME = "poetry.lock"
+VENV_DIRNAME = ".venv"
+# 测试所用的叠加环境或缓存环境目录，位于真寻虚拟环境旁边
+OVERLAY_VENV_DIRNAME = f"{VENV_DIRNAME}.overlay"
+# 叠加环境中指向基础环境的 .pth 文件
+BASE_PTH_FILENAME = "zhenxun_base.pth"
+# 插件依赖文件，按顺序查找
+REQUIREMENTS_FILENAMES = ("requirements.txt", "requirement.txt")
+# 测试脚本进入新阶段的标记
+PHASE_PREFIX = "PLUGIN_TEST_PHASE "
+# 测试脚本输出峰值内存（KB）的标记
+PEAK_RSS_PREFIX = "PLUGIN_TEST_PEAK_RSS "
+# 测试脚本输出插件元数据的标记
+METADATA_PREFIX = "PLUGIN_TEST_METADATA "
+# 测试脚本通过 -X importtime 输出导入耗时，插件导入前后会在 stderr 中输出标记
+IMPORT_TIME_PREFIX = "import time:"
+IMPORT_TIME_START = "PLUGIN_TEST_IMPORT_TIME_START"
+IMPORT_TIME_END = "PLUGIN_TEST_IMPORT_TIME_END"
+# 导入耗时中显示的最慢的包的数量
+IMPORT_TIME_TOP = 10
+# 测试脚本的运行模式，可选 full 与 minimal，默认为 full
+RUNNER_MODE_ENV = "PLUGIN_TEST_RUNNER"
+# 测试结果缓存目录，未设置时使用虚拟环境缓存目录
+RESULT_CACHE_DIR_ENV = "PLUGIN_TEST_RESULT_CACHE_DIR"
+# 忽略测试结果缓存，强制重新测试
+FORCE_TEST_ENV = "PLUGIN_TEST_FORCE"
+FORCE_TEST_COMMENT = "/retest"
+TIMING_NAMES = {
+    "static": "静态检查",
+    "setup": "环境准备",
+    "startup": "启动",
+    "download": "仓库下载",
+    "install": "插件安装",
+    "load": "插件加载",
+}
+# 静态提取的插件元数据字段，与测试脚本输出的元数据相同
+STATIC_METADATA_FIELDS = ("description", "usage", "version", "plugin_type")
+# 静态提取时支持的字符串方法
+STATIC_STR_METHODS = {"strip", "lstrip", "rstrip", "replace", "format"}
+# 跳过插件测试的评论，只有仓库成员的评论有效
+SKIP_PLUGIN_TEST_COMMENT = "/skip"
+SKIP_PLUGIN_TEST_ASSOCIATIONS = ("OWNER", "MEMBER")
+# 仓库成员要求跳过测试时的预检原因，只有这种情况下机器人会将测试视为已跳过
+SKIP_REQUESTED_REASON = "仓库成员要求跳过插件测试"
+# 预检中网络请求的超时时间（秒）
+PREFLIGHT_TIMEOUT = 5
+# 获取议题评论时每页的数量，GitHub 接口的上限
+COMMENTS_PER_PAGE = 100
+# 一次插件测试的平均耗时（分钟），用于估算预检节省的时间
+AVERAGE_TEST_MINUTES_ENV = "PLUGIN_TEST_AVERAGE_MINUTES"
+AVERAGE_TEST_MINUTES = 5.0
+# 批量测试时复制真寻目录需要忽略的文件
+BATCH_IGNORE_PATTERNS = (VENV_DIRNAME, OVERLAY_VENV_DIRNAME, ".git", "__pycache__")
+# 批量测试中单个插件的内存（MB）与 CPU 时间（秒）限制
+BATCH_MEMORY_LIMIT = 4096
+BATCH_CPU_LIMIT = 600
 # 插件信息
-PLUGIN_NAME_PATTERN = re.compile(ISSUE_PATTERN.format("插件名称"))
-PLUGIN_MODULE_NAME_PATTERN = re.compile(ISSUE_PATTERN.format("模块名称"))
-PLUGIN_MODULE_PATH_PATTERN = re.compile(ISSUE_PATTERN.format("模块路径"))
-PLUGIN_GITHUB_URL_PATTERN = re.compile(ISSUE_PATTERN.format("仓库地址"))
-IS_DIR_PATTERN = re.compile(ISSUE_PATTERN.format("是否为目录"))
-CONFIG_PATTERN = re.compile(r"### 插件配置项\s+```(?:\w+)?\s?([\s\S]*?)```")
+PLUGIN_NAME_STRING = "插件名称"
+PLUGIN_MODULE_NAME_STRING = "模块名称"
+PLUGIN_MODULE_PATH_STRING = "模块路径"
+PLUGIN_GITHUB_URL_STRING = "仓库地址"
+PLUGIN_IS_DIR_STRING = "是否为目录"
+PLUGIN_CONFIG_STRING = "插件配置项"
 
 FAKE_SCRIPT = """from typing import Optional, Union
 
@@ -108,8 +249,11 @@ class Driver(BaseDriver, ASGIMixin, HTTPClientMixin, WebSocketClientMixin):
 
 RUNNER_SCRIPT = """import json
 import os
+import sys
 import json
+import time
 import asyncio
+import resource
 from pathlib import Path
 
 from pydantic import BaseModel
@@ -124,16 +268,16 @@ class SetEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, obj)
 
 
-init()
-driver = get_driver()
-driver.register_adapter(OneBotV11Adapter)
-load_plugins("zhenxun/builtin_plugins")
-from zhenxun.builtin_plugins.plugin_store.data_source import ShopManage
+def phase(name):
+    print("{phase_prefix}" + name, flush=True)
 
-asyncio.run(
-    ShopManage.install_plugin_with_repo("{github_url}", "{module_path}", {is_dir}, True)
-)
+
+{bootstrap}
+phase("load")
+print("{import_time_start}", file=sys.stderr, flush=True)
 plugin = load_plugin(Path(__file__).parent / "zhenxun"/ "plugins" / "{module_name}")
+print("{import_time_end}", file=sys.stderr, flush=True)
+print("{peak_rss_prefix}" + str(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss), flush=True)
 
 if not plugin:
     exit(1)
@@ -151,8 +295,7 @@ else:
             "is_dir": {is_dir},
             "github_url": "{github_url}",
         }}
-        with open(os.environ["GITHUB_OUTPUT"], "a", encoding="utf8") as f:
-            f.write(f"METADATA<<EOF\\n{{json.dumps(metadata, cls=SetEncoder)}}\\nEOF\\n")
+        print("{metadata_prefix}" + json.dumps(metadata, cls=SetEncoder), flush=True)
 
         if plugin.metadata.config and not issubclass(plugin.metadata.config, BaseModel):
             logger.error("插件配置项不是 Pydantic BaseModel 的子类")
@@ -162,12 +305,824 @@ else:
 """
 
 
+# 完整模式：加载所有内置插件，通过插件商店安装插件
+FULL_BOOTSTRAP_SCRIPT = """phase("startup")
+init()
+driver = get_driver()
+driver.register_adapter(OneBotV11Adapter)
+load_plugins("zhenxun/builtin_plugins")
+from zhenxun.builtin_plugins.plugin_store.data_source import ShopManage
+
+phase("install")
+asyncio.run(
+    ShopManage.install_plugin_with_repo("{github_url}", "{module_path}", {is_dir}, True)
+)
+"""
+
+# 精简模式：不加载内置插件，直接克隆仓库并安装依赖，与插件商店的安装结果相同
+MINIMAL_BOOTSTRAP_SCRIPT = """import shutil
+import subprocess
+import sys
+import tempfile
+
+phase("startup")
+init()
+driver = get_driver()
+driver.register_adapter(OneBotV11Adapter)
+
+phase("download")
+with tempfile.TemporaryDirectory() as repo:
+    subprocess.run(["git", "clone", "--depth", "1", "{github_url}", repo], check=True)
+    source = Path(repo, *"{module_path}".split("."))
+    target = Path(__file__).parent / "zhenxun" / "plugins" / "{module_name}"
+    if {is_dir}:
+        shutil.copytree(source, target, dirs_exist_ok=True)
+        requirements_dir = source
+    else:
+        shutil.copy2(source.with_suffix(".py"), target.with_suffix(".py"))
+        requirements_dir = Path(repo)
+    phase("install")
+    for name in {requirements_filenames}:
+        if (requirements_dir / name).exists():
+            subprocess.run(
+                [sys.executable, "-m", "pip", "install", "-r", str(requirements_dir / name)],
+                check=True,
+            )
+            break
+"""
+
+BOOTSTRAP_SCRIPTS = {
+    "full": FULL_BOOTSTRAP_SCRIPT,
+    "minimal": MINIMAL_BOOTSTRAP_SCRIPT,
+}
+
+
+ANSI_ESCAPE_PATTERN = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+
 def strip_ansi(text: str | None) -> str:
     """去除 ANSI 转义字符"""
     if not text:
         return ""
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    return ANSI_ESCAPE_PATTERN.sub("", text)
+
+
+class OutputBuffer:
+    """有上限的测试输出缓存
+
+    保留开头与结尾的若干行，超出上限时省略中间的部分
+    """
+
+    def __init__(self, max_lines: int = OUTPUT_BUFFER_LINES) -> None:
+        self.head_lines = max_lines // 5
+        self.head: list[str] = []
+        self.tail: deque[str] = deque(maxlen=max_lines - self.head_lines)
+        self.dropped = 0
+
+    def append(self, line: str) -> None:
+        if len(self.head) < self.head_lines:
+            self.head.append(line)
+            return
+        if len(self.tail) == self.tail.maxlen:
+            self.dropped += 1
+        self.tail.append(line)
+
+    def text(self) -> str:
+        lines = self.head
+        if self.dropped:
+            lines = [*lines, f"... 省略 {self.dropped} 行，完整输出见日志文件 ..."]
+        return "\n".join([*lines, *self.tail])
+
+
+async def read_lines(stream: StreamReader, callback: Callable[[str], None]) -> None:
+    """逐行读取输出，不受单行长度的限制"""
+    buffer = bytearray()
+    while chunk := await stream.read(OUTPUT_READ_SIZE):
+        # 没有换行符时只追加，超长的行不会被反复复制
+        if b"\n" not in chunk:
+            buffer += chunk
+            continue
+        first, *lines, rest = chunk.split(b"\n")
+        buffer += first
+        for line in [buffer, *lines]:
+            callback(line.decode(errors="replace").rstrip("\r"))
+        buffer = bytearray(rest)
+    if buffer:
+        callback(buffer.decode(errors="replace").rstrip("\r"))
+
+
+# 测试输出中需要保留的行，例如 loguru 的错误日志与退出信息
+IMPORTANT_LINE_PATTERN = re.compile(r"ERROR|Error:|\bexit\b", re.IGNORECASE)
+TRACEBACK_START = "Traceback (most recent call last):"
+
+
+def _is_traceback_line(line: str) -> bool:
+    """判断是否仍在 Traceback 中
+
+    Traceback 中的内容都有缩进，loguru 会用 > 标记出错的位置
+    第一行没有缩进的内容是异常信息，也属于 Traceback
+    """
+    return not line.strip() or line[0].isspace() or line.startswith(">")
+
+
+def summarize_output(output: str, max_length: int = OUTPUT_MAX_LENGTH) -> str:
+    """生成测试输出的摘要
+
+    保留开头与结尾的若干行，以及中间的 Traceback、错误与退出信息
+    省略的部分会注明行数，摘要长度不会超过 max_length
+    """
+    if len(output) <= max_length:
+        return output
+
+    lines = output.splitlines()
+    head_end = min(OUTPUT_HEAD_LINES, len(lines))
+    tail_start = max(head_end, len(lines) - OUTPUT_TAIL_LINES)
+
+    kept = list(range(head_end))
+    in_traceback = False
+    for i in range(head_end, tail_start):
+        # 测试输出每行都有相同的缩进，需要去除后再判断
+        line = lines[i].removeprefix("    ")
+        if line.startswith(TRACEBACK_START):
+            in_traceback = True
+        elif in_traceback and not _is_traceback_line(line):
+            in_traceback = False
+            # 异常信息是 Traceback 的最后一行
+            kept.append(i)
+            continue
+        if in_traceback or IMPORTANT_LINE_PATTERN.search(line):
+            kept.append(i)
+    kept.extend(range(tail_start, len(lines)))
+
+    summary: list[str] = []
+    previous = -1
+    for i in kept:
+        if i - previous > 1:
+            summary.append(f"... 省略 {i - previous - 1} 行 ...")
+        summary.append(lines[i])
+        previous = i
+    result = "\n".join(summary)
+
+    if len(result) > max_length:
+        # 结尾通常包含出错原因，优先保留
+        marker = "\n... 测试输出过长，已省略部分内容 ...\n"
+        head_length = (max_length - len(marker)) // 4
+        tail_length = max_length - len(marker) - head_length
+        result = result[:head_length] + marker + result[-tail_length:]
+    return result
+
+
+def describe_issue_body(body: str) -> str:
+    """描述议题内容的大小与形状"""
+    lines = body.splitlines()
+    headings = sum(line.startswith(ISSUE_HEADING_PREFIX) for line in lines)
+    fences = sum(line.strip().startswith(CODE_FENCE) for line in lines)
+    longest_line = max(map(len, lines), default=0)
+    whitespace = len(body) - sum(map(len, body.split()))
+    return (
+        f"长度 {len(body)}，行数 {len(lines)}，标题 {headings} 个，"
+        f"代码块标记 {fences} 个，最长行 {longest_line}，空白字符 {whitespace} 个"
+    )
+
+
+def parse_issue_sections(body: str) -> dict[str, str]:
+    """将议题内容拆分为 标题 -> 内容 的字典
+
+    只遍历一次内容，耗时与内容长度成线性关系
+    代码块中的 ### 不会被当作标题，重复的标题只保留第一个
+    内容会去除首尾空白字符
+    """
+    start = time.perf_counter()
+    sections = _parse_issue_sections(body[:ISSUE_BODY_MAX_LENGTH])
+    elapsed = time.perf_counter() - start
+    if elapsed > ISSUE_PARSE_BUDGET:
+        logger.warning(
+            f"议题内容解析耗时 {elapsed * 1000:.1f}ms，"
+            f"超出预算 {ISSUE_PARSE_BUDGET * 1000:.0f}ms：{describe_issue_body(body)}"
+        )
+    return sections
+
+
+def _parse_issue_sections(body: str) -> dict[str, str]:
+    sections: dict[str, str] = {}
+    heading: str | None = None
+    lines: list[str] = []
+    in_fence = False
+
+    for line in body.splitlines():
+        if not in_fence and line.startswith(ISSUE_HEADING_PREFIX):
+            if heading is not None and heading not in sections:
+                sections[heading] = "\n".join(lines).strip()
+            heading = line[len(ISSUE_HEADING_PREFIX) :].strip()
+            lines = []
+            continue
+
+        stripped = line.strip()
+        if stripped.startswith(CODE_FENCE):
+            # 同一行内开始并结束的代码块不影响状态，例如 ```dotenv```
+            if in_fence or stripped.find(CODE_FENCE, len(CODE_FENCE)) == -1:
+                in_fence = not in_fence
+        lines.append(line)
+
+    if heading is not None and heading not in sections:
+        sections[heading] = "\n".join(lines).strip()
+    return sections
+
+
+def extract_code_block(content: str) -> str | None:
+    """提取内容开头的代码块中的代码
+
+    代码块的语言标识会被去除，代码块不完整时返回 None
+    """
+    if not content.startswith(CODE_FENCE):
+        return None
+    end = content.find(CODE_FENCE, len(CODE_FENCE))
+    if end == -1:
+        return None
+
+    code = content[len(CODE_FENCE) : end]
+    # 去除语言标识，例如 ```dotenv
+    first_line, newline, rest = code.partition("\n")
+    if first_line.isidentifier():
+        code = rest if newline else ""
+    return code.strip()
+
+
+def parse_requirements(content: str) -> list[str]:
+    """解析依赖文件，返回排序去重后的依赖列表
+
+    忽略注释与空行，统一为小写并去除空白，写法不同但相同的依赖得到相同的结果
+    """
+    requirements = set()
+    for line in content.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            requirements.add("".join(line.lower().split()))
+    return sorted(requirements)
+
+
+def get_requirements(github_url: str, module_path: str, is_dir: bool) -> list[str]:
+    """获取插件仓库中的依赖列表
+
+    与插件商店相同，依赖文件位于插件目录中，获取失败时视为没有依赖
+    """
+    repo = github_url.removeprefix("https://github.com/").strip("/")
+    directory = f"{module_path.replace('.', '/')}/" if is_dir else ""
+    for filename in REQUIREMENTS_FILENAMES:
+        url = f"https://raw.githubusercontent.com/{repo}/HEAD/{directory}{filename}"
+        try:
+            with urlopen(url, timeout=10) as response:
+                return parse_requirements(response.read().decode())
+        except (URLError, OSError, UnicodeDecodeError):
+            continue
+    return []
+
+
+def hash_file(path: Path) -> str:
+    """计算文件的哈希值，文件不存在时返回空字符串"""
+    if not path.exists():
+        return ""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def get_venv_key(base_lock_hash: str, requirements: list[str]) -> str:
+    """计算虚拟环境的缓存键
+
+    由 Python 版本、真寻依赖锁定文件的哈希值与插件依赖决定
+    """
+    content = json.dumps(
+        {
+            "python": sys.version_info[:2],
+            "base": base_lock_hash,
+            "requirements": requirements,
+        }
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def clone_tree(src: Path, dst: Path) -> None:
+    """复制目录，文件系统支持时使用写时复制，不需要复制文件内容
+
+    不使用硬链接，修改复制后的文件不会影响缓存
+    """
+    try:
+        check_call(
+            ["cp", "-a", "--reflink=auto", str(src), str(dst)],
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, CalledProcessError):
+        # 没有支持 --reflink 的 cp 时（例如 macOS）直接复制
+        if dst.exists():
+            shutil.rmtree(dst)
+        shutil.copytree(src, dst, symlinks=True)
+
+
+def get_tree_size(path: Path, seen: set[tuple[int, int]] | None = None) -> int:
+    """计算目录占用的空间，硬链接的文件只计算一次"""
+    seen = set() if seen is None else seen
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            stat = os.lstat(os.path.join(root, name))
+            if (stat.st_dev, stat.st_ino) not in seen:
+                seen.add((stat.st_dev, stat.st_ino))
+                size += stat.st_size
+    return size
+
+
+class VenvCache:
+    """虚拟环境缓存
+
+    以依赖为键保存测试后的虚拟环境，依赖相同时直接复制，不需要重新安装
+    所有环境共用同一个 wheel 缓存目录，总大小超出限制时删除最久未使用的环境
+
+    另外保存一份只安装了真寻依赖的基础环境快照，测试时在其上创建叠加环境
+    基础环境快照只读，真寻依赖更新后替换，不参与大小限制
+    """
+
+    def __init__(self, root: Path, max_size: int = VENV_CACHE_MAX_SIZE) -> None:
+        self.root = root
+        self.max_size = max_size
+        self.envs_dir = root / "envs"
+        self.base_dir = root / "base"
+        self.wheels_dir = root / "wheels"
+        # 批量测试时多个测试共用同一个缓存
+        self._lock = threading.Lock()
+
+    def restore(self, key: str, target: Path) -> bool:
+        """将缓存的环境复制到目标目录，返回是否命中"""
+        with self._lock:
+            return self._restore(key, target)
+
+    def _restore(self, key: str, target: Path) -> bool:
+        entry = self.envs_dir / key
+        if not entry.exists():
+            return False
+
+        if target.exists():
+            shutil.rmtree(target)
+        clone_tree(entry, target)
+        # 记录使用时间，删除时优先删除最久未使用的环境
+        os.utime(entry)
+        return True
+
+    def save(self, key: str, source: Path) -> None:
+        """保存环境，完成后删除超出大小限制的环境"""
+        with self._lock:
+            self._save(key, source)
+
+    def _save(self, key: str, source: Path) -> None:
+        entry = self.envs_dir / key
+        if entry.exists():
+            return
+
+        # 先复制到临时目录，避免保存到一半的环境被使用
+        temp = self.envs_dir / f"{key}.tmp"
+        if temp.exists():
+            shutil.rmtree(temp)
+        self.envs_dir.mkdir(parents=True, exist_ok=True)
+        clone_tree(source, temp)
+        temp.rename(entry)
+        self.evict(keep=key)
+
+    def snapshot_base(self, key: str, source: Path) -> Path | None:
+        """获取基础环境快照，没有时从 source 创建
+
+        source 需要是只安装了真寻依赖的环境，不存在或者是叠加环境时返回 None
+        """
+        with self._lock:
+            return self._snapshot_base(key, source)
+
+    def _snapshot_base(self, key: str, source: Path) -> Path | None:
+        entry = self.base_dir / key
+        if entry.exists():
+            return entry
+        if not source.exists() or is_overlay_venv(source):
+            return None
+
+        temp = self.base_dir / f"{key}.tmp"
+        if temp.exists():
+            shutil.rmtree(temp)
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        clone_tree(source, temp)
+        temp.rename(entry)
+        # 真寻依赖更新后，旧的快照不会再被使用
+        for other in self.base_dir.iterdir():
+            if other != entry:
+                shutil.rmtree(other)
+        return entry
+
+    def evict(self, keep: str | None = None) -> list[str]:
+        """删除最久未使用的环境，直到总大小不超过限制，返回删除的环境"""
+        if not self.envs_dir.exists():
+            return []
+
+        seen: set[tuple[int, int]] = set()
+        entries = sorted(
+            (entry for entry in self.envs_dir.iterdir() if entry.name != keep),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        # 刚保存的环境不删除，不参与删除顺序
+        keep_size = get_tree_size(self.envs_dir / keep, seen) if keep else 0
+        sizes = [get_tree_size(entry, seen) for entry in entries]
+        total = keep_size + sum(sizes)
+
+        removed = []
+        for entry, size in zip(entries, sizes):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(entry)
+            total -= size
+            removed.append(entry.name)
+        return removed
+
+
+def get_site_packages(venv: Path) -> Path | None:
+    """获取虚拟环境的 site-packages 目录"""
+    return next(venv.glob("lib/python*/site-packages"), None)
+
+
+def is_overlay_venv(venv: Path) -> bool:
+    """判断是否为叠加环境"""
+    site_packages = get_site_packages(venv)
+    return site_packages is not None and (site_packages / BASE_PTH_FILENAME).exists()
+
+
+def link_base_site_packages(base: Path, overlay: Path) -> None:
+    """让叠加环境可以导入基础环境中的包
+
+    通过 .pth 文件调用 site.addsitedir，基础环境中的 .pth 文件也会生效
+    叠加环境中安装的包优先于基础环境
+    """
+    base_site = get_site_packages(base)
+    overlay_site = get_site_packages(overlay)
+    if base_site is None or overlay_site is None:
+        raise FileNotFoundError("找不到 site-packages 目录")
+    with open(overlay_site / BASE_PTH_FILENAME, "w", encoding="utf8") as f:
+        f.write(f"import site; site.addsitedir({str(base_site.resolve())!r})\n")
+
+
+def get_venv_cache() -> VenvCache | None:
+    """通过环境变量获取虚拟环境缓存，未设置时返回 None"""
+    root = os.environ.get(VENV_CACHE_DIR_ENV)
+    if not root:
+        return None
+    max_size = int(os.environ.get(VENV_CACHE_SIZE_ENV) or VENV_CACHE_MAX_SIZE)
+    return VenvCache(Path(root), max_size)
+
+
+class _StaticEvaluator:
+    """在不执行代码的情况下计算简单表达式的值
+
+    支持字面量、模块级变量、字符串拼接与常用字符串方法、枚举成员（取成员名）
+    以及 PluginExtraData(...).dict() 这类将关键字参数转换为字典的写法
+    无法计算时抛出 ValueError
+    """
+
+    def __init__(self, tree: ast.Module) -> None:
+        self.names: dict[str, ast.expr] = {}
+        for node in tree.body:
+            if (
+                isinstance(node, ast.Assign)
+                and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+            ):
+                self.names[node.targets[0].id] = node.value
+            elif (
+                isinstance(node, ast.AnnAssign)
+                and isinstance(node.target, ast.Name)
+                and node.value is not None
+            ):
+                self.names[node.target.id] = node.value
+        self._resolving: set[str] = set()
+
+    def eval(self, node: ast.expr) -> object:
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.Name):
+            return self._eval_name(node.id)
+        if isinstance(node, ast.Attribute):
+            # PluginType.NORMAL -> "NORMAL"
+            if isinstance(node.value, ast.Name) and node.value.id not in self.names:
+                return node.attr
+            raise ValueError(f"不支持的属性：{ast.dump(node)}")
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+            left, right = self.eval(node.left), self.eval(node.right)
+            if isinstance(left, str) and isinstance(right, str):
+                return left + right
+            raise ValueError("只支持字符串拼接")
+        if isinstance(node, ast.JoinedStr):
+            return "".join(
+                str(self.eval(value.value))
+                if isinstance(value, ast.FormattedValue)
+                else str(self.eval(value))
+                for value in node.values
+            )
+        if isinstance(node, ast.Dict):
+            if any(key is None for key in node.keys):
+                raise ValueError("不支持字典解包")
+            return {
+                self.eval(key): self.eval(value)  # type: ignore
+                for key, value in zip(node.keys, node.values)
+            }
+        if isinstance(node, ast.List | ast.Tuple | ast.Set):
+            return [self.eval(item) for item in node.elts]
+        if isinstance(node, ast.Call):
+            return self._eval_call(node)
+        raise ValueError(f"不支持的表达式：{type(node).__name__}")
+
+    def fields(self, node: ast.expr) -> dict[str, ast.expr]:
+        """获取字典或数据模型中各个字段的表达式，方便单独计算每个字段"""
+        if isinstance(node, ast.Name) and node.id in self.names:
+            return self.fields(self.names[node.id])
+        if isinstance(node, ast.Dict):
+            return {
+                key.value: value
+                for key, value in zip(node.keys, node.values)
+                if isinstance(key, ast.Constant) and isinstance(key.value, str)
+            }
+        if isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Call):
+                return self.fields(func.value)
+            if isinstance(func, ast.Name):
+                return {
+                    keyword.arg: keyword.value
+                    for keyword in node.keywords
+                    if keyword.arg
+                }
+        raise ValueError(f"不支持的表达式：{type(node).__name__}")
+
+    def _eval_name(self, name: str) -> object:
+        if name not in self.names or name in self._resolving:
+            raise ValueError(f"无法获取变量 {name} 的值")
+        self._resolving.add(name)
+        try:
+            return self.eval(self.names[name])
+        finally:
+            self._resolving.discard(name)
+
+    def _eval_call(self, node: ast.Call) -> object:
+        func = node.func
+        if isinstance(func, ast.Attribute):
+            value = func.value
+            # PluginExtraData(...).dict() 与 .to_dict() 等写法
+            if isinstance(value, ast.Call) and not node.args and not node.keywords:
+                return self._eval_call(value)
+            target = self.eval(value)
+            if isinstance(target, str) and func.attr in STATIC_STR_METHODS:
+                args = [self.eval(arg) for arg in node.args]
+                kwargs = {
+                    keyword.arg: self.eval(keyword.value)
+                    for keyword in node.keywords
+                    if keyword.arg
+                }
+                return getattr(target, func.attr)(*args, **kwargs)
+            raise ValueError(f"不支持的方法：{func.attr}")
+        if isinstance(func, ast.Name):
+            # 数据模型，例如 PluginExtraData(...)，只需要关键字参数
+            if node.args or any(keyword.arg is None for keyword in node.keywords):
+                raise ValueError(f"{func.id} 只支持关键字参数")
+            return {
+                keyword.arg: self.eval(keyword.value)
+                for keyword in node.keywords
+                if keyword.arg
+            }
+        raise ValueError("不支持的调用")
+
+
+def extract_plugin_metadata(source: str) -> dict[str, str] | None:
+    """从插件源码中静态提取插件元数据，不会执行任何代码
+
+    解析 __plugin_meta__ = PluginMetadata(...) 的参数
+    只返回能够确定的字段，找不到 __plugin_meta__ 时返回 None
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+
+    call = None
+    for node in tree.body:
+        target = None
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+        elif isinstance(node, ast.AnnAssign):
+            target = node.target
+        if (
+            isinstance(target, ast.Name)
+            and target.id == "__plugin_meta__"
+            and isinstance(node.value, ast.Call)  # type: ignore
+        ):
+            call = node.value  # type: ignore
+    if call is None:
+        return None
+
+    evaluator = _StaticEvaluator(tree)
+    fields = {keyword.arg: keyword.value for keyword in call.keywords if keyword.arg}
+    # extra 中的字段单独计算，部分字段无法确定时不影响其他字段
+    try:
+        extra = evaluator.fields(fields.pop("extra"))
+    except (KeyError, ValueError):
+        extra = {}
+
+    metadata: dict[str, str] = {}
+    for name, node in [
+        ("description", fields.get("description")),
+        ("usage", fields.get("usage")),
+        ("author", extra.get("author")),
+        ("version", extra.get("version")),
+        ("plugin_type", extra.get("plugin_type")),
+    ]:
+        if node is None:
+            continue
+        try:
+            value = evaluator.eval(node)
+        except ValueError:
+            continue
+        if isinstance(value, str):
+            metadata[name] = value
+    return metadata
+
+
+def fetch_plugin_source(github_url: str, module_path: str, is_dir: bool) -> str | None:
+    """获取插件入口文件的源码，目录插件为 __init__.py，获取失败时返回 None"""
+    repo = github_url.removeprefix("https://github.com/").strip("/")
+    path = module_path.replace(".", "/")
+    path = f"{path}/__init__.py" if is_dir else f"{path}.py"
+    url = f"https://raw.githubusercontent.com/{repo}/HEAD/{path}"
+    try:
+        with urlopen(url, timeout=10) as response:
+            return response.read().decode()
+    except (URLError, OSError, UnicodeDecodeError):
+        return None
+
+
+class ResultCache:
+    """插件测试结果缓存
+
+    每个结果保存为一个 JSON 文件，工作流可以直接缓存整个目录
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def get(self, key: str) -> dict | None:
+        path = self.root / f"{key}.json"
+        try:
+            with open(path, encoding="utf8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: dict) -> None:
+        # 先写入临时文件再替换，避免读取到写入一半的结果
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp = self.root / f"{key}.tmp"
+        with open(temp, "w", encoding="utf8") as f:
+            json.dump(value, f, ensure_ascii=False)
+        temp.replace(self.root / f"{key}.json")
+
+
+def get_result_cache() -> ResultCache | None:
+    """通过环境变量获取测试结果缓存，未设置时返回 None"""
+    root = os.environ.get(RESULT_CACHE_DIR_ENV)
+    if root:
+        return ResultCache(Path(root))
+    root = os.environ.get(VENV_CACHE_DIR_ENV)
+    if root:
+        return ResultCache(Path(root) / "results")
+    return None
+
+
+def get_result_key(
+    github_url: str,
+    sha: str,
+    module_name: str,
+    module_path: str,
+    is_dir: bool,
+    config: str | None,
+    base_env: str,
+    runner: str,
+) -> str:
+    """计算测试结果的缓存键
+
+    仓库提交、插件信息、插件配置、基础环境与运行模式都相同时，测试结果也相同
+    插件会安装为 zhenxun/plugins/{module_name}，模块名称不同时需要重新测试
+    """
+    content = json.dumps(
+        {
+            "github_url": github_url,
+            "sha": sha,
+            "module_name": module_name,
+            "module_path": module_path,
+            "is_dir": is_dir,
+            "config": hashlib.sha256((config or "").encode()).hexdigest(),
+            "base_env": base_env,
+            "runner": runner,
+        }
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+async def get_repo_sha(github_url: str) -> str | None:
+    """通过 git ls-remote 获取仓库默认分支的最新提交，不需要克隆仓库"""
+    proc = await asyncio.create_subprocess_exec(
+        "git",
+        "ls-remote",
+        github_url,
+        "HEAD",
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+        start_new_session=True,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(
+            proc.communicate(), timeout=PREFLIGHT_TIMEOUT * 6
+        )
+    except asyncio.TimeoutError:
+        # git 会启动 git-remote-https 等子进程，需要结束整个进程组并回收进程
+        await kill_process_group(proc)
+        return None
+    if proc.returncode:
+        return None
+    sha, _, _ = stdout.decode().partition("\t")
+    return sha.strip() or None
+
+
+def parse_import_time(lines: list[str]) -> dict:
+    """解析 -X importtime 的输出
+
+    按顶层包汇总各模块自身的耗时，返回总耗时与最慢的几个包，单位为毫秒
+    """
+    packages: dict[str, int] = {}
+    for line in lines:
+        self_us, _, rest = line.removeprefix(IMPORT_TIME_PREFIX).partition("|")
+        _, _, module = rest.partition("|")
+        # 跳过表头
+        if not self_us.strip().isdigit():
+            continue
+        package = module.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+    ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    return {
+        "total": round(sum(packages.values()) / 1000, 1),
+        "modules": [
+            {"module": name, "time": round(us / 1000, 1)}
+            for name, us in ranked[:IMPORT_TIME_TOP]
+        ],
+    }
+
+
+def format_import_time(import_time: dict) -> str:
+    """将导入耗时转换为可读的文本"""
+    modules = "，".join(
+        f"{module['module']} {module['time']:.1f} 毫秒"
+        for module in import_time["modules"]
+    )
+    return f"插件导入耗时 {import_time['total']:.1f} 毫秒：{modules}"
+
+
+def get_phase_timeouts() -> dict[str, float]:
+    """获取各阶段的超时时间，环境变量优先"""
+    return {
+        name: float(
+            os.environ.get(f"{PHASE_TIMEOUT_ENV_PREFIX}{name.upper()}") or timeout
+        )
+        for name, timeout in PHASE_TIMEOUTS.items()
+    }
+
+
+async def kill_process_group(
+    proc: asyncio.subprocess.Process, grace: float = KILL_GRACE_PERIOD
+) -> None:
+    """结束进程所在的进程组
+
+    shell 启动的 poetry、pip 与插件都在同一个进程组中，只结束 shell 时它们仍会继续运行
+    先发送 SIGTERM，超过等待时间后发送 SIGKILL
+    """
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(proc.pid, sig)
+        except ProcessLookupError:
+            break
+        try:
+            await asyncio.wait_for(proc.wait(), grace)
+            break
+        except asyncio.TimeoutError:
+            continue
+
+
+async def communicate_with_timeout(
+    proc: asyncio.subprocess.Process, timeout: float
+) -> tuple[bytes, bytes] | None:
+    """等待进程结束并读取输出，超时时结束整个进程组并返回 None"""
+    try:
+        return await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        await kill_process_group(proc)
+        return None
 
 
 def get_plugin_list() -> dict[str, str]:
@@ -190,6 +1145,7 @@ class PluginTest:
         github_url: str,
         is_dir: bool,
         config: str | None = None,
+        path: Path | None = None,
     ) -> None:
         self.plugin_name = plugin_name
         self.module_name = module_name
@@ -197,20 +1153,59 @@ class PluginTest:
         self.github_url = github_url
         self.is_dir = is_dir
         self.config = config
+        self._path = path or Path()
         self._plugin_list = None
 
         self._create = False
         self._run = False
         self._deps = []
 
-        # 输出信息
-        self._output_lines: list[str] = []
+        # 输出信息，完整输出同时写入日志文件与作业摘要
+        self._output = OutputBuffer()
+        self._log_handle: TextIO | None = None
+        self._summary_handle: TextIO | None = None
+        self._summary_length = 0
 
         # 插件测试目录
-        self.test_dir = Path("zhenxun/plugins")
+        self.test_dir = self.path / "zhenxun" / "plugins"
         # 通过环境变量获取 GITHUB 输出文件位置
         self.github_output_file = Path(os.environ.get("GITHUB_OUTPUT", ""))
         self.github_step_summary_file = Path(os.environ.get("GITHUB_STEP_SUMMARY", ""))
+        # 完整测试输出保存在临时目录中，方便上传为 Artifact
+        self.log_file = Path(os.environ.get("RUNNER_TEMP", "")) / OUTPUT_LOG_FILENAME
+
+        # 虚拟环境缓存
+        self.venv_cache = get_venv_cache()
+        self._venv_key: str | None = None
+        self._venv_hit = False
+        # 使用缓存的环境或叠加环境时为真寻虚拟环境旁边的目录，真寻虚拟环境保持不变
+        self._overlay_venv: Path | None = None
+        # 各阶段的耗时与超时时间
+        self._timings: dict[str, float] = {}
+        self.timeouts = get_phase_timeouts()
+        self._phase: str | None = None
+        self._phase_start = 0.0
+        self._phase_changed = asyncio.Event()
+        # 测试脚本的运行模式与峰值内存
+        self.runner = os.environ.get(RUNNER_MODE_ENV) or "full"
+        if self.runner not in BOOTSTRAP_SCRIPTS:
+            print(f"不支持的运行模式 {self.runner}，使用完整模式")
+            self.runner = "full"
+        self._peak_rss: int | None = None
+        # 测试结果缓存，强制测试时不读取缓存
+        self.result_cache = get_result_cache()
+        self.force = os.environ.get(FORCE_TEST_ENV, "").lower() in ("1", "true")
+        self._result_hit = False
+        # 超时的阶段
+        self._timed_out: str | None = None
+        self._metadata: dict | None = None
+        # 插件导入期间 -X importtime 的输出
+        self._import_time_lines: list[str] = []
+        self._import_time_collecting = False
+        self._import_time: dict | None = None
+        # 测试脚本的内存（字节）与 CPU 时间（秒）限制，批量测试时设置
+        self.memory_limit: int | None = None
+        self.cpu_limit: int | None = None
 
     @property
     def key(self) -> str:
@@ -223,41 +1218,318 @@ class PluginTest:
 
     @property
     def path(self) -> Path:
-        """插件测试目录"""
-        # 替换 : 为 -，防止文件名不合法
-        # key = self.key.replace(":", "-")
-        # return self.test_dir / f"{key}"
-        return Path()
+        """插件测试目录
+
+        默认为当前目录，批量测试时每个插件使用单独的目录
+        """
+        return self._path
 
     async def run(self):
         # 运行前创建测试目录
         if not self.test_dir.exists():
             self.test_dir.mkdir()
 
-        await self.create_poetry_project()
-        if self._create:
-            # await self.show_package_info()
-            # await self.show_plugin_dependencies()
-            await self.run_poetry_project()
+        # 测试输出实时写入日志文件与作业摘要，测试中断时也能查看已有的输出
+        self._log_handle = open(self.log_file, "w", encoding="utf8")
+        self._summary_handle = open(self.github_step_summary_file, "a", encoding="utf8")
+        self._summary_handle.write(
+            f"<details><summary>插件 {self.plugin_name} 测试输出</summary><pre><code>"
+        )
+        try:
+            await self.run_test()
+        finally:
+            self._log_handle.close()
+            self._summary_handle.write("</code></pre></details>\n\n")
+            self._summary_handle.close()
+            self._log_handle = self._summary_handle = None
 
         # 输出测试结果
         with open(self.github_output_file, "a", encoding="utf8") as f:
             f.write(f"RESULT={self._run}\n")
-        # 输出测试输出
-        output = "\n".join(self._output_lines)
-        # GitHub 不支持 ANSI 转义字符所以去掉
-        ansiless_output = strip_ansi(output)
-        # 限制输出长度，防止评论过长，评论最大长度为 65536
-        ansiless_output = ansiless_output[:50000]
+            if self._metadata is not None:
+                f.write(f"METADATA<<EOF\n{json.dumps(self._metadata)}\nEOF\n")
+        # 输出测试输出，评论中只显示摘要，防止评论过长
+        output = self._output.text()
         with open(self.github_output_file, "a", encoding="utf8") as f:
-            f.write(f"OUTPUT<<EOF\n{ansiless_output}\nEOF\n")
+            f.write(f"OUTPUT<<EOF\n{summarize_output(output)}\nEOF\n")
+            f.write(f"LOG_PATH={self.log_file.resolve()}\n")
+        # 输出各阶段耗时
+        with open(self.github_output_file, "a", encoding="utf8") as f:
+            f.write(f"TIMINGS={json.dumps(self._timings)}\n")
+            if self._peak_rss is not None:
+                f.write(f"PEAK_RSS={self._peak_rss}\n")
         # 输出至作业摘要
         with open(self.github_step_summary_file, "a", encoding="utf8") as f:
             summary = f"插件 {self.plugin_name} 加载测试结果：{'通过' if self._run else '未通过'}\n"
-            summary += f"<details><summary>测试输出</summary><pre><code>{ansiless_output}</code></pre></details>"
+            summary += f"{self.format_timings()}\n"
             f.write(f"{summary}")
         return self._run, output
 
+    async def run_test(self) -> None:
+        await self.check_static_metadata()
+
+        result_key = await self.get_result_key()
+        if result_key and not self.force:
+            self.load_result(result_key)
+
+        if not self._result_hit:
+            self.enter_phase("setup")
+            await self.create_poetry_project()
+            if self._create:
+                # await self.show_package_info()
+                # await self.show_plugin_dependencies()
+                await self.restore_venv()
+                await self.run_poetry_project()
+                await self.save_venv()
+            self.enter_phase(None)
+            if result_key:
+                self.save_result(result_key)
+            # 耗时只对本次测试有效，不保存至缓存
+            self._log_output(self.format_timings())
+
+    def enter_phase(self, name: str | None) -> None:
+        """进入新的阶段，记录上一个阶段的耗时"""
+        now = time.perf_counter()
+        if self._phase is not None:
+            self._timings[self._phase] = now - self._phase_start
+        self._phase = name
+        self._phase_start = now
+        self._phase_changed.set()
+
+    @property
+    def phase_timeout(self) -> float:
+        """当前阶段的超时时间，未知的阶段使用最长的超时时间"""
+        return self.timeouts.get(self._phase or "", max(self.timeouts.values()))
+
+    @property
+    def phase_remaining(self) -> float:
+        """当前阶段剩余的时间"""
+        return self._phase_start + self.phase_timeout - time.perf_counter()
+
+    async def watch_phases(self) -> None:
+        """等待直到当前阶段超时，进入新阶段时重新计时"""
+        while True:
+            self._phase_changed.clear()
+            try:
+                await asyncio.wait_for(
+                    self._phase_changed.wait(), max(self.phase_remaining, 0)
+                )
+            except asyncio.TimeoutError:
+                return
+
+    def log_timeout(self) -> None:
+        """记录超时的阶段"""
+        phase = self._phase or ""
+        self._timed_out = phase
+        self._log_output(
+            f"    测试超时：{TIMING_NAMES.get(phase, phase)}阶段超过 {self.phase_timeout:.0f} 秒"
+        )
+
+    async def get_result_key(self) -> str | None:
+        """获取测试结果的缓存键，未启用缓存或无法获取仓库提交时返回 None"""
+        if self.result_cache is None:
+            return None
+        sha = await get_repo_sha(self.github_url)
+        if sha is None:
+            print("无法获取仓库的最新提交，不使用测试结果缓存")
+            return None
+        base_env = get_venv_key(hash_file(self.path / BASE_LOCK_FILENAME), [])
+        return get_result_key(
+            self.github_url,
+            sha,
+            self.module_name,
+            self.module_path,
+            self.is_dir,
+            self.config,
+            base_env,
+            self.runner,
+        )
+
+    def load_result(self, key: str) -> None:
+        """读取缓存的测试结果"""
+        cached = self.result_cache.get(key) if self.result_cache else None
+        if cached is None:
+            return
+        self._result_hit = True
+        self._run = cached["result"]
+        self._metadata = cached["metadata"]
+        print(f"使用缓存的测试结果 {key}，可以评论 {FORCE_TEST_COMMENT} 强制重新测试")
+        for line in cached["output"].splitlines():
+            self._log_output(line)
+
+    def save_result(self, key: str) -> None:
+        """保存测试结果
+
+        只保存通过的结果，失败可能是网络、超时等临时问题，下次需要重新测试
+        """
+        if self.result_cache is None or not self._run:
+            return
+        self.result_cache.set(
+            key,
+            {
+                "result": self._run,
+                "metadata": self._metadata,
+                "output": self._output.text(),
+            },
+        )
+
+    async def check_static_metadata(self) -> None:
+        """在测试前静态提取插件元数据，不需要安装插件
+
+        提取到完整的元数据时输出 STATIC_METADATA，插件测试因为环境问题失败时可以作为替代
+        """
+        start = time.perf_counter()
+        source = await asyncio.to_thread(
+            fetch_plugin_source, self.github_url, self.module_path, self.is_dir
+        )
+        metadata = extract_plugin_metadata(source) if source else None
+        self._timings["static"] = time.perf_counter() - start
+
+        if metadata is None:
+            print("无法静态提取插件元数据")
+            return
+        missing = [name for name in STATIC_METADATA_FIELDS if name not in metadata]
+        if missing:
+            print(f"静态提取的插件元数据缺少 {', '.join(missing)}")
+            return
+        print(f"静态提取的插件元数据：{metadata}")
+        with open(self.github_output_file, "a", encoding="utf8") as f:
+            data = get_static_metadata(metadata)
+            f.write(f"STATIC_METADATA<<EOF\n{json.dumps(data)}\nEOF\n")
+
+    def render_runner(self) -> str:
+        """生成测试脚本"""
+        params = {
+            "plugin_name": self.plugin_name,
+            "module_name": self.module_name,
+            "module_path": self.module_path,
+            "github_url": self.github_url,
+            "is_dir": self.is_dir,
+        }
+        bootstrap = BOOTSTRAP_SCRIPTS[self.runner].format(
+            **params, requirements_filenames=REQUIREMENTS_FILENAMES
+        )
+        return RUNNER_SCRIPT.format(
+            **params,
+            bootstrap=bootstrap,
+            deps="\n".join([f"require('{i}')" for i in self._deps]),
+            phase_prefix=PHASE_PREFIX,
+            import_time_start=IMPORT_TIME_START,
+            import_time_end=IMPORT_TIME_END,
+            peak_rss_prefix=PEAK_RSS_PREFIX,
+            metadata_prefix=METADATA_PREFIX,
+        )
+
+    def format_timings(self) -> str:
+        """将各阶段耗时转换为可读的文本"""
+        timings = [
+            f"{TIMING_NAMES.get(name, name)} {elapsed:.1f} 秒"
+            for name, elapsed in self._timings.items()
+        ]
+        if self._result_hit:
+            return "使用缓存的测试结果"
+        cache = "命中" if self._venv_hit else "未命中"
+        result = (
+            f"耗时：{'，'.join(timings)}（环境缓存{cache}，运行模式 {self.runner}）"
+        )
+        if self._peak_rss is not None:
+            result += f"，峰值内存 {self._peak_rss / 1024:.1f} MB"
+        return result
+
+    def limit_command(self) -> str:
+        """设置资源限制的 shell 命令前缀，之后启动的测试脚本会继承这些限制
+
+        使用 ulimit 在 shell 中设置，preexec_fn 在多线程的进程中不安全
+        """
+        commands = []
+        if self.memory_limit is not None:
+            # ulimit -v 的单位为 KB
+            commands.append(f"ulimit -v {self.memory_limit // 1024}")
+        if self.cpu_limit is not None:
+            commands.append(f"ulimit -t {self.cpu_limit}")
+        return "".join(f"{command} && " for command in commands)
+
+    @property
+    def venv_path(self) -> Path:
+        """测试所用的虚拟环境目录"""
+        if self._overlay_venv is not None:
+            return self._overlay_venv
+        return self.path / VENV_DIRNAME
+
+    async def restore_venv(self) -> None:
+        """依赖相同的环境已经缓存时，直接复制缓存的环境"""
+        if self.venv_cache is None:
+            return
+
+        requirements = await asyncio.to_thread(
+            get_requirements, self.github_url, self.module_path, self.is_dir
+        )
+        base_lock_hash = hash_file(self.path / BASE_LOCK_FILENAME)
+        self._venv_key = get_venv_key(base_lock_hash, requirements)
+        overlay = self.path / OVERLAY_VENV_DIRNAME
+        self._venv_hit = await asyncio.to_thread(
+            self.venv_cache.restore, self._venv_key, overlay
+        )
+        if self._venv_hit:
+            self._overlay_venv = overlay
+            print(f"使用缓存的虚拟环境 {self._venv_key}")
+            return
+
+        print(f"没有缓存的虚拟环境 {self._venv_key}，需要安装依赖")
+        # 插件依赖安装在叠加环境中，基础环境保持不变，可以被之后的测试复用
+        base = await asyncio.to_thread(
+            self.venv_cache.snapshot_base,
+            get_venv_key(base_lock_hash, []),
+            self.path / VENV_DIRNAME,
+        )
+        if base is not None:
+            await self.create_overlay_venv(base)
+
+    async def create_overlay_venv(self, base: Path) -> None:
+        """在基础环境快照上创建叠加环境，测试时代替真寻的虚拟环境
+
+        叠加环境创建在真寻虚拟环境旁边，不修改真寻虚拟环境
+        创建失败时继续使用当前的虚拟环境
+        """
+        overlay = self.path / OVERLAY_VENV_DIRNAME
+        if overlay.exists():
+            shutil.rmtree(overlay)
+        proc = await asyncio.create_subprocess_exec(
+            str(base / "bin" / "python"),
+            "-m",
+            "venv",
+            "--without-pip",
+            str(overlay),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        )
+        result = await communicate_with_timeout(proc, max(self.phase_remaining, 1))
+        if result is None:
+            print("叠加环境创建超时，使用当前环境")
+            return
+        if proc.returncode:
+            print(f"叠加环境创建失败，使用当前环境：{result[1].decode().strip()}")
+            return
+
+        link_base_site_packages(base, overlay)
+        self._overlay_venv = overlay
+        print(f"已在基础环境 {base.name} 上创建叠加环境")
+
+    async def save_venv(self) -> None:
+        """保存测试通过的环境，安装失败或超时的环境不保存"""
+        if (
+            self.venv_cache is None
+            or self._venv_key is None
+            or self._venv_hit
+            or not self._run
+            or not self.venv_path.exists()
+        ):
+            return
+
+        await asyncio.to_thread(self.venv_cache.save, self._venv_key, self.venv_path)
+        print(f"虚拟环境已缓存 {self._venv_key}")
+
     def get_env(self) -> dict[str, str]:
         """获取环境变量"""
         env = os.environ.copy()
@@ -270,6 +1542,16 @@ class PluginTest:
         env["POETRY_VIRTUALENVS_IN_PROJECT"] = "true"
         # https://python-poetry.org/docs/configuration/#virtualenvsprefer-active-python-experimental
         env["POETRY_VIRTUALENVS_PREFER_ACTIVE_PYTHON"] = "true"
+        # 已激活虚拟环境时 poetry 直接使用该环境，不使用项目中的 .venv
+        if self._overlay_venv is not None:
+            env["VIRTUAL_ENV"] = str(self._overlay_venv.resolve())
+            env["PATH"] = os.pathsep.join(
+                [str(self._overlay_venv.resolve() / "bin"), env.get("PATH", "")]
+            )
+        # 所有环境共用同一个 wheel 缓存
+        if self.venv_cache is not None:
+            env["PIP_CACHE_DIR"] = str(self.venv_cache.wheels_dir)
+            env["POETRY_CACHE_DIR"] = str(self.venv_cache.wheels_dir)
         return env
 
     async def create_poetry_project(self) -> None:
@@ -281,8 +1563,13 @@ class PluginTest:
                 stderr=subprocess.PIPE,
                 cwd=self.path,
                 env=self.get_env(),
+                start_new_session=True,
             )
-            stdout, stderr = await proc.communicate()
+            result = await communicate_with_timeout(proc, self.phase_remaining)
+            if result is None:
+                self.log_timeout()
+                return
+            stdout, stderr = result
             code = proc.returncode
 
             self._create = not code
@@ -350,49 +1637,117 @@ class PluginTest:
             with open(self.path / "fake.py", "w", encoding="utf8") as f:
                 f.write(FAKE_SCRIPT)
             with open(self.path / "runner.py", "w", encoding="utf8") as f:
-                f.write(
-                    RUNNER_SCRIPT.format(
-                        plugin_name=self.plugin_name,
-                        module_name=self.module_name,
-                        module_path=self.module_path,
-                        github_url=self.github_url,
-                        is_dir=self.is_dir,
-                        deps="\n".join([f"require('{i}')" for i in self._deps]),
-                    )
-                )
+                f.write(self.render_runner())
 
-            try:
-                proc = await create_subprocess_shell(
-                    "poetry run python runner.py",
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    cwd=self.path,
-                    env=self.get_env(),
+            self._log_output(f"插件 {self.module_name} 加载输出：")
+            proc = await create_subprocess_shell(
+                f"{self.limit_command()}poetry run python -X importtime runner.py",
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=self.path,
+                env=self.get_env(),
+                start_new_session=True,
+            )
+            # 逐行读取输出，超时时已经读取的输出不会丢失
+            # 测试脚本会输出进入的阶段，每个阶段单独计时
+            self.enter_phase("startup")
+            reading = asyncio.ensure_future(
+                asyncio.gather(
+                    read_lines(proc.stdout, self._handle_stdout),  # type: ignore
+                    read_lines(proc.stderr, self._handle_stderr),  # type: ignore
+                    proc.wait(),
                 )
-                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=600)
-                code = proc.returncode
-            except asyncio.TimeoutError:
-                proc.terminate()
-                stdout = b""
-                stderr = "测试超时".encode()
+            )
+            watching = asyncio.ensure_future(self.watch_phases())
+            await asyncio.wait({reading, watching}, return_when=FIRST_COMPLETED)
+            watching.cancel()
+            if reading.done() and reading.exception() is None:
+                code = await proc.wait()
+            else:
+                if reading.done():
+                    # 处理输出时出错，无法确定测试结果，视为失败
+                    self._log_output(f"读取测试输出出错：{reading.exception()!r}")
+                else:
+                    self.log_timeout()
+                await kill_process_group(proc)
+                # 进程结束后读取剩余的输出，并回收进程
+                try:
+                    await asyncio.wait_for(
+                        asyncio.gather(reading, proc.wait(), return_exceptions=True),
+                        KILL_GRACE_PERIOD,
+                    )
+                except asyncio.TimeoutError:
+                    pass
                 code = 1
 
-            self._run = not code
+            self._run = code == 0
+            self.enter_phase(None)
 
             status = "正常" if self._run else "出错"
-            self._log_output(f"插件 {self.module_name} 加载{status}：")
-
-            _out = stdout.decode().strip().splitlines()
-            _err = stderr.decode().strip().splitlines()
-            for i in _out:
-                self._log_output(f"    {i}")
-            for i in _err:
-                self._log_output(f"    {i}")
+            self._log_output(f"插件 {self.module_name} 加载{status}。")
+
+            if self._import_time_lines:
+                self._import_time = parse_import_time(self._import_time_lines)
+                self._log_output(format_import_time(self._import_time))
+                if self._metadata is not None:
+                    self._metadata["import_time"] = self._import_time
+
+    def _handle_stdout(self, line: str) -> None:
+        # 测试脚本输出的阶段等数据不需要显示
+        if line.startswith(PHASE_PREFIX):
+            self.enter_phase(line[len(PHASE_PREFIX) :])
+        elif line.startswith(PEAK_RSS_PREFIX):
+            try:
+                self._peak_rss = int(line[len(PEAK_RSS_PREFIX) :])
+            except ValueError:
+                # 插件也可能输出以相同前缀开头的内容
+                logger.warning(f"无法解析峰值内存：{line}")
+                self._log_output(f"    {line}")
+        elif line.startswith(METADATA_PREFIX):
+            try:
+                self._metadata = json.loads(line[len(METADATA_PREFIX) :])
+            except ValueError:
+                logger.warning(f"无法解析插件元数据：{line}")
+                self._log_output(f"    {line}")
+        else:
+            self._log_output(f"    {line}")
+
+    def _handle_stderr(self, line: str) -> None:
+        # 导入耗时的输出太多，只记录插件导入期间的部分，不显示
+        if line.startswith(IMPORT_TIME_PREFIX):
+            if self._import_time_collecting:
+                self._import_time_lines.append(line)
+        elif line == IMPORT_TIME_START:
+            self._import_time_collecting = True
+        elif line == IMPORT_TIME_END:
+            self._import_time_collecting = False
+        else:
+            self._log_output(f"    {line}")
 
     def _log_output(self, output: str) -> None:
-        """记录输出，同时打印到控制台"""
-        print(output)
-        self._output_lines.append(output)
+        """记录输出，同时打印到控制台
+
+        GitHub 不支持 ANSI 转义字符，所以在记录时去掉，之后不需要再处理
+        作业摘要只写入开头的部分，防止超出大小限制
+        """
+        print(output, flush=True)
+        output = strip_ansi(output)
+        self._output.append(output)
+        if self._log_handle is not None:
+            self._log_handle.write(f"{output}\n")
+            self._log_handle.flush()
+        if (
+            self._summary_handle is not None
+            and self._summary_length < OUTPUT_MAX_LENGTH
+        ):
+            self._summary_length += len(output) + 1
+            if self._summary_length < OUTPUT_MAX_LENGTH:
+                self._summary_handle.write(f"{html.escape(output)}\n")
+            else:
+                self._summary_handle.write(
+                    f"... 测试输出过长，完整输出见 {self.log_file.name} ...\n"
+                )
+            self._summary_handle.flush()
 
     @property
     def plugin_list(self) -> dict[str, str]:
@@ -412,63 +1767,305 @@ class PluginTest:
                 return self.plugin_list[package_name]
 
 
-async def main_test() -> None:
-    issue_body = """
-### 插件名称
-github订阅
+def create_plugin_test(issue_body: str) -> PluginTest | None:
+    """从议题内容中获取插件信息
 
-### 模块名称
-github_sub
+    缺少插件信息时返回 None
+    """
+    sections = parse_issue_sections(issue_body)
+    plugin_name = sections.get(PLUGIN_NAME_STRING)
+    module_name = sections.get(PLUGIN_MODULE_NAME_STRING)
+    module_path = sections.get(PLUGIN_MODULE_PATH_STRING)
+    github_url = sections.get(PLUGIN_GITHUB_URL_STRING)
+    is_dir_text = sections.get(PLUGIN_IS_DIR_STRING)
+
+    if not (plugin_name and module_name and module_path and github_url and is_dir_text):
+        return None
 
-### 模块路径
-github_sub
+    return PluginTest(
+        plugin_name=plugin_name,
+        module_name=module_name,
+        module_path=module_path,
+        github_url=github_url,
+        is_dir=is_dir_text != "否",
+        config=extract_code_block(sections.get(PLUGIN_CONFIG_STRING, "")),
+    )
 
-### 仓库地址
-https://github.com/xuanerwa/zhenxun_github_sub
 
-### 是否为目录
-是
+def create_workdir(base: Path, target: Path) -> None:
+    """复制真寻目录作为插件的测试目录
 
-### 插件配置项
-```
-SYSTEM_PROXY="http://127.0.0.1:7890"
-```
+    不复制虚拟环境，测试时在真寻的虚拟环境上创建叠加环境
     """
-    plugin_name = PLUGIN_NAME_PATTERN.search(issue_body)
-    module_name = PLUGIN_MODULE_NAME_PATTERN.search(issue_body)
-    module_path = PLUGIN_MODULE_PATH_PATTERN.search(issue_body)
-    plugin_github_url = PLUGIN_GITHUB_URL_PATTERN.search(issue_body)
-    is_dir_text = IS_DIR_PATTERN.search(issue_body)
-    config = CONFIG_PATTERN.search(issue_body)
-
-    if not (
-        plugin_name
-        and module_name
-        and module_path
-        and plugin_github_url
-        and is_dir_text
-    ):
-        print("议题中没有插件信息，已跳过")
-        return
-    is_dir = True
-    if is_dir_text.group(1).strip() == "是":
-        is_dir = True
-    elif is_dir_text.group(1).strip() == "否":
-        is_dir = False
+    if target.exists():
+        shutil.rmtree(target)
+    ignore_names = shutil.ignore_patterns(*BATCH_IGNORE_PATTERNS)
+    root = target.parent.resolve()
+
+    def ignore(directory: str, names: list[str]) -> set[str]:
+        ignored = set(ignore_names(directory, names))
+        # 测试目录在真寻目录中时不能复制自身
+        ignored.update(
+            name for name in names if Path(directory, name).resolve() == root
+        )
+        return ignored
+
+    shutil.copytree(base, target, symlinks=True, ignore=ignore)
+
+
+def load_batch(path: Path) -> list[dict]:
+    """读取插件列表，格式与插件商店的 plugins.json 相同"""
+    with open(path, encoding="utf8") as f:
+        data: dict[str, dict] = json.load(f)
+    return [{**info, "name": name} for name, info in data.items()]
+
+
+async def run_isolated(
+    index: int,
+    spec: dict,
+    base: Path,
+    work_dir: Path,
+    memory_limit: int | None,
+    cpu_limit: int | None,
+) -> dict:
+    """在单独的目录与环境中测试插件，返回报告中的一项"""
+    name = spec["name"]
+    module = re.sub(r"[^\w.-]", "_", spec["module"])
+    workdir = work_dir / f"{index:04d}-{module}"
+    start = time.perf_counter()
+    await asyncio.to_thread(create_workdir, base, workdir)
 
-    # 测试插件
     test = PluginTest(
-        plugin_name=plugin_name.group(1).strip(),
-        module_name=module_name.group(1).strip(),
-        module_path=module_path.group(1).strip(),
-        github_url=plugin_github_url.group(1).strip(),
-        is_dir=is_dir,
-        config=config.group(1).strip() if config else None,
+        plugin_name=name,
+        module_name=spec["module"],
+        module_path=spec["module_path"],
+        github_url=spec["github_url"],
+        is_dir=spec["is_dir"],
+        path=workdir,
     )
-    await test.run()
+    test.github_output_file = workdir / "github_output"
+    test.github_step_summary_file = workdir / "summary.md"
+    test.log_file = work_dir / "logs" / f"{workdir.name}.log"
+    test.log_file.parent.mkdir(parents=True, exist_ok=True)
+    test.memory_limit = memory_limit
+    test.cpu_limit = cpu_limit
+
+    base_venv = base / VENV_DIRNAME
+    if base_venv.exists():
+        await test.create_overlay_venv(base_venv)
+    try:
+        await test.run()
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        # 只保留完整的测试输出，删除测试目录节省空间
+        await asyncio.to_thread(shutil.rmtree, workdir, True)
+
+    return {
+        "name": name,
+        "module": spec["module"],
+        "result": test._run and error is None,
+        "cached": test._result_hit,
+        "timed_out": test._timed_out,
+        "error": error,
+        "elapsed": round(time.perf_counter() - start, 3),
+        "timings": test._timings,
+        "peak_rss": test._peak_rss,
+        "metadata": test._metadata,
+        "log_path": str(test.log_file),
+    }
+
+
+async def run_batch(
+    specs: list[dict],
+    base: Path,
+    work_dir: Path,
+    workers: int | None = None,
+    memory_limit: int | None = BATCH_MEMORY_LIMIT * 1024**2,
+    cpu_limit: int | None = BATCH_CPU_LIMIT,
+) -> dict:
+    """并发测试多个插件，返回汇总报告
+
+    同时运行的测试数量默认为 CPU 核心数，每个插件在单独的目录与环境中测试，互不影响
+    """
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    semaphore = asyncio.Semaphore(workers)
+
+    async def worker(index: int, spec: dict) -> dict:
+        async with semaphore:
+            return await run_isolated(
+                index, spec, base, work_dir, memory_limit, cpu_limit
+            )
 
+    plugins = await asyncio.gather(
+        *(worker(index, spec) for index, spec in enumerate(specs))
+    )
+    passed = sum(plugin["result"] for plugin in plugins)
+    return {
+        "total": len(plugins),
+        "passed": passed,
+        "failed": len(plugins) - passed,
+        "workers": workers,
+        "elapsed": round(time.perf_counter() - start, 3),
+        "plugins": plugins,
+    }
+
+
+def render_batch_summary(report: dict) -> str:
+    """将批量测试报告转换为 Markdown 摘要"""
+    lines = [
+        "# 🧪 插件批量测试结果",
+        "",
+        f"共 {report['total']} 个插件，{report['passed']} 个通过，{report['failed']} 个未通过。",
+        f"并发数 {report['workers']}，总耗时 {report['elapsed']:.1f} 秒。",
+    ]
+    failed = [plugin for plugin in report["plugins"] if not plugin["result"]]
+    if failed:
+        lines += ["", "| 插件 | 原因 | 耗时 |", "| --- | --- | --- |"]
+        for plugin in failed:
+            if plugin["error"]:
+                reason = plugin["error"]
+            elif plugin["timed_out"]:
+                phase = plugin["timed_out"]
+                reason = f"{TIMING_NAMES.get(phase, phase)}阶段超时"
+            else:
+                reason = f"加载失败，完整输出见 {plugin['log_path']}"
+            # 表格中的竖线需要转义
+            name = plugin["name"].replace("|", "\\|")
+            reason = reason.replace("|", "\\|")
+            lines.append(f"| {name} | {reason} | {plugin['elapsed']:.1f} 秒 |")
+    return "\n".join(lines) + "\n"
 
-async def main():
+
+def probe_url(url: str) -> bool:
+    """检查网址能否访问"""
+    try:
+        with urlopen(Request(url, method="HEAD"), timeout=PREFLIGHT_TIMEOUT):
+            return True
+    except (URLError, OSError, ValueError):
+        return False
+
+
+def list_issue_comments(repo: str, issue_number: int) -> list[dict]:
+    """获取议题下的所有评论
+
+    每页最多 100 条，逐页获取直到最后一页，获取失败时返回已经获取到的评论
+    """
+    comments = []
+    page = 1
+    while True:
+        request = Request(
+            f"https://api.github.com/repos/{repo}/issues/{issue_number}/comments"
+            f"?per_page={COMMENTS_PER_PAGE}&page={page}",
+            headers={"Accept": "application/vnd.github+json"},
+        )
+        if token := os.environ.get("GITHUB_TOKEN"):
+            request.add_header("Authorization", f"Bearer {token}")
+        try:
+            with urlopen(request, timeout=PREFLIGHT_TIMEOUT) as response:
+                data = json.loads(response.read())
+        except (URLError, OSError, ValueError):
+            return comments
+        comments.extend(data)
+        if len(data) < COMMENTS_PER_PAGE:
+            return comments
+        page += 1
+
+
+def is_skip_requested(comments: list[dict]) -> bool:
+    """仓库成员是否评论了跳过插件测试"""
+    return any(
+        (comment.get("body") or "").strip() == SKIP_PLUGIN_TEST_COMMENT
+        and comment.get("author_association") in SKIP_PLUGIN_TEST_ASSOCIATIONS
+        for comment in comments
+    )
+
+
+def get_store_plugins() -> dict[str, dict]:
+    """获取商店中已经发布的插件，获取失败时返回空字典"""
+    try:
+        with urlopen(STORE_PLUGINS_URL, timeout=PREFLIGHT_TIMEOUT) as response:
+            plugins = json.loads(response.read())
+    except (URLError, OSError, ValueError):
+        return {}
+    return plugins if isinstance(plugins, dict) else {}
+
+
+def is_published(
+    test: "PluginTest",
+    author: str | None,
+    metadata: dict[str, str] | None,
+    plugins: dict[str, dict],
+) -> bool:
+    """插件是否已经以完全相同的数据发布过，此时测试结果也不会有变化
+
+    与机器人检查“与上次发布的数据相同”时一样，比较商店中保存的所有数据
+    作者为议题的作者，而不是插件元数据中的作者
+    """
+    old = plugins.get(test.plugin_name)
+    if old is None or metadata is None:
+        return False
+    current = {
+        **metadata,
+        "name": test.plugin_name,
+        "module": test.module_name,
+        "module_path": test.module_path,
+        "github_url": test.github_url,
+        "is_dir": test.is_dir,
+        "author": author,
+    }
+    return all(current.get(key) == value for key, value in old.items())
+
+
+def get_static_metadata(metadata: dict[str, str] | None) -> dict[str, str] | None:
+    """只保留机器人需要的元数据，不完整时返回 None"""
+    if metadata is None or any(name not in metadata for name in STATIC_METADATA_FIELDS):
+        return None
+    return {name: metadata[name] for name in STATIC_METADATA_FIELDS}
+
+
+async def preflight(issue: dict, repo: str) -> tuple[bool, str, dict[str, str] | None]:
+    """预检，判断是否需要运行插件测试
+
+    只做不需要安装插件的检查，网络请求同时进行，耗时在一秒左右
+    返回是否需要测试、原因与静态提取的插件元数据
+    """
+    test = create_plugin_test(issue.get("body") or "")
+    if test is None:
+        return False, "议题中缺少插件信息", None
+
+    url_ok, comments, plugins, source = await asyncio.gather(
+        asyncio.to_thread(probe_url, test.github_url),
+        asyncio.to_thread(list_issue_comments, repo, issue["number"]),
+        asyncio.to_thread(get_store_plugins),
+        asyncio.to_thread(
+            fetch_plugin_source, test.github_url, test.module_path, test.is_dir
+        ),
+    )
+    metadata = extract_plugin_metadata(source) if source else None
+    static_metadata = get_static_metadata(metadata)
+    if is_skip_requested(comments):
+        return False, SKIP_REQUESTED_REASON, static_metadata
+    if not url_ok:
+        return False, f"仓库地址 {test.github_url} 无法访问", static_metadata
+    author = (issue.get("user") or {}).get("login")
+    if is_published(test, author, metadata, plugins):
+        return False, "插件已经以相同的数据发布", static_metadata
+    return True, "需要运行插件测试", static_metadata
+
+
+def event_comment_body() -> str | None:
+    """获取触发事件的评论内容，不是评论事件时返回 None"""
+    if os.environ.get("GITHUB_EVENT_NAME") != "issue_comment":
+        return None
+    with open(os.environ["GITHUB_EVENT_PATH"], encoding="utf8") as f:
+        return json.load(f).get("comment", {}).get("body")
+
+
+def get_issue_from_event() -> dict | None:
+    """从 GitHub 事件中获取需要测试的议题，不需要测试时返回 None"""
     event_path = os.environ.get("GITHUB_EVENT_PATH")
     if not event_path:
         print("未找到 GITHUB_EVENT_PATH，已跳过")
@@ -499,40 +2096,149 @@ async def main():
         print("议题与插件发布无关，已跳过")
         return
 
-    issue_body = issue.get("body")
-    plugin_name = PLUGIN_NAME_PATTERN.search(issue_body)
-    module_name = PLUGIN_MODULE_NAME_PATTERN.search(issue_body)
-    module_path = PLUGIN_MODULE_PATH_PATTERN.search(issue_body)
-    plugin_github_url = PLUGIN_GITHUB_URL_PATTERN.search(issue_body)
-    is_dir_text = IS_DIR_PATTERN.search(issue_body)
-    config = CONFIG_PATTERN.search(issue_body)
-
-    if not (
-        plugin_name
-        and module_name
-        and module_path
-        and plugin_github_url
-        and is_dir_text
-    ):
+    return issue
+
+
+async def main_test() -> None:
+    issue_body = """
+### 插件名称
+github订阅
+
+### 模块名称
+github_sub
+
+### 模块路径
+github_sub
+
+### 仓库地址
+https://github.com/xuanerwa/zhenxun_github_sub
+
+### 是否为目录
+是
+
+### 插件配置项
+```
+SYSTEM_PROXY="http://127.0.0.1:7890"
+```
+    """
+    test = create_plugin_test(issue_body)
+    if test is None:
+        print("议题中没有插件信息，已跳过")
+        return
+
+    # 测试插件
+    await test.run()
+
+
+async def main():
+    issue = get_issue_from_event()
+    if issue is None:
+        return
+
+    issue_body = issue.get("body") or ""
+    test = create_plugin_test(issue_body)
+    if test is None:
         print("议题中没有插件信息，已跳过")
         return
-    is_dir = True
-    if is_dir_text.group(1).strip() == "是":
-        is_dir = True
-    elif is_dir_text.group(1).strip() == "否":
-        is_dir = False
+
+    # 评论强制测试时忽略缓存的测试结果
+    comment = event_comment_body()
+    if comment is not None and comment.strip() == FORCE_TEST_COMMENT:
+        test.force = True
 
     # 测试插件
-    test = PluginTest(
-        plugin_name=plugin_name.group(1).strip(),
-        module_name=module_name.group(1).strip(),
-        module_path=module_path.group(1).strip(),
-        github_url=plugin_github_url.group(1).strip(),
-        is_dir=is_dir,
-        config=config.group(1).strip() if config else None,
-    )
     await test.run()
 
 
+async def main_preflight():
+    """预检，输出 SHOULD_TEST，工作流可以据此跳过插件测试"""
+    start = time.perf_counter()
+    issue = get_issue_from_event()
+    if issue is None:
+        should_test, reason, metadata = False, "事件不需要测试", None
+    else:
+        should_test, reason, metadata = await preflight(
+            issue, os.environ.get("GITHUB_REPOSITORY", "")
+        )
+    elapsed = time.perf_counter() - start
+
+    average = float(os.environ.get(AVERAGE_TEST_MINUTES_ENV) or AVERAGE_TEST_MINUTES)
+    saved = 0 if should_test else average
+    print(f"预检完成，耗时 {elapsed:.2f} 秒：{reason}")
+    if not should_test:
+        print(f"跳过插件测试，预计节省 {saved:.1f} 分钟")
+
+    with open(os.environ.get("GITHUB_OUTPUT", ""), "a", encoding="utf8") as f:
+        f.write(f"SHOULD_TEST={should_test}\n")
+        f.write(f"SAVED_MINUTES={saved}\n")
+        # 只有仓库成员要求跳过时，机器人才将测试视为已跳过，既不是通过也不是失败
+        # 其他原因都可能是临时问题，测试视为未通过，避免没有测试的插件通过检查
+        skipped = reason == SKIP_REQUESTED_REASON
+        f.write(f"SKIPPED={skipped}\n")
+        if not should_test and not skipped:
+            f.write(f"OUTPUT<<EOF\n预检未通过：{reason}\nEOF\n")
+        # 机器人使用静态提取的元数据检查插件信息
+        if metadata:
+            f.write(f"STATIC_METADATA<<EOF\n{json.dumps(metadata)}\nEOF\n")
+    with open(os.environ.get("GITHUB_STEP_SUMMARY", ""), "a", encoding="utf8") as f:
+        f.write(f"插件测试预检：{reason}，耗时 {elapsed:.2f} 秒")
+        f.write(f"，预计节省 {saved:.1f} 分钟\n" if saved else "\n")
+
+
+async def main_batch(args: argparse.Namespace) -> None:
+    """批量测试插件列表中的所有插件"""
+    specs = load_batch(args.batch)
+    work_dir = args.work_dir or Path(
+        os.environ.get("RUNNER_TEMP") or tempfile.gettempdir(), "plugin_test_batch"
+    )
+    report = await run_batch(
+        specs,
+        Path(),
+        work_dir,
+        args.workers,
+        args.memory_limit * 1024**2 if args.memory_limit else None,
+        args.cpu_limit or None,
+    )
+
+    if args.report:
+        with open(args.report, "w", encoding="utf8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    summary = render_batch_summary(report)
+    if summary_file := os.environ.get("GITHUB_STEP_SUMMARY"):
+        with open(summary_file, "a", encoding="utf8") as f:
+            f.write(summary)
+    print(summary)
+
+
 if __name__ == "__main__":
-    run(main())
+    parser = argparse.ArgumentParser(description="插件加载测试")
+    parser.add_argument(
+        "--preflight", action="store_true", help="只进行预检，判断是否需要运行测试"
+    )
+    parser.add_argument(
+        "--batch", type=Path, help="批量测试插件列表中的所有插件，例如 plugins.json"
+    )
+    parser.add_argument("--report", type=Path, help="批量测试报告的保存路径")
+    parser.add_argument("--work-dir", type=Path, help="批量测试的工作目录")
+    parser.add_argument(
+        "--workers", type=int, help="同时测试的插件数量，默认为 CPU 核心数"
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=int,
+        default=BATCH_MEMORY_LIMIT,
+        help="单个插件测试的内存限制（MB），0 表示不限制",
+    )
+    parser.add_argument(
+        "--cpu-limit",
+        type=int,
+        default=BATCH_CPU_LIMIT,
+        help="单个插件测试的 CPU 时间限制（秒），0 表示不限制",
+    )
+    args = parser.parse_args()
+    if args.preflight:
+        run(main_preflight())
+    elif args.batch:
+        run(main_batch(args))
+    else:
+        run(main())
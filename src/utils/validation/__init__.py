@@ -1,44 +1,112 @@
 """验证数据是否符合规范"""
 
-from typing import Any
-
-from pydantic import ValidationError
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
+from .constants import URL_FIELDS
 from .models import PluginPublishInfo, PublishInfo
 from .models import PublishType as PublishType
-from .models import ValidationDict as ValidationDict
-from .utils import translate_errors
+from .models import URLCheckResult
+from .models import ValidationResult as ValidationResult
+from .utils import check_urls, translate_errors
+from .validator import ModelValidator
+
+if TYPE_CHECKING:
+    from pydantic_core import ErrorDetails
 
 validation_model_map: dict[PublishType, type[PublishInfo]] = {
     PublishType.PLUGIN: PluginPublishInfo,
 }
 
+# 每个模型只编译一次验证器
+validators: dict[PublishType, ModelValidator] = {
+    publish_type: ModelValidator(model)
+    for publish_type, model in validation_model_map.items()
+}
+
+
+def get_url_fields(raw_data: dict[str, Any]) -> list[str]:
+    """获取需要检查的网址字段"""
+    return [key for key in URL_FIELDS if raw_data.get(key)]
 
-def validate_info(
-    publish_type: PublishType, raw_data: dict[str, Any]
-) -> ValidationDict:
-    """验证信息是否符合规范"""
-    if publish_type not in validation_model_map:
+
+async def validate_info(
+    publish_type: PublishType,
+    raw_data: dict[str, Any],
+    changed_fields: set[str] | None = None,
+) -> ValidationResult:
+    """验证信息是否符合规范
+
+    changed_fields 为发生变化的字段，未变化的网址会直接使用之前成功的检查结果
+    为 None 时表示所有字段都需要重新检查
+    """
+    if publish_type not in validators:
         raise ValueError("⚠️ 未知的发布类型。")  # pragma: no cover
 
+    # 在验证前并发检查所有网址，验证器直接从上下文中读取结果
+    url_fields = get_url_fields(raw_data)
+    url_results = await check_urls(
+        [raw_data[key] for key in url_fields],
+        allow_stale=[
+            raw_data[key]
+            for key in url_fields
+            if changed_fields is not None and key not in changed_fields
+        ],
+    )
+
     # https://docs.pydantic.dev/latest/usage/validators/#validation-context
     validation_context = {
-        "previous_data": raw_data.get("previous_data"),
         "skip_plugin_test": raw_data.get("skip_plugin_test"),
-        "valid_data": {},
+        "url_results": url_results,
     }
+    data, errors = validators[publish_type].validate(raw_data, validation_context)
+    return check_extra(publish_type, raw_data, data, errors)
 
-    try:
-        data = dict(
-            validation_model_map[publish_type].model_validate(
-                raw_data, context=validation_context
-            )
+
+async def validate_info_many(
+    publish_type: PublishType,
+    raw_data_list: Iterable[dict[str, Any]],
+) -> list[ValidationResult]:
+    """批量验证信息是否符合规范
+
+    所有网址一起并发检查，所有数据在一次调用中完成验证
+    """
+    if publish_type not in validators:
+        raise ValueError("⚠️ 未知的发布类型。")  # pragma: no cover
+
+    raw_data_list = list(raw_data_list)
+    url_results = await check_urls(
+        raw_data[key] for raw_data in raw_data_list for key in get_url_fields(raw_data)
+    )
+    return validate_many(publish_type, raw_data_list, url_results)
+
+
+def validate_many(
+    publish_type: PublishType,
+    raw_data_list: list[dict[str, Any]],
+    url_results: dict[str, URLCheckResult],
+) -> list[ValidationResult]:
+    """使用已有的网址检查结果批量验证信息
+
+    不涉及网络请求，可以在子进程中执行
+    """
+    validation_context = {"url_results": url_results}
+    return [
+        check_extra(publish_type, raw_data, data, errors)
+        for raw_data, (data, errors) in zip(
+            raw_data_list,
+            validators[publish_type].validate_many(raw_data_list, validation_context),
         )
-        errors = []
-    except ValidationError as exc:
-        errors = exc.errors()
-        data: dict[str, Any] = validation_context["valid_data"]
+    ]
 
+
+def check_extra(
+    publish_type: PublishType,
+    raw_data: dict[str, Any],
+    data: dict[str, Any],
+    errors: list["ErrorDetails"],
+) -> ValidationResult:
+    """验证模型之外的规则，并生成验证结果"""
     # 翻译错误
     errors = translate_errors(errors)
 
@@ -51,15 +119,16 @@ def validate_info(
         if previous_data := raw_data.get("previous_data"):
             if old_data := previous_data.get(raw_data["name"]):
                 for old_key, old_value in old_data.items():
-                    if data[old_key] != old_value:
+                    if data.get(old_key) != old_value:
                         break
                 else:
+                    # 只保留冲突的数据，避免错误信息随插件数量增长
                     errors.append(
                         {
                             "loc": ("previous_data",),
                             "msg": "与上次发布的数据相同。",
                             "type": "previous_data",
-                            "ctx": {"previous_data": previous_data, "data": data},
+                            "ctx": {"previous_data": dict(old_data)},
                             "input": None,
                         }
                     )
@@ -98,12 +167,12 @@ def validate_info(
                 }
             )
 
-    return {
-        "valid": not errors,
-        "data": data,
-        "errors": errors,
+    return ValidationResult(
+        valid=not errors,
+        data=data,
+        errors=errors,
         # 方便插件使用的数据
-        "type": publish_type,
-        "name": data.get("name") or raw_data.get("name", ""),
-        "author": data.get("author", ""),
-    }
+        type=publish_type,
+        name=data.get("name") or raw_data.get("name", ""),
+        author=data.get("author", ""),
+    )
@@ -0,0 +1,151 @@
+"""网址检查结果缓存
+
+使用 SQLite 保存，只要持久化缓存所在的目录，就可以在多次运行间复用检查结果
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+
+from .constants import (
+    URL_CACHE_ERROR_TTL,
+    URL_CACHE_FAILURE_TTL,
+    URL_CACHE_MAX_SIZE,
+    URL_CACHE_SUCCESS_TTL,
+)
+from .models import URLCheckResult
+
+SCHEMA_VERSION = 2
+"""缓存表结构版本，与文件中的版本不同时会重建缓存"""
+
+
+class URLCache:
+    """网址检查结果缓存
+
+    成功、失败与出错的结果分别使用不同的有效期，超出最大条数后按 LRU 淘汰
+    """
+
+    def __init__(
+        self,
+        path: Path | str = ":memory:",
+        *,
+        success_ttl: float = URL_CACHE_SUCCESS_TTL,
+        failure_ttl: float = URL_CACHE_FAILURE_TTL,
+        error_ttl: float = URL_CACHE_ERROR_TTL,
+        max_size: int = URL_CACHE_MAX_SIZE,
+    ) -> None:
+        if isinstance(path, Path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self.success_ttl = success_ttl
+        self.failure_ttl = failure_ttl
+        self.error_ttl = error_ttl
+        self.max_size = max_size
+
+        self._conn = sqlite3.connect(path)
+        (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS url_cache")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS url_cache (
+                url TEXT PRIMARY KEY,
+                status_code INTEGER NOT NULL,
+                msg TEXT NOT NULL,
+                default_branch TEXT,
+                sha TEXT,
+                checked_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS url_cache_accessed_at ON url_cache (accessed_at)"
+        )
+        self._conn.commit()
+
+    def ttl(self, status_code: int) -> float:
+        """根据状态码获取结果的有效期"""
+        if status_code == 200:
+            return self.success_ttl
+        if status_code == -1:
+            return self.error_ttl
+        return self.failure_ttl
+
+    def get(self, url: str, allow_stale: bool = False) -> URLCheckResult | None:
+        """获取未过期的检查结果
+
+        allow_stale 为 True 时，成功的结果即使已过期也会返回
+        """
+        row = self._conn.execute(
+            """SELECT status_code, msg, default_branch, sha, checked_at
+            FROM url_cache WHERE url = ?""",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        result, checked_at = URLCheckResult(*row[:4]), row[4]
+        now = time.time()
+        expired = now - checked_at > self.ttl(result.status_code)
+        if expired and not (allow_stale and result.status_code == 200):
+            return None
+
+        self._conn.execute(
+            "UPDATE url_cache SET accessed_at = ? WHERE url = ?", (now, url)
+        )
+        self._conn.commit()
+        return result
+
+    def set(self, url: str, result: URLCheckResult) -> None:
+        """保存检查结果"""
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO url_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (url, *result, now, now),
+        )
+        self._evict()
+        self._conn.commit()
+
+    def _evict(self) -> None:
+        """淘汰超出最大条数的最久未使用的结果"""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM url_cache").fetchone()
+        if count > self.max_size:
+            self._conn.execute(
+                """DELETE FROM url_cache WHERE url IN (
+                    SELECT url FROM url_cache ORDER BY accessed_at LIMIT ?
+                )""",
+                (count - self.max_size,),
+            )
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._conn.execute("DELETE FROM url_cache")
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM url_cache").fetchone()
+        return count
+
+
+_url_cache: URLCache | None = None
+
+
+def get_url_cache() -> URLCache:
+    """获取网址检查结果缓存
+
+    未设置时使用内存缓存，只在当前进程内有效
+    """
+    global _url_cache
+    if _url_cache is None:
+        _url_cache = URLCache()
+    return _url_cache
+
+
+def set_url_cache(cache: URLCache) -> None:
+    """设置网址检查结果缓存"""
+    global _url_cache
+    if _url_cache is not None:
+        _url_cache.close()
+    _url_cache = cache
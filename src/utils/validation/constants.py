@@ -1,3 +1,5 @@
+import re
+
 NAME_MAX_LENGTH = 50
 """名称最大长度"""
 
@@ -11,6 +13,50 @@ PLUGIN_VALID_TYPE = [
 ]
 """插件类型"""
 
+URL_FIELDS = ["github_url"]
+"""需要检查能否访问的网址字段"""
+
+URL_CHECK_CONCURRENCY = 8
+"""同时检查网址的最大数量"""
+
+URL_CHECK_CONNECT_TIMEOUT = 5.0
+"""检查网址时的连接超时时间（秒）"""
+
+URL_CHECK_READ_TIMEOUT = 10.0
+"""检查网址时的读取超时时间（秒）"""
+
+HEAD_FALLBACK_STATUS_CODES = [403, 405, 501]
+"""HEAD 请求返回这些状态码时，改用 GET 请求再试一次"""
+
+GITHUB_API_URL = "https://api.github.com"
+"""GitHub API 地址"""
+
+GITHUB_REPO_URL_PATTERN = re.compile(
+    r"^https?://github\.com/(?P<owner>[\w.-]+)/(?P<repo>[\w.-]+?)(?:\.git)?/?$"
+)
+"""GitHub 仓库地址，只匹配仓库首页"""
+
+GIT_LS_REMOTE_TIMEOUT = 15.0
+"""使用 git ls-remote 检查仓库时的超时时间（秒）"""
+
+URL_CACHE_FILENAME = "url_cache.db"
+"""网址检查结果缓存的文件名"""
+
+URL_CACHE_SUCCESS_TTL = 24 * 60 * 60
+"""网址可以访问时，结果的缓存时间（秒）"""
+
+URL_CACHE_FAILURE_TTL = 60 * 60
+"""网址返回错误状态码时，结果的缓存时间（秒）"""
+
+URL_CACHE_ERROR_TTL = 60
+"""请求出错（状态码为 -1）时，结果的缓存时间（秒）
+
+网络错误多为暂时性的，只短暂缓存，方便下次运行时重试
+"""
+
+URL_CACHE_MAX_SIZE = 10000
+"""网址检查结果缓存的最大条数，超出后淘汰最久未使用的结果"""
+
 # Pydantic 错误信息翻译
 MESSAGE_TRANSLATIONS = {
     "model_type": "值不是合法的字典",
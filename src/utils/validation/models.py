@@ -1,31 +1,49 @@
 import abc
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Annotated, Any, TypedDict
+from typing import TYPE_CHECKING, Annotated, Any, NamedTuple
 
 from pydantic import (
     BaseModel,
     Field,
     StringConstraints,
     ValidationInfo,
-    ValidatorFunctionWrapHandler,
     field_validator,
 )
 from pydantic_core import PydanticCustomError
 
-from .constants import NAME_MAX_LENGTH
-from .utils import check_url
+from .constants import NAME_MAX_LENGTH, PLUGIN_VALID_TYPE
 
 if TYPE_CHECKING:
     from pydantic_core import ErrorDetails
 
 
-class ValidationDict(TypedDict):
+class URLCheckResult(NamedTuple):
+    """网址检查结果"""
+
+    status_code: int
+    """状态码，如果报错则为 -1"""
+    msg: str = ""
+    """错误信息"""
+    default_branch: str | None = None
+    """仓库的默认分支，仅检查 GitHub 仓库时存在"""
+    sha: str | None = None
+    """默认分支最新提交的 SHA，仅检查 GitHub 仓库时存在"""
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """验证结果
+
+    只保存本次发布相关的数据，不引用插件列表等与发布数量相关的数据
+    """
+
     valid: bool
     type: "PublishType"
     name: str
     author: str
-    data: dict[str, Any]
-    errors: "list[ErrorDetails]"
+    data: dict[str, Any] = field(default_factory=dict)
+    errors: "list[ErrorDetails]" = field(default_factory=list)
 
 
 class PublishType(Enum):
@@ -57,34 +75,23 @@ class PublishInfo(abc.ABC, BaseModel):
     ]
     """仓库地址"""
 
-    @field_validator("*", mode="wrap")
-    @classmethod
-    def collect_valid_values(
-        cls, v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo
-    ):
-        """收集验证通过的数据
-
-        NOTE: 其他所有的验证器都应该在这个验证器之前执行
-        所以不能用 after 模式，只能用 before 模式
-        """
-        context = info.context
-        if context is None:  # pragma: no cover
-            raise PydanticCustomError("validation_context", "未获取到验证上下文")
-
-        result = handler(v)
-        context["valid_data"][info.field_name] = result
-        return result
-
     @field_validator("github_url", mode="before")
     @classmethod
-    def github_url_validator(cls, v: str) -> str:
+    def github_url_validator(cls, v: str, info: ValidationInfo) -> str:
+        """网址在验证前已经检查过，这里只需要从上下文中读取结果"""
         if v:
-            status_code, msg = check_url(v)
-            if status_code != 200:
+            context = info.context
+            if context is None:  # pragma: no cover
+                raise PydanticCustomError("validation_context", "未获取到验证上下文")
+
+            result: URLCheckResult = context["url_results"].get(
+                v, URLCheckResult(-1, "网址未经检查")
+            )
+            if result.status_code != 200:
                 raise PydanticCustomError(
                     "github_url",
                     "项目主页无法访问",
-                    {"status_code": status_code, "msg": msg},
+                    {"status_code": result.status_code, "msg": result.msg},
                 )
         return v
 
@@ -103,3 +110,14 @@ class PluginPublishInfo(PublishInfo):
 
     plugin_type: str
     """插件类型"""
+
+    @field_validator("plugin_type", mode="before")
+    @classmethod
+    def plugin_type_validator(cls, v: str) -> str:
+        if v not in PLUGIN_VALID_TYPE:
+            raise PydanticCustomError(
+                "plugin.type",
+                "插件类型不符合规范。",
+                {"valid_types": ", ".join(PLUGIN_VALID_TYPE)},
+            )
+        return v
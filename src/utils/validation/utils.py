@@ -1,25 +1,211 @@
-from functools import cache
+import asyncio
+import os
+from asyncio import subprocess
+from collections.abc import Collection, Iterable
 from typing import TYPE_CHECKING
 
 import httpx
 
-from .constants import MESSAGE_TRANSLATIONS
+from .cache import URLCache, get_url_cache
+from .constants import (
+    GIT_LS_REMOTE_TIMEOUT,
+    GITHUB_API_URL,
+    GITHUB_REPO_URL_PATTERN,
+    HEAD_FALLBACK_STATUS_CODES,
+    MESSAGE_TRANSLATIONS,
+    URL_CHECK_CONCURRENCY,
+    URL_CHECK_CONNECT_TIMEOUT,
+    URL_CHECK_READ_TIMEOUT,
+)
+from .models import URLCheckResult
 
 if TYPE_CHECKING:
     from pydantic_core import ErrorDetails
 
+_client: httpx.AsyncClient | None = None
+_github_token: str | None = None
 
-@cache
-def check_url(url: str) -> tuple[int, str]:
+
+def get_client() -> httpx.AsyncClient:
+    """获取检查网址共用的 HTTP 客户端
+
+    所有请求共用同一个连接池，并尽量使用 HTTP/2 复用连接
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=httpx.Timeout(
+                URL_CHECK_READ_TIMEOUT, connect=URL_CHECK_CONNECT_TIMEOUT
+            ),
+            limits=httpx.Limits(
+                max_connections=URL_CHECK_CONCURRENCY,
+                max_keepalive_connections=URL_CHECK_CONCURRENCY,
+            ),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """关闭共用的 HTTP 客户端"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def set_github_token(token: str | None) -> None:
+    """设置检查 GitHub 仓库时使用的令牌"""
+    global _github_token
+    _github_token = token
+
+
+async def check_github_repo_by_api(
+    owner: str, repo: str, token: str
+) -> URLCheckResult | None:
+    """通过 GitHub API 检查仓库是否存在
+
+    同时获取默认分支与其最新提交的 SHA
+    如果 API 无法使用（例如被限流），则返回 None
+    """
+    client = get_client()
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "Authorization": f"Bearer {token}",
+        "X-GitHub-Api-Version": "2022-11-28",
+    }
+    try:
+        r = await client.get(f"{GITHUB_API_URL}/repos/{owner}/{repo}", headers=headers)
+        if r.status_code == 404:
+            return URLCheckResult(404, "仓库不存在")
+        if r.status_code != 200:
+            return None
+        default_branch = r.json()["default_branch"]
+
+        # 只需要 SHA，不需要提交的详细信息
+        r = await client.get(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}/commits/{default_branch}",
+            headers={**headers, "Accept": "application/vnd.github.sha"},
+        )
+        sha = r.text.strip() if r.status_code == 200 else None
+        return URLCheckResult(200, "", default_branch, sha)
+    except Exception:
+        return None
+
+
+async def check_github_repo_by_git(url: str) -> URLCheckResult:
+    """通过 git ls-remote 检查仓库是否存在
+
+    只会获取默认分支的引用，同时得到默认分支与其最新提交的 SHA
+    """
+    # 仓库不存在时 git 会尝试询问账号密码，需要禁止
+    env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            "ls-remote",
+            "--symref",
+            url,
+            "HEAD",
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+        )
+    except Exception as e:
+        return URLCheckResult(-1, str(e))
+
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            proc.communicate(), timeout=GIT_LS_REMOTE_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return URLCheckResult(-1, "检查仓库超时")
+
+    if proc.returncode != 0:
+        msg = stderr.decode().strip()
+        if "not found" in msg or "terminal prompts disabled" in msg:
+            return URLCheckResult(404, msg)
+        return URLCheckResult(-1, msg)
+
+    # ref: refs/heads/main\tHEAD
+    # 0123456789abcdef0123456789abcdef01234567\tHEAD
+    default_branch = sha = None
+    for line in stdout.decode().splitlines():
+        ref, _, name = line.partition("\t")
+        if name != "HEAD":
+            continue
+        if ref.startswith("ref: refs/heads/"):
+            default_branch = ref.removeprefix("ref: refs/heads/")
+        else:
+            sha = ref
+    return URLCheckResult(200, "", default_branch, sha)
+
+
+async def check_url(url: str) -> URLCheckResult:
     """检查网址是否可以访问
 
-    返回状态码，如果报错则返回 -1
+    GitHub 仓库优先通过 API 检查，API 无法使用时改用 git ls-remote
+    其他网址先发送 HEAD 请求，如果服务器不支持，再使用 GET 请求
+    GET 请求在收到响应头后就会断开，不会下载整个页面
+
+    如果报错则状态码为 -1
     """
+    if match := GITHUB_REPO_URL_PATTERN.match(url):
+        if _github_token and (
+            result := await check_github_repo_by_api(
+                match["owner"], match["repo"], _github_token
+            )
+        ):
+            return result
+        return await check_github_repo_by_git(url)
+
+    client = get_client()
     try:
-        r = httpx.get(url, follow_redirects=True)
-        return r.status_code, ""
+        r = await client.head(url)
+        if r.status_code not in HEAD_FALLBACK_STATUS_CODES:
+            return URLCheckResult(r.status_code)
+        async with client.stream("GET", url) as r:
+            return URLCheckResult(r.status_code)
     except Exception as e:
-        return -1, str(e)
+        return URLCheckResult(-1, str(e))
+
+
+async def check_urls(
+    urls: Iterable[str],
+    concurrency: int = URL_CHECK_CONCURRENCY,
+    cache: URLCache | None = None,
+    allow_stale: Collection[str] = (),
+) -> dict[str, URLCheckResult]:
+    """并发检查多个网址是否可以访问
+
+    返回网址与检查结果的映射，相同的网址只会检查一次
+    缓存中未过期的结果会直接使用，不会重新检查
+    allow_stale 中的网址即使缓存已过期，也会直接使用之前成功的结果
+    """
+    if cache is None:
+        cache = get_url_cache()
+
+    results: dict[str, URLCheckResult] = {}
+    pending: list[str] = []
+    for url in set(urls):
+        if (result := cache.get(url, url in allow_stale)) is not None:
+            results[url] = result
+        else:
+            pending.append(url)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _check(url: str) -> tuple[str, URLCheckResult]:
+        async with semaphore:
+            return url, await check_url(url)
+
+    for url, result in await asyncio.gather(*(_check(url) for url in pending)):
+        cache.set(url, result)
+        results[url] = result
+    return results
 
 
 def translate_errors(errors: list["ErrorDetails"]) -> list["ErrorDetails"]:
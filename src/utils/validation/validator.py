@@ -0,0 +1,88 @@
+"""编译后的发布信息验证器
+
+每个模型只在创建验证器时编译一次，验证通过时不会执行额外的 Python 回调
+验证失败时再从错误信息中找出通过验证的字段，逐个收集其验证后的值
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from pydantic import TypeAdapter, ValidationError
+
+from .models import PublishInfo
+
+if TYPE_CHECKING:
+    from pydantic_core import ErrorDetails
+
+
+class ModelValidator:
+    """发布信息验证器
+
+    同时提供单条与批量验证，返回验证通过的数据与错误信息
+    """
+
+    def __init__(self, model: type[PublishInfo]) -> None:
+        self.model = model
+        self.validator = model.__pydantic_validator__
+        self.list_adapter = TypeAdapter(list[model])
+
+    def validate(
+        self, raw_data: dict[str, Any], context: dict[str, Any]
+    ) -> tuple[dict[str, Any], list["ErrorDetails"]]:
+        """验证单条数据"""
+        try:
+            instance = self.validator.validate_python(raw_data, context=context)
+        except ValidationError as exc:
+            errors = exc.errors()
+            return self._collect_valid_values(raw_data, errors, context), errors
+        return dict(instance), []
+
+    def validate_many(
+        self, raw_data_list: list[dict[str, Any]], context: dict[str, Any]
+    ) -> list[tuple[dict[str, Any], list["ErrorDetails"]]]:
+        """批量验证多条数据
+
+        所有数据在一次调用中完成验证，有数据验证失败时才逐条处理
+        """
+        try:
+            instances = self.list_adapter.validate_python(
+                raw_data_list, context=context
+            )
+        except ValidationError as exc:
+            errors_map: dict[int, list["ErrorDetails"]] = {}
+            for error in exc.errors():
+                index, *loc = error["loc"]
+                error["loc"] = tuple(loc)
+                errors_map.setdefault(index, []).append(error)  # type: ignore
+        else:
+            return [(dict(instance), []) for instance in instances]
+
+        results: list[tuple[dict[str, Any], list["ErrorDetails"]]] = []
+        for index, raw_data in enumerate(raw_data_list):
+            if errors := errors_map.get(index):
+                data = self._collect_valid_values(raw_data, errors, context)
+            else:
+                data = dict(self.validator.validate_python(raw_data, context=context))
+            results.append((data, errors or []))
+        return results
+
+    def _collect_valid_values(
+        self,
+        raw_data: dict[str, Any],
+        errors: list["ErrorDetails"],
+        context: dict[str, Any],
+    ) -> dict[str, Any]:
+        """收集验证通过的字段
+
+        出错的字段不会再次验证，其余字段通过赋值验证得到转换后的值
+        """
+        invalid_fields = {error["loc"][0] for error in errors if error["loc"]}
+        instance = self.model.model_construct()
+        data: dict[str, Any] = {}
+        for name in self.model.model_fields:
+            if name in invalid_fields or name not in raw_data:
+                continue
+            self.validator.validate_assignment(
+                instance, name, raw_data[name], context=context
+            )
+            data[name] = getattr(instance, name)
+        return data
@@ -24,6 +24,7 @@ def pytest_configure(config: pytest.Config) -> None:
         },
         "github_repository": "owner/repo",
         "github_run_id": "123456",
+        "github_token": "token",
         "github_event_path": "event_path",
         "plugin_test_output": "test_output",
         "plugin_test_result": False,
@@ -69,11 +70,15 @@ async def app(app: App, tmp_path: Path, mocker: MockerFixture):
 
 
 @pytest.fixture(autouse=True)
-def _clear_cache(app: App):
-    """每次运行前都清除 cache"""
-    from src.utils.validation.utils import check_url
+async def _clear_cache(app: App):
+    """每次运行前都清除 cache 与运行状态，并重置 HTTP 客户端"""
+    from src.plugins.publish.store import get_state_store
+    from src.utils.validation.cache import get_url_cache
+    from src.utils.validation.utils import close_client
 
-    check_url.cache_clear()
+    get_url_cache().clear()
+    get_state_store().clear()
+    await close_client()
 
 
 @pytest.fixture()
@@ -128,8 +133,13 @@ def mocked_api(respx_mock: MockRouter):
             }
         }
     )
-    respx_mock.get("https://github.com/author/module", name="github_url").respond()
-    respx_mock.get("https://www.baidu.com", name="github_url_failed").respond(404)
+    respx_mock.get(
+        "https://api.github.com/repos/author/module", name="github_url"
+    ).respond(json={"default_branch": "main"})
+    respx_mock.get(
+        "https://api.github.com/repos/author/module/commits/main", name="github_sha"
+    ).respond(text="0123456789abcdef0123456789abcdef01234567")
+    respx_mock.head("https://www.baidu.com", name="github_url_failed").respond(404)
     respx_mock.get(
         "https://pypi.org/pypi/project_link1/json", name="project_link1"
     ).respond()
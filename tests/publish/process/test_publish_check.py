@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Any, cast
 
 import httpx
+import pytest
 from githubkit import Response
 from githubkit.exception import RequestFailed
 from nonebot import get_adapter
@@ -12,6 +13,7 @@ from nonebot.adapters.github import (
     Adapter,
     GitHubBot,
     IssueCommentCreated,
+    IssuesEdited,
     IssuesOpened,
 )
 from nonebot.adapters.github.config import GitHubApp
@@ -19,7 +21,7 @@ from nonebug import App
 from pytest_mock import MockerFixture
 from respx import MockRouter
 
-from tests.publish.utils import generate_issue_body_plugin
+from tests.publish.utils import generate_issue_body_plugin, mock_bot_comment
 
 
 def check_json_data(file: Path, data: Any) -> None:
@@ -128,18 +130,13 @@ async def test_process_publish_check(
             },
             True,
         )
-        ctx.should_call_api(
-            "rest.issues.async_list_comments",
-            {"owner": "AkashiCoin", "repo": "action-test", "issue_number": 80},
-            mock_list_comments_resp,
-        )
         ctx.should_call_api(
             "rest.issues.async_create_comment",
             {
                 "owner": "AkashiCoin",
                 "repo": "action-test",
                 "issue_number": 80,
-                "body": """# 📃 商店发布检查结果\n\n> Plugin: test\n\n**✅ 所有测试通过，一切准备就绪！**\n\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ 项目 <a href="https://github.com/author/module/">https://github.com/author/module</a> GitHub仓库存在。</li><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n""",
+                "body": """# 📃 商店发布检查结果\n\n> Plugin: test\n\n**✅ 所有测试通过，一切准备就绪！**\n\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ 项目 <a href="https://github.com/author/module/">https://github.com/author/module</a> GitHub仓库存在。</li><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n💡 插件加载测试通过的结果会被缓存，如需重新测试，请在当前页面下评论 /retest。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n<!-- ZHENXUNFLOW_STATE {"key":"da5605ac7ec46316e3b664505801b63e003f02aab98cd8dee05ec339b97fe29b","valid":true,"test_result":{"skip":false,"result":true,"metadata":{"description":"description","usage":"usage","plugin_type":"NORMAL","version":"0.1"},"action_url":"https://github.com/owner/repo/actions/runs/123456"}} -->\n""",
             },
             True,
         )
@@ -345,18 +342,13 @@ async def test_process_update_check(
             },
             mock_issues_resp,
         )
-        ctx.should_call_api(
-            "rest.issues.async_list_comments",
-            {"owner": "AkashiCoin", "repo": "action-test", "issue_number": 80},
-            mock_list_comments_resp,
-        )
         ctx.should_call_api(
             "rest.issues.async_create_comment",
             {
                 "owner": "AkashiCoin",
                 "repo": "action-test",
                 "issue_number": 80,
-                "body": """# 📃 商店发布检查结果\n\n> Plugin: test\n\n**✅ 所有测试通过，一切准备就绪！**\n\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ 项目 <a href="https://github.com/author/module/">https://github.com/author/module</a> GitHub仓库存在。</li><li>✅ version: 0.2。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n""",
+                "body": """# 📃 商店发布检查结果\n\n> Plugin: test\n\n**✅ 所有测试通过，一切准备就绪！**\n\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ 项目 <a href="https://github.com/author/module/">https://github.com/author/module</a> GitHub仓库存在。</li><li>✅ version: 0.2。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n💡 插件加载测试通过的结果会被缓存，如需重新测试，请在当前页面下评论 /retest。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n<!-- ZHENXUNFLOW_STATE {"key":"3b47ab3cb9d2f9a1c1a70df0648409225eba196ae5926d12320c8b034ea0f9ad","valid":true,"test_result":{"skip":false,"result":true,"metadata":{"description":"description","usage":"usage","plugin_type":"NORMAL","version":"0.2"},"action_url":"https://github.com/owner/repo/actions/runs/123456"}} -->\n""",
             },
             True,
         )
@@ -540,18 +532,13 @@ async def test_process_update_check_not_modified(
             mock_pulls_resp,
         )
         # 检查是否可以复用评论
-        ctx.should_call_api(
-            "rest.issues.async_list_comments",
-            {"owner": "AkashiCoin", "repo": "action-test", "issue_number": 80},
-            mock_list_comments_resp,
-        )
         ctx.should_call_api(
             "rest.issues.async_create_comment",
             {
                 "owner": "AkashiCoin",
                 "repo": "action-test",
                 "issue_number": 80,
-                "body": """# 📃 商店发布检查结果\n\n> Plugin: test\n\n**⚠️ 在发布检查过程中，我们发现以下问题：**\n\n<pre><code><li>⚠️ previous_data: 与上次发布的数据相同。</li></code></pre>\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ 项目 <a href="https://github.com/author/module/">https://github.com/author/module</a> GitHub仓库存在。</li><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n""",
+                "body": """# 📃 商店发布检查结果\n\n> Plugin: test\n\n**⚠️ 在发布检查过程中，我们发现以下问题：**\n\n<pre><code><li>⚠️ previous_data: 与上次发布的数据相同。</li></code></pre>\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ 项目 <a href="https://github.com/author/module/">https://github.com/author/module</a> GitHub仓库存在。</li><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n💡 插件加载测试通过的结果会被缓存，如需重新测试，请在当前页面下评论 /retest。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n<!-- ZHENXUNFLOW_STATE {"key":"ab54f0aff3ccdb862718c7d58d372faa69f48db0cd526aaf2fe66df1057b1058","valid":false,"test_result":{"skip":false,"result":true,"metadata":{"description":"description","usage":"usage","plugin_type":"NORMAL","version":"0.1"},"action_url":"https://github.com/owner/repo/actions/runs/123456"}} -->\n""",
             },
             True,
         )
@@ -721,18 +708,13 @@ async def test_edit_title(
             },
             True,
         )
-        ctx.should_call_api(
-            "rest.issues.async_list_comments",
-            {"owner": "AkashiCoin", "repo": "action-test", "issue_number": 80},
-            mock_list_comments_resp,
-        )
         ctx.should_call_api(
             "rest.issues.async_create_comment",
             {
                 "owner": "AkashiCoin",
                 "repo": "action-test",
                 "issue_number": 80,
-                "body": """# 📃 商店发布检查结果\n\n> Plugin: test1\n\n**✅ 所有测试通过，一切准备就绪！**\n\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ 项目 <a href="https://github.com/author/module/">https://github.com/author/module</a> GitHub仓库存在。</li><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n""",
+                "body": """# 📃 商店发布检查结果\n\n> Plugin: test1\n\n**✅ 所有测试通过，一切准备就绪！**\n\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ 项目 <a href="https://github.com/author/module/">https://github.com/author/module</a> GitHub仓库存在。</li><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n💡 插件加载测试通过的结果会被缓存，如需重新测试，请在当前页面下评论 /retest。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n<!-- ZHENXUNFLOW_STATE {"key":"aeaa5b0a48c866e7d62256ec38c7f3b7e214e5df6393c5359aad70af02143964","valid":true,"test_result":{"skip":false,"result":true,"metadata":{"description":"description","usage":"usage","plugin_type":"NORMAL","version":"0.1"},"action_url":"https://github.com/owner/repo/actions/runs/123456"}} -->\n""",
             },
             True,
         )
@@ -913,18 +895,13 @@ async def test_edit_title_too_long(
             },
             True,
         )
-        ctx.should_call_api(
-            "rest.issues.async_list_comments",
-            {"owner": "AkashiCoin", "repo": "action-test", "issue_number": 80},
-            mock_list_comments_resp,
-        )
         ctx.should_call_api(
             "rest.issues.async_create_comment",
             {
                 "owner": "AkashiCoin",
                 "repo": "action-test",
                 "issue_number": 80,
-                "body": """# 📃 商店发布检查结果\n\n> Plugin: looooooooooooooooooooooooooooooooooooooooooooooooooooooong\n\n**⚠️ 在发布检查过程中，我们发现以下问题：**\n\n<pre><code><li>⚠️ 名称: 字符过多。<dt>请确保其不超过 50 个字符。</dt></li></code></pre>\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ 项目 <a href="https://github.com/author/module/">https://github.com/author/module</a> GitHub仓库存在。</li><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n""",
+                "body": """# 📃 商店发布检查结果\n\n> Plugin: looooooooooooooooooooooooooooooooooooooooooooooooooooooong\n\n**⚠️ 在发布检查过程中，我们发现以下问题：**\n\n<pre><code><li>⚠️ 名称: 字符过多。<dt>请确保其不超过 50 个字符。</dt></li></code></pre>\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ 项目 <a href="https://github.com/author/module/">https://github.com/author/module</a> GitHub仓库存在。</li><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n💡 插件加载测试通过的结果会被缓存，如需重新测试，请在当前页面下评论 /retest。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n<!-- ZHENXUNFLOW_STATE {"key":"d657b8029acdb7b14c1fbe401e6f2d4a15d4bb738f2fc1aec5f7e5304d029a25","valid":false,"test_result":{"skip":false,"result":true,"metadata":{"description":"description","usage":"usage","plugin_type":"NORMAL","version":"0.1"},"action_url":"https://github.com/owner/repo/actions/runs/123456"}} -->\n""",
             },
             True,
         )
@@ -1041,18 +1018,13 @@ async def test_process_publish_check_not_pass(
             mock_pulls_resp,
         )
         # 检查是否可以复用评论
-        ctx.should_call_api(
-            "rest.issues.async_list_comments",
-            {"owner": "AkashiCoin", "repo": "action-test", "issue_number": 80},
-            mock_list_comments_resp,
-        )
         ctx.should_call_api(
             "rest.issues.async_create_comment",
             {
                 "owner": "AkashiCoin",
                 "repo": "action-test",
                 "issue_number": 80,
-                "body": """# 📃 商店发布检查结果\n\n> Plugin: test\n\n**⚠️ 在发布检查过程中，我们发现以下问题：**\n\n<pre><code><li>⚠️ 仓库地址: 项目主页无法访问</li></code></pre>\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n""",
+                "body": """# 📃 商店发布检查结果\n\n> Plugin: test\n\n**⚠️ 在发布检查过程中，我们发现以下问题：**\n\n<pre><code><li>⚠️ 仓库地址: 项目主页无法访问</li></code></pre>\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n💡 插件加载测试通过的结果会被缓存，如需重新测试，请在当前页面下评论 /retest。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n<!-- ZHENXUNFLOW_STATE {"key":"bf2bddf4e917b1fc923ff0a3309e70e5b48b2b274880a0636b2cbf0379e9ec09","valid":false,"test_result":{"skip":false,"result":true,"metadata":{"description":"description","usage":"usage","plugin_type":"NORMAL","version":"0.1"},"action_url":"https://github.com/owner/repo/actions/runs/123456"}} -->\n""",
             },
             True,
         )
@@ -1343,18 +1315,13 @@ async def test_convert_pull_request_to_draft(
             True,
         )
         # 检查是否可以复用评论
-        ctx.should_call_api(
-            "rest.issues.async_list_comments",
-            {"owner": "AkashiCoin", "repo": "action-test", "issue_number": 80},
-            mock_list_comments_resp,
-        )
         ctx.should_call_api(
             "rest.issues.async_create_comment",
             {
                 "owner": "AkashiCoin",
                 "repo": "action-test",
                 "issue_number": 80,
-                "body": """# 📃 商店发布检查结果\n\n> Plugin: test\n\n**⚠️ 在发布检查过程中，我们发现以下问题：**\n\n<pre><code><li>⚠️ 仓库地址: 项目主页无法访问</li></code></pre>\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n""",
+                "body": """# 📃 商店发布检查结果\n\n> Plugin: test\n\n**⚠️ 在发布检查过程中，我们发现以下问题：**\n\n<pre><code><li>⚠️ 仓库地址: 项目主页无法访问</li></code></pre>\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n💡 插件加载测试通过的结果会被缓存，如需重新测试，请在当前页面下评论 /retest。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n<!-- ZHENXUNFLOW_STATE {"key":"bf2bddf4e917b1fc923ff0a3309e70e5b48b2b274880a0636b2cbf0379e9ec09","valid":false,"test_result":{"skip":false,"result":true,"metadata":{"description":"description","usage":"usage","plugin_type":"NORMAL","version":"0.1"},"action_url":"https://github.com/owner/repo/actions/runs/123456"}} -->\n""",
             },
             True,
         )
@@ -1502,18 +1469,13 @@ async def test_process_publish_check_ready_for_review(
             },
             True,
         )
-        ctx.should_call_api(
-            "rest.issues.async_list_comments",
-            {"owner": "AkashiCoin", "repo": "action-test", "issue_number": 80},
-            mock_list_comments_resp,
-        )
         ctx.should_call_api(
             "rest.issues.async_create_comment",
             {
                 "owner": "AkashiCoin",
                 "repo": "action-test",
                 "issue_number": 80,
-                "body": """# 📃 商店发布检查结果\n\n> Plugin: test\n\n**✅ 所有测试通过，一切准备就绪！**\n\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ 项目 <a href="https://github.com/author/module/">https://github.com/author/module</a> GitHub仓库存在。</li><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n""",
+                "body": """# 📃 商店发布检查结果\n\n> Plugin: test\n\n**✅ 所有测试通过，一切准备就绪！**\n\n\n<details>\n<summary>详情</summary>\n<pre><code><li>✅ 项目 <a href="https://github.com/author/module/">https://github.com/author/module</a> GitHub仓库存在。</li><li>✅ version: 0.1。</li><li>✅ 插件类型: 普通插件。</li><li>✅ 插件 <a href="https://github.com/owner/repo/actions/runs/123456">加载测试</a> 通过。</li></code></pre>\n</details>\n\n---\n\n💡 如需修改信息，请直接修改 issue，机器人会自动更新检查结果。\n💡 当插件加载测试失败时，请发布新版本后在当前页面下评论任意内容以触发测试。\n💡 插件加载测试通过的结果会被缓存，如需重新测试，请在当前页面下评论 /retest。\n\n\n💪 Powered by [ZHENXUNFLOW](https://github.com/zhenxun-org/zhenxunflow)\n<!-- ZHENXUNFLOW -->\n<!-- ZHENXUNFLOW_STATE {"key":"da5605ac7ec46316e3b664505801b63e003f02aab98cd8dee05ec339b97fe29b","valid":true,"test_result":{"skip":false,"result":true,"metadata":{"description":"description","usage":"usage","plugin_type":"NORMAL","version":"0.1"},"action_url":"https://github.com/owner/repo/actions/runs/123456"}} -->\n""",
             },
             True,
         )
@@ -1593,3 +1555,401 @@ async def test_process_publish_check_ready_for_review(
     )
 
     assert mocked_api["github_url"].called
+
+
+async def test_edit_unrelated_content(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter
+) -> None:
+    """修改议题时没有修改发布信息，直接跳过"""
+    from src.plugins.publish import publish_check_matcher
+
+    mock_subprocess_run = mocker.patch(
+        "subprocess.run", side_effect=lambda *args, **kwargs: mocker.MagicMock()
+    )
+
+    async with app.test_matcher(publish_check_matcher) as ctx:
+        adapter = get_adapter(Adapter)
+        bot = ctx.create_bot(
+            base=GitHubBot,
+            adapter=adapter,
+            self_id=GitHubApp(app_id="1", private_key="1"),  # type: ignore
+        )
+        bot = cast(GitHubBot, bot)
+        event_path = Path(__file__).parent.parent / "events" / "issue-edit.json"
+        event = Adapter.payload_to_event("1", "issues", event_path.read_bytes())
+        assert isinstance(event, IssuesEdited)
+
+        ctx.receive_event(bot, event)
+
+    assert mocked_api.calls == []
+    mock_subprocess_run.assert_not_called()
+
+
+async def test_edit_title_only(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter
+) -> None:
+    """只修改议题标题，直接跳过"""
+    from src.plugins.publish import publish_check_matcher
+
+    mock_subprocess_run = mocker.patch(
+        "subprocess.run", side_effect=lambda *args, **kwargs: mocker.MagicMock()
+    )
+
+    event_path = Path(__file__).parent.parent / "events" / "issue-edit.json"
+    payload = json.loads(event_path.read_text(encoding="utf-8"))
+    payload["changes"] = {"title": {"from": "Plugin: old"}}
+
+    async with app.test_matcher(publish_check_matcher) as ctx:
+        adapter = get_adapter(Adapter)
+        bot = ctx.create_bot(
+            base=GitHubBot,
+            adapter=adapter,
+            self_id=GitHubApp(app_id="1", private_key="1"),  # type: ignore
+        )
+        bot = cast(GitHubBot, bot)
+        event = Adapter.payload_to_event("1", "issues", json.dumps(payload))
+        assert isinstance(event, IssuesEdited)
+
+        ctx.receive_event(bot, event)
+
+    assert mocked_api.calls == []
+    mock_subprocess_run.assert_not_called()
+
+
+async def test_get_changed_fields(app: App) -> None:
+    """只有发布信息变化时才需要重新检查"""
+    from src.plugins.publish.utils import get_changed_fields
+    from src.utils.validation import PublishType
+
+    body = generate_issue_body_plugin()
+
+    assert get_changed_fields(body, body + "\n\n补充说明", PublishType.PLUGIN) == set()
+    assert get_changed_fields(
+        body,
+        generate_issue_body_plugin(github_url="https://github.com/author/new"),
+        PublishType.PLUGIN,
+    ) == {"github_url"}
+    assert get_changed_fields(
+        body, generate_issue_body_plugin(config="log_level=INFO"), PublishType.PLUGIN
+    ) == {"config"}
+
+
+@pytest.mark.parametrize(
+    ("login", "skipped"), [("zhenxunflow[bot]", True), ("renovate[bot]", False)]
+)
+async def test_edit_by_bot(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter, login: str, skipped: bool
+) -> None:
+    """机器人自己修改议题时直接跳过，其他机器人的修改仍然需要检查"""
+    from src.plugins.publish import publish_check_matcher
+
+    mock_subprocess_run = mocker.patch(
+        "subprocess.run", side_effect=lambda *args, **kwargs: mocker.MagicMock()
+    )
+    mock_installation_resp = mocker.MagicMock()
+    mock_installation_resp.parsed_data.id = 123
+    mock_issues_resp = mocker.MagicMock()
+    mock_issues_resp.parsed_data.state = "closed"
+
+    event_path = Path(__file__).parent.parent / "events" / "issue-edit.json"
+    payload = json.loads(event_path.read_text(encoding="utf-8"))
+    payload["sender"]["login"] = login
+    payload["changes"]["body"]["from"] = "旧的内容"
+
+    async with app.test_matcher(publish_check_matcher) as ctx:
+        adapter = get_adapter(Adapter)
+        bot = ctx.create_bot(
+            base=GitHubBot,
+            adapter=adapter,
+            self_id=GitHubApp(app_id="1", private_key="1"),  # type: ignore
+        )
+        bot = cast(GitHubBot, bot)
+        bot._app_slug = "zhenxunflow"
+        event = Adapter.payload_to_event("1", "issues", json.dumps(payload))
+        assert isinstance(event, IssuesEdited)
+
+        if not skipped:
+            # 开始检查后发现议题已关闭，不需要后续操作
+            ctx.should_call_api(
+                "rest.apps.async_get_repo_installation",
+                {"owner": "AkashiCoin", "repo": "action-test"},
+                mock_installation_resp,
+            )
+            ctx.should_call_api(
+                "rest.issues.async_get",
+                {"owner": "AkashiCoin", "repo": "action-test", "issue_number": 80},
+                mock_issues_resp,
+            )
+
+        ctx.receive_event(bot, event)
+
+    assert mocked_api.calls == []
+    assert mock_subprocess_run.called is not skipped
+
+
+async def test_edit_inserted_headers(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter
+) -> None:
+    """只插入了缺失的标题时直接跳过"""
+    from src.plugins.publish import publish_check_matcher
+
+    mock_subprocess_run = mocker.patch(
+        "subprocess.run", side_effect=lambda *args, **kwargs: mocker.MagicMock()
+    )
+
+    event_path = Path(__file__).parent.parent / "events" / "issue-edit.json"
+    payload = json.loads(event_path.read_text(encoding="utf-8"))
+    payload["changes"]["body"]["from"] = "插件说明"
+    payload["issue"]["body"] = "### 插件名称\n\n### 模块路径\n\n插件说明"
+
+    async with app.test_matcher(publish_check_matcher) as ctx:
+        adapter = get_adapter(Adapter)
+        bot = ctx.create_bot(
+            base=GitHubBot,
+            adapter=adapter,
+            self_id=GitHubApp(app_id="1", private_key="1"),  # type: ignore
+        )
+        bot = cast(GitHubBot, bot)
+        event = Adapter.payload_to_event("1", "issues", json.dumps(payload))
+        assert isinstance(event, IssuesEdited)
+
+        ctx.receive_event(bot, event)
+
+    assert mocked_api.calls == []
+    mock_subprocess_run.assert_not_called()
+
+
+async def test_ensure_issue_content(app: App, mocker: MockerFixture) -> None:
+    """补全议题内容后返回修改后的内容"""
+    from src.plugins.publish.models import RepoInfo
+    from src.plugins.publish.utils import (
+        ensure_issue_content,
+        is_inserted_headers_only,
+    )
+
+    bot = mocker.AsyncMock()
+    repo_info = RepoInfo(owner="owner", repo="repo")
+
+    body = await ensure_issue_content(bot, repo_info, 1, "插件说明")
+    assert body == (
+        "### 插件名称\n\n### 模块路径\n\n### 仓库地址\n\n### 是否为目录\n\n插件说明"
+    )
+    bot.rest.issues.async_update.assert_awaited_once_with(
+        owner="owner", repo="repo", issue_number=1, body=body
+    )
+    assert is_inserted_headers_only("插件说明", body)
+
+    full_body = generate_issue_body_plugin()
+    assert await ensure_issue_content(bot, repo_info, 1, full_body) == full_body
+    bot.rest.issues.async_update.assert_awaited_once()
+
+    assert not is_inserted_headers_only(full_body, full_body)
+    assert not is_inserted_headers_only("插件说明", "### 插件名称\n\n新的说明")
+    assert not is_inserted_headers_only("插件说明", "其他内容\n\n插件说明")
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+async def test_check_state_not_changed(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter, trusted: bool
+) -> None:
+    """检查所用数据与上次通过的检查相同时，直接跳过
+
+    其他用户复制的检查状态不可信，仍然需要完整检查
+    """
+    from src.plugins.publish import publish_check_matcher
+    from src.plugins.publish.config import PluginTestMetadata, plugin_config
+    from src.plugins.publish.models import CheckState
+    from src.plugins.publish.render import dump_state
+    from src.plugins.publish.store import StateStore, get_state_store, set_state_store
+    from src.plugins.publish.utils import get_check_key, get_plugin_test_result
+    from src.utils.validation import PublishType
+
+    set_state_store(StateStore())
+    mock_subprocess_run = mocker.patch(
+        "subprocess.run", side_effect=lambda *args, **kwargs: mocker.MagicMock()
+    )
+
+    mock_installation = mocker.MagicMock()
+    mock_installation.id = 123
+    mock_installation_resp = mocker.MagicMock()
+    mock_installation_resp.parsed_data = mock_installation
+
+    mock_issue = mocker.MagicMock()
+    mock_issue.pull_request = None
+    mock_issue.title = "Plugin: test"
+    mock_issue.number = 80
+    mock_issue.state = "open"
+    mock_issue.body = generate_issue_body_plugin(plugin_name="test")
+    mock_issue.user.login = "test"
+    mock_issues_resp = mocker.MagicMock()
+    mock_issues_resp.parsed_data = mock_issue
+
+    plugin_config.plugin_test_metadata = PluginTestMetadata(
+        description="description",
+        usage="usage",
+        plugin_type="NORMAL",
+        version="0.1",
+    )
+    plugin_config.plugin_test_result = True
+    test_result = get_plugin_test_result()
+    state = CheckState(
+        key=get_check_key(mock_issue, PublishType.PLUGIN, test_result),
+        valid=True,
+        test_result=test_result,
+    )
+
+    mock_comment = mock_bot_comment(
+        mocker, f"检查结果\n<!-- ZHENXUNFLOW -->\n{dump_state(state)}\n"
+    )
+    if not trusted:
+        mock_comment.user.type = "User"
+    mock_validate = mocker.patch(
+        "src.plugins.publish.validate_info_from_issue", new_callable=mocker.AsyncMock
+    )
+    mock_process = mocker.patch(
+        "src.plugins.publish.process_publish_check", new_callable=mocker.AsyncMock
+    )
+    mock_list_comments_resp = mocker.MagicMock()
+    mock_list_comments_resp.parsed_data = [mock_comment]
+
+    async with app.test_matcher(publish_check_matcher) as ctx:
+        adapter = get_adapter(Adapter)
+        bot = ctx.create_bot(
+            base=GitHubBot,
+            adapter=adapter,
+            self_id=GitHubApp(app_id="1", private_key="1"),  # type: ignore
+        )
+        bot = cast(GitHubBot, bot)
+        event_path = Path(__file__).parent.parent / "events" / "issue-open.json"
+        event = Adapter.payload_to_event("1", "issues", event_path.read_bytes())
+        assert isinstance(event, IssuesOpened)
+
+        ctx.should_call_api(
+            "rest.apps.async_get_repo_installation",
+            {"owner": "AkashiCoin", "repo": "action-test"},
+            mock_installation_resp,
+        )
+        ctx.should_call_api(
+            "rest.issues.async_get",
+            {"owner": "AkashiCoin", "repo": "action-test", "issue_number": 80},
+            mock_issues_resp,
+        )
+        ctx.should_call_api(
+            "rest.issues.async_list_comments",
+            {"owner": "AkashiCoin", "repo": "action-test", "issue_number": 80},
+            mock_list_comments_resp,
+        )
+
+        ctx.receive_event(bot, event)
+
+    # 只运行了准备工作，没有创建分支
+    assert mock_subprocess_run.call_count == 2
+    assert mocked_api.calls == []
+    assert get_state_store().get_metric("skipped_runs") == int(trusted)
+    assert mock_validate.called is not trusted
+    assert mock_process.called is not trusted
+
+
+async def test_comment_issue_reuse(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter
+) -> None:
+    """直接修改获取到的机器人评论，内容无变化时不需要调用接口"""
+    from src.plugins.publish.models import PluginTestResult, RepoInfo
+    from src.plugins.publish.render import render_comment
+    from src.plugins.publish.utils import comment_issue, validate_info_from_issue
+    from src.utils.validation import PublishType
+
+    bot = mocker.MagicMock()
+    issues = bot.rest.issues
+    issues.async_list_comments = mocker.AsyncMock()
+    issues.async_create_comment = mocker.AsyncMock()
+    issues.async_update_comment = mocker.AsyncMock()
+    repo_info = RepoInfo(owner="owner", repo="repo")
+
+    mock_issue = mocker.MagicMock()
+    mock_issue.body = generate_issue_body_plugin(plugin_name="test")
+    mock_issue.user.login = "test"
+    test_result = PluginTestResult(skip=True)
+    result = await validate_info_from_issue(mock_issue, PublishType.PLUGIN, test_result)
+
+    # 没有机器人评论时创建评论
+    await comment_issue(bot, repo_info, 80, result, test_result)
+    assert issues.async_create_comment.await_count == 1
+
+    # 评论被修改过时，与获取到的评论内容比较后更新
+    bot_comment = mock_bot_comment(mocker, "被修改的评论")
+    await comment_issue(bot, repo_info, 80, result, test_result, "key", bot_comment)
+    assert issues.async_update_comment.call_args.kwargs["comment_id"] == 100
+    assert issues.async_update_comment.await_count == 1
+
+    # 内容无变化时不需要调用接口
+    bot_comment.body = await render_comment(result, test_result, True, "key")
+    await comment_issue(bot, repo_info, 80, result, test_result, "key", bot_comment)
+    assert issues.async_update_comment.await_count == 1
+    assert issues.async_create_comment.await_count == 1
+    assert issues.async_list_comments.await_count == 0
+
+
+@pytest.mark.parametrize(
+    ("skipped", "errors"),
+    [(True, ["previous_data"]), (False, ["previous_data", "plugin_test"])],
+)
+async def test_preflight_skipped(
+    app: App,
+    mocker: MockerFixture,
+    mocked_api: MockRouter,
+    skipped: bool,
+    errors: list[str],
+) -> None:
+    """预检跳过测试时使用静态提取的元数据检查
+
+    仓库成员要求跳过时，测试既不算通过也不算失败，其他原因跳过时测试视为未通过
+    """
+    from src.plugins.publish.config import plugin_config
+    from src.plugins.publish.render import render_comment
+    from src.plugins.publish.utils import (
+        get_plugin_test_result,
+        validate_info_from_issue,
+    )
+    from src.utils.validation import PublishType
+
+    mocker.patch.object(plugin_config, "plugin_test_skipped", skipped)
+    mocker.patch.object(plugin_config, "plugin_test_result", False)
+    mocker.patch.object(plugin_config, "plugin_test_metadata", None)
+    mocker.patch.object(
+        plugin_config,
+        "plugin_test_static_metadata",
+        {
+            "description": "description",
+            "usage": "usage",
+            "plugin_type": "NORMAL",
+            "version": "0.1",
+        },
+    )
+    mock_issue = mocker.MagicMock()
+    mock_issue.body = generate_issue_body_plugin()
+    mock_issue.user.login = "author"
+
+    test_result = get_plugin_test_result()
+    assert test_result.skip is skipped
+    result = await validate_info_from_issue(mock_issue, PublishType.PLUGIN, test_result)
+
+    assert [error["type"] for error in result.errors] == errors
+    comment = await render_comment(result, test_result)
+    assert "与上次发布的数据相同" in comment
+    assert ("加载测试</a> 已跳过" in comment) is skipped
+
+
+async def test_should_skip_plugin_test(app: App, mocker: MockerFixture) -> None:
+    """与预检相同，仓库成员的评论首尾有空白时也跳过测试"""
+    from src.plugins.publish.utils import should_skip_plugin_test
+
+    def mock_comment(body: str | None, author_association: str):
+        comment = mocker.MagicMock()
+        comment.body = body
+        comment.author_association = author_association
+        return comment
+
+    assert should_skip_plugin_test([mock_comment(" /skip\n", "MEMBER")])
+    assert not should_skip_plugin_test([mock_comment(" /skip\n", "NONE")])
+    assert not should_skip_plugin_test([mock_comment(None, "OWNER")])
@@ -0,0 +1,212 @@
+from pathlib import Path
+from typing import cast
+
+from nonebot import get_adapter
+from nonebot.adapters.github import Adapter, GitHubBot, WorkflowDispatch
+from nonebot.adapters.github.config import GitHubApp
+from nonebug import App
+from pytest_mock import MockerFixture
+from respx import MockRouter
+
+from tests.publish.utils import generate_issue_body_plugin, mock_bot_comment
+
+
+async def test_publish_recheck(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter
+) -> None:
+    """重新检查所有开启的议题，只更新检查结果发生变化的议题"""
+    from src.plugins.publish import publish_recheck_matcher
+    from src.plugins.publish.config import PluginTestMetadata
+    from src.plugins.publish.models import CheckState, PluginTestResult
+    from src.plugins.publish.render import dump_state, render_comment
+    from src.plugins.publish.utils import validate_info_from_issue
+    from src.utils.validation import PublishType
+
+    mock_subprocess_run = mocker.patch(
+        "subprocess.run", side_effect=lambda *args, **kwargs: mocker.MagicMock()
+    )
+
+    mock_installation = mocker.MagicMock()
+    mock_installation.id = 123
+    mock_installation_resp = mocker.MagicMock()
+    mock_installation_resp.parsed_data = mock_installation
+
+    def mock_issue(number: int):
+        issue = mocker.MagicMock()
+        issue.pull_request = None
+        issue.number = number
+        issue.title = f"Plugin: test{number}"
+        issue.body = generate_issue_body_plugin(plugin_name=f"test{number}")
+        issue.user.login = "test"
+        return issue
+
+    def mock_comments(body: str):
+        resp = mocker.MagicMock()
+        resp.parsed_data = [mock_bot_comment(mocker, body)]
+        return resp
+
+    # 只有伪造的检查结果、检查结果无变化、检查结果发生变化，以及一个拉取请求
+    issue1, issue2, issue3 = mock_issue(1), mock_issue(2), mock_issue(3)
+    pull = mock_issue(4)
+    pull.pull_request = mocker.MagicMock()
+    mock_issues_resp = mocker.MagicMock()
+    mock_issues_resp.parsed_data = [issue1, issue2, issue3, pull]
+
+    test_result = PluginTestResult(
+        result=True,
+        metadata=PluginTestMetadata(
+            description="description",
+            usage="usage",
+            plugin_type="NORMAL",
+            version="0.1",
+        ),
+        action_url="https://github.com/owner/repo/actions/runs/1",
+    )
+    result2 = await validate_info_from_issue(issue2, PublishType.PLUGIN, test_result)
+    comment2 = await render_comment(result2, test_result, True)
+    result3 = await validate_info_from_issue(issue3, PublishType.PLUGIN, test_result)
+    comment3 = await render_comment(result3, test_result, True)
+
+    # 其他用户复制的检查结果不可信，需要重新测试
+    forged_comments = mock_comments(
+        "检查结果\n<!-- ZHENXUNFLOW -->\n"
+        f"{dump_state(CheckState(key='key', valid=True, test_result=test_result))}\n"
+    )
+    forged_comments.parsed_data[0].user.type = "User"
+
+    mock_pull = mocker.MagicMock()
+    mock_pull.number = 5
+    mock_pull_resp = mocker.MagicMock()
+    mock_pull_resp.parsed_data = mock_pull
+
+    async with app.test_matcher(publish_recheck_matcher) as ctx:
+        adapter = get_adapter(Adapter)
+        bot = ctx.create_bot(
+            base=GitHubBot,
+            adapter=adapter,
+            self_id=GitHubApp(app_id="1", private_key="1"),  # type: ignore
+        )
+        bot = cast(GitHubBot, bot)
+        event_path = Path(__file__).parent.parent / "events" / "workflow-dispatch.json"
+        event = Adapter.payload_to_event(
+            "1", "workflow_dispatch", event_path.read_bytes()
+        )
+        assert isinstance(event, WorkflowDispatch)
+
+        repo = {"owner": "AkashiCoin", "repo": "action-test"}
+        ctx.should_call_api(
+            "rest.apps.async_get_repo_installation", repo, mock_installation_resp
+        )
+        ctx.should_call_api(
+            "rest.issues.async_list_for_repo",
+            {
+                **repo,
+                "state": "open",
+                "labels": "Plugin",
+                "per_page": 100,
+                "page": 1,
+            },
+            mock_issues_resp,
+        )
+        ctx.should_call_api(
+            "rest.issues.async_list_comments",
+            {**repo, "issue_number": 1},
+            forged_comments,
+        )
+        ctx.should_call_api(
+            "rest.issues.async_list_comments",
+            {**repo, "issue_number": 2},
+            mock_comments(comment2),
+        )
+        ctx.should_call_api(
+            "rest.issues.async_list_comments",
+            {**repo, "issue_number": 3},
+            mock_comments(
+                "旧的检查结果\n<!-- ZHENXUNFLOW -->\n"
+                f"{dump_state(CheckState(test_result=test_result))}\n"
+            ),
+        )
+        ctx.should_call_api(
+            "rest.pulls.async_create",
+            {
+                **repo,
+                "title": "Plugin: test3",
+                "body": "resolve #3",
+                "base": "master",
+                "head": "publish/issue3",
+            },
+            mock_pull_resp,
+        )
+        ctx.should_call_api(
+            "rest.issues.async_add_labels",
+            {**repo, "issue_number": 5, "labels": ["Plugin"]},
+            True,
+        )
+        ctx.should_call_api(
+            "rest.issues.async_update_comment",
+            {**repo, "comment_id": 100, "body": comment3},
+            True,
+        )
+
+        ctx.receive_event(bot, event)
+
+    # 只有发生变化的议题会创建分支，完成后回到主分支
+    commands = [call.args[0] for call in mock_subprocess_run.call_args_list]
+    assert ["git", "switch", "-C", "publish/issue3"] in commands
+    assert commands[-1] == ["git", "checkout", "master"]
+    assert not any("publish/issue2" in command for command in commands)
+
+
+async def test_load_state(app: App) -> None:
+    """评论中保存的检查状态可以还原"""
+    from src.plugins.publish.models import CheckState, PluginTestResult
+    from src.plugins.publish.render import dump_state, load_state
+
+    state = CheckState(
+        key="key",
+        valid=True,
+        test_result=PluginTestResult(
+            result=True,
+            output="不会保存",
+            metadata={
+                "description": "--> 不会提前结束注释",
+                "usage": "usage",
+                "plugin_type": "NORMAL",
+                "version": "0.1",
+            },
+        ),
+    )
+    marker = dump_state(state)
+
+    assert marker.count("-->") == 1
+    assert load_state(f"评论\n{marker}\n") == state.model_copy(
+        update={"test_result": state.test_result.model_copy(update={"output": ""})}
+    )
+    assert load_state("评论") is None
+    assert load_state("<!-- ZHENXUNFLOW_STATE {} ") is None
+    assert load_state("<!-- ZHENXUNFLOW_STATE [] -->") is None
+
+
+async def test_find_bot_comment(app: App, mocker: MockerFixture) -> None:
+    """只有当前应用的机器人发布的评论才可信"""
+    from src.plugins.publish.utils import find_bot_comment
+
+    bot = mocker.MagicMock()
+    bot.app.app_id = "1"
+    body = "检查结果\n<!-- ZHENXUNFLOW -->\n"
+
+    # 其他用户伪造的评论
+    forged = mock_bot_comment(mocker, body)
+    forged.user.type = "User"
+    forged.user.login = "zhenxunflow[bot]"
+    # 其他应用发布的评论
+    other_app = mock_bot_comment(mocker, body)
+    other_app.performed_via_github_app.id = 2
+    other_app.user.login = "other[bot]"
+    other_app.performed_via_github_app.slug = "other"
+    # 没有标记的评论
+    unmarked = mock_bot_comment(mocker, "其他评论")
+    comment = mock_bot_comment(mocker, body)
+
+    assert find_bot_comment(bot, [forged, other_app, unmarked]) is None
+    assert find_bot_comment(bot, [forged, other_app, unmarked, comment]) is comment
@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+from nonebug import App
+from pytest_mock import MockerFixture
+
+ENV_FILE = Path(__file__).parent.parent.parent / ".env"
+
+
+def load_config(mocker: MockerFixture, env: dict[str, str]):
+    """与 nonebot 相同，通过 .env 中列出的环境变量加载配置"""
+    from nonebot.config import Config as DriverConfig
+
+    from src.plugins.publish.config import Config
+
+    mocker.patch.dict(
+        "os.environ",
+        {
+            "INPUT_CONFIG": '{"base": "master", "plugin_path": "plugins.json"}',
+            "GITHUB_REPOSITORY": "owner/repo",
+            "GITHUB_RUN_ID": "123456",
+            # 插件测试没有运行时，工作流传入的输出都是空字符串
+            "PLUGIN_TEST_RESULT": "",
+            "PLUGIN_TEST_OUTPUT": "",
+            "PLUGIN_TEST_METADATA": "",
+            **env,
+        },
+    )
+    return Config.model_validate(dict(DriverConfig(_env_file=ENV_FILE)))
+
+
+async def test_github_token(app: App, mocker: MockerFixture) -> None:
+    """GitHub 令牌可以通过环境变量设置"""
+    config = load_config(mocker, {"GITHUB_TOKEN": "token"})
+
+    assert config.github_token == "token"
+
+
+async def test_plugin_test_static_metadata(app: App, mocker: MockerFixture) -> None:
+    """静态提取的插件元数据可以通过环境变量设置"""
+    metadata = {
+        "description": "description",
+        "usage": "usage",
+        "plugin_type": "NORMAL",
+        "version": "0.1",
+    }
+    config = load_config(mocker, {"PLUGIN_TEST_STATIC_METADATA": json.dumps(metadata)})
+
+    assert config.plugin_test_metadata is None
+    assert config.plugin_test_static_metadata == metadata
+
+
+async def test_plugin_test_import_time_warning(app: App, mocker: MockerFixture) -> None:
+    """导入耗时的提示阈值可以通过环境变量设置"""
+    assert load_config(mocker, {}).plugin_test_import_time_warning == 1000
+
+    config = load_config(mocker, {"PLUGIN_TEST_IMPORT_TIME_WARNING": "500"})
+
+    assert config.plugin_test_import_time_warning == 500
+
+
+async def test_plugin_test_skipped(app: App, mocker: MockerFixture) -> None:
+    """预检的结果可以通过环境变量设置，没有使用预检时不跳过测试"""
+    assert load_config(mocker, {}).plugin_test_skipped is False
+
+    config = load_config(mocker, {"PLUGIN_TEST_SKIPPED": "True"})
+
+    assert config.plugin_test_skipped is True
@@ -0,0 +1,208 @@
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import jinja2
+from nonebug import App
+from pytest_mock import MockerFixture
+from respx import MockRouter
+
+from tests.publish.utils import generate_issue_body_plugin
+
+
+def render_first(env: jinja2.Environment) -> tuple[str, float]:
+    """第一次渲染评论的结果与耗时"""
+    start = time.perf_counter()
+    comment = env.get_template("comment.md.jinja").render(
+        title="Plugin: test", valid=True, data={"version": "0.1"}, errors=[], state=""
+    )
+    return comment, time.perf_counter() - start
+
+
+async def test_template_cache(
+    app: App, tmp_path: Path, record_property: Callable[[str, object], None]
+) -> None:
+    """保存模板的编译结果后，第一次渲染不需要重新编译"""
+    from src.plugins.publish.render import create_environment
+
+    cache = jinja2.FileSystemBytecodeCache(str(tmp_path), "%s.cache")
+    cold, cold_elapsed = render_first(create_environment(cache))
+    # 三个模板的编译结果都被保存
+    assert len(list(tmp_path.glob("*.cache"))) == 3  # noqa: ASYNC240
+
+    warm, warm_elapsed = render_first(create_environment(cache))
+
+    record_property("first_render_cold", cold_elapsed)
+    record_property("first_render_warm", warm_elapsed)
+    assert warm == cold
+    assert warm_elapsed < cold_elapsed
+
+
+async def test_render_comment_sync(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter
+) -> None:
+    """同步渲染与异步渲染的结果相同"""
+    from src.plugins.publish.models import PluginTestResult
+    from src.plugins.publish.render import render_comment, render_comment_sync
+    from src.plugins.publish.utils import validate_info_from_issue
+    from src.utils.validation import PublishType
+
+    mock_issue = mocker.MagicMock()
+    mock_issue.body = generate_issue_body_plugin(plugin_name="test")
+    mock_issue.user.login = "test"
+    test_result = PluginTestResult(skip=True)
+    result = await validate_info_from_issue(mock_issue, PublishType.PLUGIN, test_result)
+
+    assert render_comment_sync(result, test_result, True) == await render_comment(
+        result, test_result, True
+    )
+
+
+async def test_render_comment_max_length(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter
+) -> None:
+    """评论过长时不显示测试输出"""
+    from src.plugins.publish.constants import COMMENT_MAX_LENGTH
+    from src.plugins.publish.models import PluginTestResult
+    from src.plugins.publish.render import OUTPUT_OMITTED, render_comment_sync
+    from src.plugins.publish.utils import validate_info_from_issue
+    from src.utils.validation import PublishType
+
+    mock_issue = mocker.MagicMock()
+    mock_issue.body = generate_issue_body_plugin(plugin_name="test")
+    mock_issue.user.login = "test"
+    test_result = PluginTestResult(output="a" * COMMENT_MAX_LENGTH)
+    result = await validate_info_from_issue(mock_issue, PublishType.PLUGIN, test_result)
+
+    comment = render_comment_sync(result, test_result)
+
+    assert len(comment) <= COMMENT_MAX_LENGTH
+    assert OUTPUT_OMITTED in comment
+
+
+async def test_render_comment_truncated(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter
+) -> None:
+    """省略测试输出后仍然过长时截断评论，保留评论标记与检查状态"""
+    from src.plugins.publish.constants import NONEFLOW_MARKER
+    from src.plugins.publish.models import PluginTestResult
+    from src.plugins.publish.render import (
+        COMMENT_TRUNCATED,
+        load_state,
+        render_comment_sync,
+    )
+    from src.plugins.publish.utils import validate_info_from_issue
+    from src.utils.validation import PublishType
+
+    mocker.patch("src.plugins.publish.render.COMMENT_MAX_LENGTH", 500)
+    mock_issue = mocker.MagicMock()
+    mock_issue.body = generate_issue_body_plugin(plugin_name="test")
+    mock_issue.user.login = "test"
+    test_result = PluginTestResult(output="a" * 1000)
+    result = await validate_info_from_issue(mock_issue, PublishType.PLUGIN, test_result)
+
+    comment = render_comment_sync(result, test_result, key="key")
+
+    assert len(comment) == 500
+    assert COMMENT_TRUNCATED in comment
+    assert NONEFLOW_MARKER in comment
+    state = load_state(comment)
+    assert state is not None
+    assert state.key == "key"
+
+
+async def test_render_import_time(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter
+) -> None:
+    """显示插件的导入耗时，超过阈值时提示"""
+    from src.plugins.publish.config import plugin_config
+    from src.plugins.publish.models import PluginTestResult
+    from src.plugins.publish.render import render_comment_sync
+    from src.plugins.publish.utils import validate_info_from_issue
+    from src.utils.validation import PublishType
+
+    mock_issue = mocker.MagicMock()
+    mock_issue.body = generate_issue_body_plugin(plugin_name="test")
+    mock_issue.user.login = "test"
+    test_result = PluginTestResult.model_validate(
+        {
+            "result": True,
+            "metadata": {
+                "description": "description",
+                "usage": "usage",
+                "plugin_type": "NORMAL",
+                "version": "0.1",
+                "import_time": {
+                    "total": 1500.0,
+                    "modules": [
+                        {"module": "numpy", "time": 1200.0},
+                        {"module": "module", "time": 300.0},
+                    ],
+                },
+            },
+        }
+    )
+    result = await validate_info_from_issue(mock_issue, PublishType.PLUGIN, test_result)
+
+    comment = render_comment_sync(result, test_result)
+    assert "<summary>导入耗时 1500.0 毫秒</summary>" in comment
+    assert "<li>numpy: 1200.0 毫秒</li><li>module: 300.0 毫秒</li>" in comment
+    assert "超过了 1000" in comment
+    # 导入耗时不属于插件数据
+    assert "import_time" not in result.data
+
+    mocker.patch.object(plugin_config, "plugin_test_import_time_warning", 2000)
+    comment = render_comment_sync(result, test_result)
+    assert "<summary>导入耗时 1500.0 毫秒</summary>" in comment
+    assert "超过了" not in comment
+
+
+async def test_import_time_not_changed(
+    app: App, mocker: MockerFixture, mocked_api: MockRouter
+) -> None:
+    """导入耗时的波动不影响检查数据的哈希值，也不需要修改评论"""
+    from src.plugins.publish.models import PluginTestResult
+    from src.plugins.publish.render import render_comment_sync
+    from src.plugins.publish.utils import (
+        get_check_key,
+        keep_import_time,
+        validate_info_from_issue,
+    )
+    from src.utils.validation import PublishType
+
+    def create_test_result(total: float) -> PluginTestResult:
+        return PluginTestResult.model_validate(
+            {
+                "result": True,
+                "metadata": {
+                    "description": "description",
+                    "usage": "usage",
+                    "plugin_type": "NORMAL",
+                    "version": "0.1",
+                    "import_time": {
+                        "total": total,
+                        "modules": [{"module": "module", "time": total}],
+                    },
+                },
+            }
+        )
+
+    mock_issue = mocker.MagicMock()
+    mock_issue.body = generate_issue_body_plugin(plugin_name="test")
+    mock_issue.user.login = "test"
+    old, new, slow = (
+        create_test_result(100.0),
+        create_test_result(120.0),
+        create_test_result(1500.0),
+    )
+
+    key = get_check_key(mock_issue, PublishType.PLUGIN, old)
+    assert get_check_key(mock_issue, PublishType.PLUGIN, new) == key
+    # 超过提示阈值时评论内容会变化
+    assert get_check_key(mock_issue, PublishType.PLUGIN, slow) != key
+
+    result = await validate_info_from_issue(mock_issue, PublishType.PLUGIN, old)
+    body = render_comment_sync(result, old, True, key)
+    assert render_comment_sync(result, keep_import_time(new, body), True, key) == body
+    assert keep_import_time(slow, body) == slow
+    assert keep_import_time(new, "没有检查状态的评论") == new
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+
+def test_state_store(tmp_path: Path) -> None:
+    """计数保存在文件中，多次运行间累计"""
+    from src.plugins.publish.store import StateStore
+
+    path = tmp_path / "cache" / "state.db"
+    store = StateStore(path)
+    assert store.get_metric("skipped_runs") == 0
+    assert store.incr("skipped_runs") == 1
+    assert store.incr("skipped_runs", 2) == 3
+    store.close()
+
+    store = StateStore(path)
+    assert store.get_metric("skipped_runs") == 3
+    store.clear()
+    assert store.get_metric("skipped_runs") == 0
+    store.close()
@@ -0,0 +1,23 @@
+from nonebug import App
+from pytest_mock import MockerFixture
+
+
+async def test_get_plugin_test_result_static_metadata(
+    app: App, mocker: MockerFixture
+) -> None:
+    """插件测试没有输出元数据时，使用静态提取的元数据"""
+    from src.plugins.publish.config import PluginTestMetadata, plugin_config
+    from src.plugins.publish.utils import get_plugin_test_result
+
+    static_metadata = PluginTestMetadata(
+        description="description", usage="usage", plugin_type="NORMAL", version="0.1"
+    )
+    mocker.patch.object(plugin_config, "plugin_test_metadata", None)
+    mocker.patch.object(plugin_config, "plugin_test_static_metadata", static_metadata)
+    assert get_plugin_test_result().metadata == static_metadata
+
+    metadata = PluginTestMetadata(
+        description="loaded", usage="usage", plugin_type="NORMAL", version="0.2"
+    )
+    mocker.patch.object(plugin_config, "plugin_test_metadata", metadata)
+    assert get_plugin_test_result().metadata == metadata
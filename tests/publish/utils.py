@@ -1,3 +1,8 @@
+from unittest.mock import MagicMock
+
+from pytest_mock import MockerFixture
+
+
 def generate_issue_body_plugin(
     plugin_name: str = "plugin_name",
     module: str = "module",
@@ -6,4 +11,16 @@ def generate_issue_body_plugin(
     github_url: str = "https://github.com/author/module",
     config: str = "log_level=DEBUG",
 ):
-    return f"""### 插件名称\n\n{plugin_name}\n\n### 模块名称\n\n{module}\n\n### 模块路径\n\n{module_path}\n\n### 仓库地址\n\n{github_url}\n\n### 是否为目录\n\n{'是' if is_dir else '否'}\n\n### 插件配置项\n\n```dotenv\n{config}\n```"""
+    return f"""### 插件名称\n\n{plugin_name}\n\n### 模块名称\n\n{module}\n\n### 模块路径\n\n{module_path}\n\n### 仓库地址\n\n{github_url}\n\n### 是否为目录\n\n{"是" if is_dir else "否"}\n\n### 插件配置项\n\n```dotenv\n{config}\n```"""
+
+
+def mock_bot_comment(mocker: MockerFixture, body: str) -> MagicMock:
+    """模拟机器人自己发布的评论"""
+    comment = mocker.MagicMock()
+    comment.id = 100
+    comment.body = body
+    comment.user.type = "Bot"
+    comment.user.login = "zhenxunflow[bot]"
+    comment.performed_via_github_app.id = 1
+    comment.performed_via_github_app.slug = "zhenxunflow"
+    return comment
@@ -0,0 +1,43 @@
+"""异常议题内容语料
+
+用于测试议题解析在最坏情况下的耗时
+"""
+
+from tests.publish.utils import generate_issue_body_plugin
+
+MAX_BODY_LENGTH = 65536
+"""GitHub 议题内容的最大长度"""
+
+LEGACY_ISSUE_PATTERN = r"### {}\s+([^\s#].*?)(?=(?:\s+###|$))"
+"""旧版本中用于匹配议题信息的正则表达式，仅用于对比"""
+LEGACY_CONFIG_PATTERN = r"### 插件配置项\s+```(?:\w+)?\s?([\s\S]*?)```"
+"""旧版本中用于匹配插件配置项的正则表达式，仅用于对比"""
+
+
+def generate_corpus(length: int = MAX_BODY_LENGTH) -> dict[str, str]:
+    """生成指定长度的异常议题内容
+
+    返回 形状 -> 内容 的字典
+    """
+    normal = generate_issue_body_plugin()
+    corpus = {
+        # 正常内容重复多次
+        "normal": (normal + "\n\n") * (length // (len(normal) + 2) + 1),
+        # 标题后全是空白字符
+        "whitespace": "### 插件名称" + " \n\t" * length,
+        # 内容后跟着一长串空白字符，但之后没有标题
+        "trailing_whitespace": "### 插件名称\n\na" + " " * length + "b",
+        # 内容由单词与空白交替组成
+        "interleaved_whitespace": "### 插件名称\n\nx" + " x" * length,
+        # 大量重复的标题
+        "headings": "### 插件名称\n" * length,
+        # 标题后全是 #
+        "hashes": "### 插件名称\n\n" + "#" * length,
+        # 没有结束的代码块
+        "unterminated_fence": "### 插件配置项\n\n```dotenv\n" + "a=b \n" * length,
+        # 大量代码块标记
+        "fences": "### 插件配置项\n\n" + "```\n" * length,
+        # 所有内容在同一行
+        "single_line": "### 插件名称 " + "a " * length,
+    }
+    return {shape: body[:length] for shape, body in corpus.items()}
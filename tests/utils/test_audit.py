@@ -0,0 +1,64 @@
+import json
+from pathlib import Path
+
+from respx import MockRouter
+
+
+def write_index(path: Path) -> None:
+    plugin = {
+        "module": "module",
+        "module_path": "module_path",
+        "description": "description",
+        "usage": "usage",
+        "author": "author",
+        "version": "0.1",
+        "plugin_type": "NORMAL",
+        "is_dir": True,
+        "github_url": "https://github.com/author/module",
+    }
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "plugin_name": plugin,
+                "plugin_type": {**plugin, "plugin_type": "UNKNOWN"},
+                "a" * 51: plugin,
+                "github_url": {**plugin, "github_url": "https://www.baidu.com"},
+            },
+            f,
+        )
+
+
+async def test_audit(tmp_path: Path, mocked_api: MockRouter) -> None:
+    """审计插件列表"""
+    from src.utils.audit import audit, render_summary
+    from src.utils.validation.cache import URLCache
+
+    path = tmp_path / "plugins.json"
+    write_index(path)
+    cache = URLCache(tmp_path / "url_cache.db")
+
+    report = await audit(path, cache, workers=2, chunk_size=2)
+
+    assert report["total"] == 4
+    assert report["invalid"] == 3
+    assert report["url_checked"] == 2
+    assert [
+        (plugin["name"], [error["type"] for error in plugin["errors"]])
+        for plugin in report["plugins"]
+    ] == [
+        ("plugin_type", ["plugin.type"]),
+        ("a" * 51, ["string_too_long"]),
+        ("github_url", ["github_url"]),
+    ]
+    assert mocked_api["github_url"].call_count == 1
+    assert mocked_api["github_url_failed"].call_count == 1
+
+    # 第二次审计直接使用缓存的网址检查结果
+    await audit(path, cache)
+    assert mocked_api["github_url"].call_count == 1
+    assert mocked_api["github_url_failed"].call_count == 1
+    cache.close()
+
+    summary = render_summary(report)
+    assert "共 4 个插件，其中 3 个未通过检查。" in summary
+    assert "| plugin_type | plugin_type: 插件类型不符合规范。 |" in summary
@@ -0,0 +1,124 @@
+import asyncio
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+
+def create_base(path: Path) -> None:
+    """创建一个简单的真寻目录"""
+    (path / "zhenxun" / "plugins").mkdir(parents=True)
+    (path / "poetry.lock").write_text("lock")
+    (path / ".env.dev").write_text("SUPERUSERS=[]")
+    (path / ".venv" / "bin").mkdir(parents=True)
+    (path / ".git").mkdir()
+
+
+def test_create_workdir(tmp_path: Path) -> None:
+    """测试目录不包括虚拟环境，修改测试目录不影响真寻目录"""
+    from src.utils.plugin_test import create_workdir
+
+    base = tmp_path / "zhenxun_bot"
+    create_base(base)
+    # 测试目录在真寻目录中时不会复制自身
+    target = base / "batch" / "plugin"
+    target.parent.mkdir()
+
+    create_workdir(base, target)
+
+    assert sorted(path.name for path in target.iterdir()) == [
+        ".env.dev",
+        "poetry.lock",
+        "zhenxun",
+    ]
+    with open(target / ".env.dev", "a", encoding="utf8") as f:
+        f.write("\nCONFIG=1")
+    assert (base / ".env.dev").read_text() == "SUPERUSERS=[]"
+
+
+async def test_run_batch(tmp_path: Path, mocker: MockerFixture) -> None:
+    """每个插件在单独的目录中并发测试，同时运行的数量不超过限制"""
+    from src.utils.plugin_test import (
+        PluginTest,
+        load_batch,
+        render_batch_summary,
+        run_batch,
+    )
+
+    base = tmp_path / "zhenxun_bot"
+    create_base(base)
+    plugin = {
+        "module": "module",
+        "module_path": "module",
+        "is_dir": True,
+        "github_url": "https://github.com/a/b",
+    }
+    plugins = tmp_path / "plugins.json"
+    plugins.write_text(
+        json.dumps({f"plugin{i}": {**plugin, "module": f"module{i}"} for i in range(5)})
+    )
+
+    running = 0
+    max_running = 0
+    paths = set()
+
+    async def run(self: PluginTest) -> tuple[bool, str]:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        assert (self.path / "poetry.lock").exists()
+        paths.add(self.path)
+        await asyncio.sleep(0.01)
+        running -= 1
+        if self.module_name == "module3":
+            raise RuntimeError("出错了")
+        self._run = self.module_name != "module1"
+        return self._run, ""
+
+    mocker.patch.object(PluginTest, "run", autospec=True, side_effect=run)
+    mocker.patch.object(PluginTest, "create_overlay_venv", autospec=True)
+
+    report = await run_batch(load_batch(plugins), base, tmp_path / "batch", workers=2)
+
+    assert max_running == 2
+    assert len(paths) == 5
+    # 测试完成后删除测试目录
+    assert not any(path.exists() for path in paths)
+    assert report["total"] == 5
+    assert report["passed"] == 3
+    assert [plugin["name"] for plugin in report["plugins"] if not plugin["result"]] == [
+        "plugin1",
+        "plugin3",
+    ]
+    assert report["plugins"][3]["error"] == "RuntimeError: 出错了"
+
+    summary = render_batch_summary(report)
+    assert "共 5 个插件，3 个通过，2 个未通过。" in summary
+    assert "| plugin3 | RuntimeError: 出错了 |" in summary
+
+
+def test_limit_command() -> None:
+    """测试脚本的子进程受到资源限制"""
+    from src.utils.plugin_test import PluginTest
+
+    test = PluginTest("name", "module", "module", "https://github.com/a/b", True)
+    assert test.limit_command() == ""
+
+    test.memory_limit = 1024**3
+    test.cpu_limit = 60
+    script = (
+        "import resource; print(resource.getrlimit(resource.RLIMIT_AS)[0],"
+        " resource.getrlimit(resource.RLIMIT_CPU)[0])"
+    )
+
+    output = subprocess.run(
+        f'{test.limit_command()}{sys.executable} -c "{script}"',
+        shell=True,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    assert output.split() == [str(1024**3), "60"]
@@ -0,0 +1,48 @@
+IMPORT_TIME = """import time: self [us] | cumulative | imported package
+import time:       500 |        500 |   _io
+PLUGIN_TEST_IMPORT_TIME_START
+import time: self [us] | cumulative | imported package
+import time:       200 |        200 |       numpy.core
+import time:      1000 |       1200 |     numpy
+import time:       300 |        300 |       httpx._api
+import time:       100 |        400 |     httpx
+import time:       100 |       1700 |   module
+PLUGIN_TEST_IMPORT_TIME_END
+import time:       700 |        700 | other
+插件加载完成
+"""
+
+
+def test_import_time() -> None:
+    """只记录插件导入期间的耗时，按顶层包汇总"""
+    from src.utils.plugin_test import PluginTest, format_import_time, parse_import_time
+
+    test = PluginTest("name", "module", "module", "https://github.com/a/b", True)
+    for line in IMPORT_TIME.splitlines():
+        test._handle_stderr(line)
+
+    # 导入耗时不显示在测试输出中
+    assert test._output.text() == "    插件加载完成"
+    import_time = parse_import_time(test._import_time_lines)
+    assert import_time == {
+        "total": 1.7,
+        "modules": [
+            {"module": "numpy", "time": 1.2},
+            {"module": "httpx", "time": 0.4},
+            {"module": "module", "time": 0.1},
+        ],
+    }
+    assert format_import_time(import_time) == (
+        "插件导入耗时 1.7 毫秒：numpy 1.2 毫秒，httpx 0.4 毫秒，module 0.1 毫秒"
+    )
+
+
+def test_import_time_top() -> None:
+    """只保留最慢的几个包"""
+    from src.utils.plugin_test import IMPORT_TIME_TOP, parse_import_time
+
+    lines = [f"import time: {i} | {i} | module{i}" for i in range(1, 20)]
+    import_time = parse_import_time(lines)
+
+    assert len(import_time["modules"]) == IMPORT_TIME_TOP
+    assert import_time["modules"][0] == {"module": "module19", "time": 0.0}
@@ -0,0 +1,113 @@
+from collections.abc import Callable
+import re
+import time
+
+import pytest
+
+from tests.publish.utils import generate_issue_body_plugin
+from tests.utils.issue_corpus import (
+    LEGACY_CONFIG_PATTERN,
+    LEGACY_ISSUE_PATTERN,
+    generate_corpus,
+)
+
+
+def test_parse_issue_sections() -> None:
+    """将议题内容拆分为标题与内容"""
+    from src.utils.plugin_test import extract_code_block, parse_issue_sections
+
+    sections = parse_issue_sections(
+        generate_issue_body_plugin(config="log_level=DEBUG\n### 不是标题")
+    )
+
+    assert sections == {
+        "插件名称": "plugin_name",
+        "模块名称": "module",
+        "模块路径": "module_path",
+        "仓库地址": "https://github.com/author/module",
+        "是否为目录": "是",
+        "插件配置项": "```dotenv\nlog_level=DEBUG\n### 不是标题\n```",
+    }
+    assert extract_code_block(sections["插件配置项"]) == "log_level=DEBUG\n### 不是标题"
+
+
+def test_parse_issue_sections_edge_cases() -> None:
+    """空内容、重复标题、单行代码块与不完整的代码块"""
+    from src.utils.plugin_test import extract_code_block, parse_issue_sections
+
+    sections = parse_issue_sections(
+        "前言\n### 插件名称\n\n### 模块名称\nfirst\n### 模块名称\nsecond\n"
+        "### 插件配置项\n\n```dotenv```\n### 仓库地址\n\nurl"
+    )
+
+    assert sections == {
+        "插件名称": "",
+        "模块名称": "first",
+        "插件配置项": "```dotenv```",
+        "仓库地址": "url",
+    }
+    assert extract_code_block(sections["插件配置项"]) == ""
+    assert extract_code_block("```\nSYSTEM_PROXY=1\n```") == "SYSTEM_PROXY=1"
+    assert extract_code_block("```dotenv\nSYSTEM_PROXY=1") is None
+    assert extract_code_block("SYSTEM_PROXY=1") is None
+
+
+def test_parse_issue_sections_over_budget(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """解析超出预算时通过日志记录，不直接打印"""
+    from src.utils import plugin_test
+
+    monkeypatch.setattr(plugin_test, "ISSUE_PARSE_BUDGET", -1)
+
+    with caplog.at_level("WARNING", logger="plugin_test"):
+        plugin_test.parse_issue_sections(generate_issue_body_plugin())
+
+    assert [record.levelname for record in caplog.records] == ["WARNING"]
+    assert "超出预算" in caplog.records[0].getMessage()
+
+
+CORPUS = generate_corpus()
+
+
+@pytest.mark.parametrize("shape", list(CORPUS))
+def test_parse_issue_sections_benchmark(
+    shape: str, record_property: Callable[[str, object], None]
+) -> None:
+    """最大长度的异常议题内容也能在预算时间内解析完成"""
+    from src.utils.plugin_test import (
+        ISSUE_PARSE_BUDGET,
+        extract_code_block,
+        parse_issue_sections,
+    )
+
+    body = CORPUS[shape]
+
+    start = time.perf_counter()
+    sections = parse_issue_sections(body)
+    extract_code_block(sections.get("插件配置项", ""))
+    elapsed = time.perf_counter() - start
+
+    record_property(f"parse_issue_sections:{shape}", elapsed)
+    assert elapsed < ISSUE_PARSE_BUDGET, f"{shape}: {elapsed * 1000:.1f}ms"
+
+
+@pytest.mark.parametrize(
+    ("name", "pattern"),
+    [
+        ("issue", re.compile(LEGACY_ISSUE_PATTERN.format("插件名称"))),
+        ("config", re.compile(LEGACY_CONFIG_PATTERN)),
+    ],
+)
+def test_legacy_pattern_benchmark(
+    name: str, pattern: re.Pattern[str], record_property: Callable[[str, object], None]
+) -> None:
+    """记录旧版正则表达式在异常内容上的耗时，作为对比
+
+    旧版正则在 trailing_whitespace 上的耗时与长度的平方成正比
+    最大长度时需要数秒，这里只使用较短的内容
+    """
+    for shape, body in generate_corpus(4096).items():
+        start = time.perf_counter()
+        pattern.search(body)
+        record_property(f"{name}:{shape}", time.perf_counter() - start)
@@ -0,0 +1,68 @@
+import asyncio
+import sys
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+
+def is_running(pid: int) -> bool:
+    """进程是否仍在运行，已经结束但未被回收的进程不算"""
+    status = Path(f"/proc/{pid}/status")
+    try:
+        return "State:\tZ" not in status.read_text()
+    except FileNotFoundError:
+        return False
+
+
+def test_phase_timeouts(mocker: MockerFixture) -> None:
+    """各阶段的超时时间可以通过环境变量设置"""
+    from src.utils.plugin_test import PHASE_TIMEOUTS, get_phase_timeouts
+
+    mocker.patch.dict("os.environ", {"PLUGIN_TEST_TIMEOUT_INSTALL": "900"})
+
+    assert get_phase_timeouts() == {**PHASE_TIMEOUTS, "install": 900}
+
+
+async def test_kill_process_group() -> None:
+    """结束整个进程组，忽略 SIGTERM 的进程会被强制结束"""
+    from src.utils.plugin_test import kill_process_group
+
+    proc = await asyncio.create_subprocess_shell(
+        f"sleep 30 & echo $!; exec {sys.executable} -c "
+        '"import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); '
+        'print(flush=True); time.sleep(30)"',
+        stdout=asyncio.subprocess.PIPE,
+        start_new_session=True,
+    )
+    assert proc.stdout
+    child = int(await proc.stdout.readline())
+    # 等待 SIGTERM 处理函数设置完成
+    await proc.stdout.readline()
+
+    await kill_process_group(proc, grace=0.2)
+
+    assert proc.returncode == -9
+    assert not is_running(child)
+
+
+async def test_phase_timeout(mocker: MockerFixture) -> None:
+    """进入新阶段时重新计时"""
+    from src.utils.plugin_test import PluginTest
+
+    test = PluginTest("name", "module", "module", "https://github.com/a/b", True)
+    test.timeouts = {"download": 0.2, "install": 0.2}
+
+    test.enter_phase("download")
+    watching = asyncio.ensure_future(test.watch_phases())
+    await asyncio.sleep(0.15)
+    test.enter_phase("install")
+    await asyncio.sleep(0.1)
+    assert not watching.done()
+
+    await asyncio.wait_for(watching, 1)
+    test.log_timeout()
+    test.enter_phase(None)
+
+    assert test._timed_out == "install"
+    assert set(test._timings) == {"download", "install"}
+    assert test._output.text() == "    测试超时：插件安装阶段超过 0 秒"
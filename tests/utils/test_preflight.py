@@ -0,0 +1,198 @@
+import json
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tests.publish.utils import generate_issue_body_plugin
+
+PLUGIN_SOURCE = """
+__plugin_meta__ = PluginMetadata(
+    name="name",
+    description="description",
+    usage="usage",
+    extra=PluginExtraData(author="author", version="0.1", plugin_type=PluginType.NORMAL).dict(),
+)
+"""
+
+PUBLISHED = {
+    "plugin_name": {
+        "module": "module",
+        "module_path": "module_path",
+        "description": "description",
+        "usage": "usage",
+        "author": "test",
+        "version": "0.1",
+        "plugin_type": "NORMAL",
+        "is_dir": True,
+        "github_url": "https://github.com/author/module",
+    }
+}
+
+STATIC_METADATA = {
+    "description": "description",
+    "usage": "usage",
+    "version": "0.1",
+    "plugin_type": "NORMAL",
+}
+
+
+@pytest.fixture
+def mocked_preflight(mocker: MockerFixture):
+    mocker.patch("src.utils.plugin_test.probe_url", return_value=True)
+    mocker.patch("src.utils.plugin_test.list_issue_comments", return_value=[])
+    mocker.patch("src.utils.plugin_test.get_store_plugins", return_value={})
+    mocker.patch(
+        "src.utils.plugin_test.fetch_plugin_source", return_value=PLUGIN_SOURCE
+    )
+
+
+@pytest.mark.parametrize(
+    ("patches", "body", "expected"),
+    [
+        ({}, generate_issue_body_plugin(), (True, "需要运行插件测试")),
+        ({}, "### 插件名称\n\nname", (False, "议题中缺少插件信息")),
+        (
+            {"probe_url": False},
+            generate_issue_body_plugin(),
+            (False, "仓库地址 https://github.com/author/module 无法访问"),
+        ),
+        (
+            {
+                "list_issue_comments": [
+                    {"body": "/skip", "author_association": "NONE"},
+                    {"body": " /skip\n", "author_association": "MEMBER"},
+                ]
+            },
+            generate_issue_body_plugin(),
+            (False, "仓库成员要求跳过插件测试"),
+        ),
+        (
+            {"get_store_plugins": PUBLISHED},
+            generate_issue_body_plugin(),
+            (False, "插件已经以相同的数据发布"),
+        ),
+        (
+            {"get_store_plugins": PUBLISHED},
+            generate_issue_body_plugin(github_url="https://github.com/author/new"),
+            (True, "需要运行插件测试"),
+        ),
+        # 作者不同时机器人不会认为数据相同，需要测试
+        (
+            {
+                "get_store_plugins": {
+                    "plugin_name": {**PUBLISHED["plugin_name"], "author": "other"}
+                }
+            },
+            generate_issue_body_plugin(),
+            (True, "需要运行插件测试"),
+        ),
+    ],
+)
+async def test_preflight(
+    mocker: MockerFixture,
+    mocked_preflight: None,
+    patches: dict,
+    body: str,
+    expected: tuple[bool, str],
+) -> None:
+    """预检只进行不需要安装插件的检查"""
+    from src.utils.plugin_test import preflight
+
+    for name, value in patches.items():
+        mocker.patch(f"src.utils.plugin_test.{name}", return_value=value)
+
+    issue = {"number": 1, "body": body, "user": {"login": "test"}}
+    should_test, reason, metadata = await preflight(issue, "owner/repo")
+    assert (should_test, reason) == expected
+    # 有插件信息时都会静态提取元数据，跳过测试时由机器人使用
+    assert metadata == (STATIC_METADATA if "### 仓库地址" in body else None)
+
+
+@pytest.mark.parametrize(
+    ("patches", "expected"),
+    [
+        (
+            {"probe_url": False},
+            "SHOULD_TEST=False\nSAVED_MINUTES=3.0\nSKIPPED=False\n"
+            "OUTPUT<<EOF\n预检未通过：仓库地址 https://github.com/author/module 无法访问\nEOF\n",
+        ),
+        (
+            {"list_issue_comments": [{"body": "/skip", "author_association": "OWNER"}]},
+            "SHOULD_TEST=False\nSAVED_MINUTES=3.0\nSKIPPED=True\n",
+        ),
+    ],
+)
+async def test_main_preflight(
+    mocker: MockerFixture,
+    mocked_preflight: None,
+    tmp_path: Path,
+    patches: dict,
+    expected: str,
+) -> None:
+    """输出是否需要测试与节省的时间
+
+    只有仓库成员要求跳过时才输出 SKIPPED=True，其他原因跳过时测试视为未通过
+    """
+    from src.utils.plugin_test import main_preflight
+
+    event_path = tmp_path / "event.json"
+    event_path.write_text(
+        json.dumps(
+            {
+                "issue": {
+                    "number": 1,
+                    "state": "open",
+                    "labels": [{"name": "Plugin"}],
+                    "body": generate_issue_body_plugin(),
+                }
+            }
+        )
+    )
+    output = tmp_path / "output"
+    summary = tmp_path / "summary"
+    mocker.patch.dict(
+        "os.environ",
+        {
+            "GITHUB_EVENT_PATH": str(event_path),
+            "GITHUB_EVENT_NAME": "issues",
+            "GITHUB_OUTPUT": str(output),
+            "GITHUB_STEP_SUMMARY": str(summary),
+            "PLUGIN_TEST_AVERAGE_MINUTES": "3",
+        },
+    )
+    for name, value in patches.items():
+        mocker.patch(f"src.utils.plugin_test.{name}", return_value=value)
+
+    await main_preflight()
+
+    assert output.read_text() == (
+        expected + f"STATIC_METADATA<<EOF\n{json.dumps(STATIC_METADATA)}\nEOF\n"
+    )
+    assert "预计节省 3.0 分钟" in summary.read_text()
+
+
+def test_list_issue_comments(mocker: MockerFixture) -> None:
+    """逐页获取所有评论"""
+    from src.utils.plugin_test import list_issue_comments
+
+    pages = [[{"id": i} for i in range(100)], [{"id": 100}]]
+    urls = []
+
+    def urlopen(request, timeout):
+        urls.append(request.full_url)
+        response = mocker.MagicMock()
+        response.__enter__.return_value.read.return_value = json.dumps(
+            pages[len(urls) - 1]
+        )
+        return response
+
+    mocker.patch("src.utils.plugin_test.urlopen", side_effect=urlopen)
+
+    comments = list_issue_comments("owner/repo", 1)
+
+    assert [comment["id"] for comment in comments] == list(range(101))
+    assert urls == [
+        "https://api.github.com/repos/owner/repo/issues/1/comments?per_page=100&page=1",
+        "https://api.github.com/repos/owner/repo/issues/1/comments?per_page=100&page=2",
+    ]
@@ -0,0 +1,176 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def github_env(
+    tmp_path: Path, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """设置测试结果缓存与 GitHub 输出文件"""
+    (tmp_path / "zhenxun").mkdir()
+    monkeypatch.chdir(tmp_path)
+    mocker.patch.dict(
+        "os.environ",
+        {
+            "PLUGIN_TEST_RESULT_CACHE_DIR": str(tmp_path / "results"),
+            "GITHUB_OUTPUT": str(tmp_path / "output"),
+            "GITHUB_STEP_SUMMARY": str(tmp_path / "summary"),
+            "RUNNER_TEMP": str(tmp_path),
+        },
+    )
+    mocker.patch(
+        "src.utils.plugin_test.PluginTest.check_static_metadata", return_value=None
+    )
+    mocker.patch("src.utils.plugin_test.get_repo_sha", return_value="sha")
+    return tmp_path
+
+
+def test_result_key() -> None:
+    """仓库提交或插件配置不同时缓存键不同"""
+    from src.utils.plugin_test import get_result_key
+
+    args = (
+        "https://github.com/a/b",
+        "sha",
+        "module",
+        "module",
+        True,
+        None,
+        "base",
+        "full",
+    )
+    key = get_result_key(*args)
+
+    assert key == get_result_key(*args)
+    assert key != get_result_key(*args[:1], "new", *args[2:])
+    # 模块名称不同时插件的安装位置也不同
+    assert key != get_result_key(*args[:2], "renamed", *args[3:])
+    assert key != get_result_key(*args[:5], "config", *args[6:])
+    assert key != get_result_key(*args[:7], "minimal")
+
+
+def test_result_cache(tmp_path: Path) -> None:
+    """测试结果保存为文件，损坏的文件视为未命中"""
+    from src.utils.plugin_test import ResultCache
+
+    cache = ResultCache(tmp_path / "results")
+    assert cache.get("key") is None
+
+    cache.set("key", {"result": True, "metadata": None, "output": "输出"})
+    assert cache.get("key") == {"result": True, "metadata": None, "output": "输出"}
+    assert [path.name for path in cache.root.iterdir()] == ["key.json"]
+
+    (cache.root / "key.json").write_text("{")
+    assert cache.get("key") is None
+
+
+async def test_run_cached(github_env: Path, mocker: MockerFixture) -> None:
+    """缓存命中时直接输出保存的测试结果，强制测试时重新测试"""
+    from src.utils.plugin_test import PluginTest
+
+    metadata = {"name": "name", "description": "description"}
+
+    async def run_poetry_project(self: PluginTest) -> None:
+        self._run = True
+        self._metadata = metadata
+        self._log_output("插件加载成功")
+
+    async def create_poetry_project(self: PluginTest) -> None:
+        self._create = True
+
+    mocker.patch.object(
+        PluginTest,
+        "create_poetry_project",
+        autospec=True,
+        side_effect=create_poetry_project,
+    )
+    mocker.patch.object(PluginTest, "restore_venv", autospec=True)
+    mocker.patch.object(PluginTest, "save_venv", autospec=True)
+    mock_run = mocker.patch.object(
+        PluginTest, "run_poetry_project", autospec=True, side_effect=run_poetry_project
+    )
+
+    test = PluginTest("name", "module", "module", "https://github.com/a/b", True)
+    result, output = await test.run()
+    assert result
+    assert output.startswith("插件加载成功\n耗时：")
+    assert not test._result_hit
+    assert mock_run.call_count == 1
+
+    # 第二次测试直接使用缓存的结果
+    (github_env / "output").unlink()
+    test = PluginTest("name", "module", "module", "https://github.com/a/b", True)
+    assert await test.run() == (True, "插件加载成功")
+    assert test._result_hit
+    assert mock_run.call_count == 1
+    output = (github_env / "output").read_text()
+    assert "RESULT=True\n" in output
+    assert f"METADATA<<EOF\n{json.dumps(metadata)}\nEOF\n" in output
+    assert "使用缓存的测试结果" in (github_env / "summary").read_text()
+
+    # 强制测试时忽略缓存
+    test = PluginTest("name", "module", "module", "https://github.com/a/b", True)
+    test.force = True
+    await test.run()
+    assert not test._result_hit
+    assert mock_run.call_count == 2
+
+
+async def test_failed_result_not_cached(
+    github_env: Path, mocker: MockerFixture
+) -> None:
+    """失败的测试结果不保存，下次仍然重新测试"""
+    from src.utils.plugin_test import PluginTest
+
+    async def create_poetry_project(self: PluginTest) -> None:
+        self._create = True
+
+    mocker.patch.object(
+        PluginTest,
+        "create_poetry_project",
+        autospec=True,
+        side_effect=create_poetry_project,
+    )
+    mocker.patch.object(PluginTest, "restore_venv", autospec=True)
+    mocker.patch.object(PluginTest, "save_venv", autospec=True)
+    mock_run = mocker.patch.object(PluginTest, "run_poetry_project", autospec=True)
+
+    for _ in range(2):
+        test = PluginTest("name", "module", "module", "https://github.com/a/b", True)
+        result, _ = await test.run()
+        assert not result
+        assert not test._result_hit
+
+    assert mock_run.call_count == 2
+    assert not (github_env / "results").exists() or not any(
+        (github_env / "results").iterdir()
+    )
+
+
+async def test_get_repo_sha_timeout(
+    tmp_path: Path, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """获取提交超时时结束并回收 git 进程"""
+    from src.utils import plugin_test
+
+    git = tmp_path / "git"
+    git.write_text("#!/bin/sh\nsleep 10\n")
+    git.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+    monkeypatch.setattr(plugin_test, "PREFLIGHT_TIMEOUT", 0.01)
+    create_subprocess_exec = plugin_test.asyncio.create_subprocess_exec
+    procs = []
+
+    async def create_git(*args, **kwargs):
+        proc = await create_subprocess_exec(*args, **kwargs)
+        procs.append(proc)
+        return proc
+
+    mocker.patch("asyncio.create_subprocess_exec", side_effect=create_git)
+
+    assert await plugin_test.get_repo_sha("https://github.com/a/b") is None
+    assert procs[0].returncode is not None
@@ -0,0 +1,30 @@
+import pytest
+from pytest_mock import MockerFixture
+
+
+@pytest.mark.parametrize("runner", ["full", "minimal"])
+def test_render_runner(mocker: MockerFixture, runner: str) -> None:
+    """两种运行模式生成的测试脚本都可以运行，并输出相同的元数据"""
+    from src.utils.plugin_test import PluginTest
+
+    mocker.patch.dict("os.environ", {"PLUGIN_TEST_RUNNER": runner})
+    test = PluginTest(
+        "插件名称", "module", "plugins.module", "https://github.com/a/b", True
+    )
+
+    script = test.render_runner()
+
+    compile(script, "runner.py", "exec")
+    assert ("zhenxun/builtin_plugins" in script) == (runner == "full")
+    assert 'print("PLUGIN_TEST_METADATA " + json.dumps(metadata' in script
+    assert '"module_path": "plugins.module"' in script
+
+
+def test_render_runner_unknown(mocker: MockerFixture) -> None:
+    """不支持的运行模式使用完整模式"""
+    from src.utils.plugin_test import PluginTest
+
+    mocker.patch.dict("os.environ", {"PLUGIN_TEST_RUNNER": "unknown"})
+    test = PluginTest("name", "module", "module", "https://github.com/a/b", False)
+
+    assert test.runner == "full"
@@ -0,0 +1,86 @@
+import time
+
+PLUGIN_SOURCE = '''
+from nonebot.plugin import PluginMetadata
+
+from zhenxun.configs.utils import PluginExtraData
+from zhenxun.utils.enum import PluginType
+
+from .config import Config
+
+__version__ = "0.1"
+AUTHOR: str = "author"
+USAGE = """
+    使用方法
+    指令：test
+"""
+
+__plugin_meta__ = PluginMetadata(
+    name="测试插件",
+    description=f"{'测试'}插件",
+    usage=USAGE.strip(),
+    config=Config,
+    extra=PluginExtraData(
+        author=AUTHOR,
+        version=__version__,
+        plugin_type=PluginType.NORMAL,
+        menu_type="功能",
+    ).dict(),
+)
+'''
+
+
+def test_extract_plugin_metadata() -> None:
+    """静态提取插件元数据"""
+    from src.utils.plugin_test import extract_plugin_metadata
+
+    assert extract_plugin_metadata(PLUGIN_SOURCE) == {
+        "description": "测试插件",
+        "usage": "使用方法\n    指令：test",
+        "author": "author",
+        "version": "0.1",
+        "plugin_type": "NORMAL",
+    }
+
+
+def test_extract_plugin_metadata_dict_extra() -> None:
+    """extra 为字典，无法确定的字段会被忽略"""
+    from src.utils.plugin_test import extract_plugin_metadata
+
+    source = """
+from .config import VERSION
+
+__plugin_meta__ = PluginMetadata(
+    name="name",
+    description="description" + "。",
+    usage=get_usage(),
+    extra={"author": "author", "version": VERSION, "plugin_type": "SUPERUSER"},
+)
+"""
+    assert extract_plugin_metadata(source) == {
+        "description": "description。",
+        "author": "author",
+        "plugin_type": "SUPERUSER",
+    }
+
+
+def test_extract_plugin_metadata_not_found() -> None:
+    """没有插件元数据或者语法错误时返回 None，不会执行代码"""
+    from src.utils.plugin_test import extract_plugin_metadata
+
+    assert extract_plugin_metadata("import os\nos.system('exit 1')") is None
+    assert extract_plugin_metadata("__plugin_meta__ = (") is None
+    # 循环引用的变量无法确定
+    assert extract_plugin_metadata(
+        "A = B\nB = A\n__plugin_meta__ = PluginMetadata(usage=A, description='d')"
+    ) == {"description": "d"}
+
+
+def test_extract_plugin_metadata_speed() -> None:
+    """静态提取的耗时远小于一秒"""
+    from src.utils.plugin_test import extract_plugin_metadata
+
+    source = "\n".join(f"VALUE_{i} = {i}" for i in range(1000)) + PLUGIN_SOURCE
+    start = time.perf_counter()
+    assert extract_plugin_metadata(source)
+    assert time.perf_counter() - start < 1
@@ -0,0 +1,154 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+RUNNER = """
+import sys, time
+print("\\x1b[32m10-01 00:00:00 [INFO] nonebot | 开始加载\\x1b[0m", flush=True)
+print("PLUGIN_TEST_PHASE load", flush=True)
+print("缺少依赖 <httpx>", file=sys.stderr, flush=True)
+time.sleep(float(sys.argv[1]))
+"""
+
+
+def test_output_buffer() -> None:
+    """超出上限时省略中间的部分"""
+    from src.utils.plugin_test import OutputBuffer
+
+    buffer = OutputBuffer(max_lines=10)
+    for i in range(25):
+        buffer.append(str(i))
+
+    assert buffer.text().splitlines() == [
+        "0",
+        "1",
+        "... 省略 15 行，完整输出见日志文件 ...",
+        *[str(i) for i in range(17, 25)],
+    ]
+
+
+@pytest.mark.parametrize("read_size", [3, 64 * 1024])
+async def test_read_lines(monkeypatch: pytest.MonkeyPatch, read_size: int) -> None:
+    """逐行读取输出，超长的行、跨多次读取的行与没有换行符的最后一行都能读取"""
+    from src.utils import plugin_test
+    from src.utils.plugin_test import read_lines
+
+    monkeypatch.setattr(plugin_test, "OUTPUT_READ_SIZE", read_size)
+
+    stream = asyncio.StreamReader()
+    stream.feed_data(b"a" * 100000 + b"\r\nb\n")
+    stream.feed_data("中文".encode())
+    stream.feed_eof()
+
+    lines = []
+    await read_lines(stream, lines.append)
+
+    assert lines == ["a" * 100000, "b", "中文"]
+
+
+@pytest.mark.parametrize(("sleep", "result"), [(0, True), (10, False)])
+async def test_stream_output(
+    tmp_path: Path,
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    sleep: int,
+    result: bool,
+) -> None:
+    """测试输出去除 ANSI 转义字符后实时写入日志文件与作业摘要，超时时保留已有的输出"""
+    from src.utils import plugin_test
+    from src.utils.plugin_test import PluginTest
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "zhenxun").mkdir()
+    mocker.patch.dict(
+        "os.environ",
+        {
+            "GITHUB_OUTPUT": str(tmp_path / "output"),
+            "GITHUB_STEP_SUMMARY": str(tmp_path / "summary"),
+            "RUNNER_TEMP": str(tmp_path),
+        },
+    )
+    mocker.patch.object(PluginTest, "check_static_metadata", autospec=True)
+    mocker.patch.dict(plugin_test.PHASE_TIMEOUTS, {"load": 1})
+    create_subprocess_shell = plugin_test.create_subprocess_shell
+
+    async def run_runner(cmd: str, **kwargs):
+        return await create_subprocess_shell(
+            f"{sys.executable} -c '{RUNNER}' {sleep}", **kwargs
+        )
+
+    mocker.patch.object(plugin_test, "create_subprocess_shell", new=run_runner)
+
+    test = PluginTest("name", "module", "module", "https://github.com/a/b", True)
+    _, output = await test.run()
+
+    assert test._run is result
+    assert test._timed_out == (None if result else "load")
+    assert "load" in test._timings
+    assert "    10-01 00:00:00 [INFO] nonebot | 开始加载\n" in output
+    assert "    缺少依赖 <httpx>" in output
+    assert "PLUGIN_TEST_PHASE" not in output
+    assert ("测试超时：插件加载阶段超过 1 秒" in output) is not result
+    assert (tmp_path / "plugin_test_output.log").read_text() == output + "\n"
+    summary = (tmp_path / "summary").read_text()
+    assert "缺少依赖 &lt;httpx&gt;" in summary
+    assert "</code></pre></details>" in summary
+
+
+async def test_stream_output_error(
+    tmp_path: Path, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """处理输出出错时测试视为失败，并结束测试进程"""
+    from src.utils import plugin_test
+    from src.utils.plugin_test import PluginTest
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "zhenxun").mkdir()
+    mocker.patch.dict(
+        "os.environ",
+        {
+            "GITHUB_OUTPUT": str(tmp_path / "output"),
+            "GITHUB_STEP_SUMMARY": str(tmp_path / "summary"),
+            "RUNNER_TEMP": str(tmp_path),
+        },
+    )
+    mocker.patch.object(PluginTest, "check_static_metadata", autospec=True)
+    mocker.patch.object(
+        PluginTest, "_handle_stdout", autospec=True, side_effect=ValueError("出错了")
+    )
+    create_subprocess_shell = plugin_test.create_subprocess_shell
+    procs = []
+
+    async def run_runner(cmd: str, **kwargs):
+        proc = await create_subprocess_shell(
+            f"{sys.executable} -c '{RUNNER}' 10", **kwargs
+        )
+        procs.append(proc)
+        return proc
+
+    mocker.patch.object(plugin_test, "create_subprocess_shell", new=run_runner)
+
+    test = PluginTest("name", "module", "module", "https://github.com/a/b", True)
+    _, output = await test.run()
+
+    assert test._run is False
+    assert "读取测试输出出错：ValueError('出错了')" in output
+    assert procs[0].returncode is not None
+
+
+def test_handle_stdout_invalid(caplog: pytest.LogCaptureFixture) -> None:
+    """插件输出无法解析的元数据与峰值内存时记录警告，不影响测试"""
+    from src.utils.plugin_test import METADATA_PREFIX, PEAK_RSS_PREFIX, PluginTest
+
+    test = PluginTest("name", "module", "module", "https://github.com/a/b", True)
+    with caplog.at_level("WARNING", logger="plugin_test"):
+        test._handle_stdout(f"{METADATA_PREFIX}{{bad")
+        test._handle_stdout(f"{PEAK_RSS_PREFIX}bad")
+
+    assert test._metadata is None
+    assert test._peak_rss is None
+    assert [record.levelname for record in caplog.records] == ["WARNING", "WARNING"]
+    assert f"    {METADATA_PREFIX}{{bad" in test._output.text()
@@ -0,0 +1,59 @@
+def generate_output(noise: int) -> str:
+    """生成插件测试输出，中间包含错误日志与 Traceback"""
+    lines = [f"    10-01 00:00:00 [INFO] nonebot | 第 {i} 行" for i in range(noise)]
+    lines += [
+        "    10-01 00:00:00 [ERROR] nonebot | 插件加载失败",
+        "    Traceback (most recent call last):",
+        '      File "runner.py", line 1, in <module>',
+        "        import module",
+        "",
+        '    > File "module.py", line 2',
+        "    ModuleNotFoundError: No module named 'httpx'",
+    ]
+    lines += [f"    10-01 00:00:00 [INFO] nonebot | 第 {i} 行" for i in range(noise)]
+    return "\n".join(lines)
+
+
+def test_summarize_short_output() -> None:
+    """输出不长时保持不变"""
+    from src.utils.plugin_test import summarize_output
+
+    output = generate_output(10)
+    assert summarize_output(output) == output
+
+
+def test_summarize_output() -> None:
+    """保留开头与结尾，以及中间的错误与 Traceback"""
+    from src.utils.plugin_test import (
+        OUTPUT_HEAD_LINES,
+        OUTPUT_TAIL_LINES,
+        summarize_output,
+    )
+
+    output = generate_output(1000)
+    lines = output.splitlines()
+
+    summary = summarize_output(output, 20000)
+    summary_lines = summary.splitlines()
+
+    assert len(summary) <= 20000
+    assert summary_lines[:OUTPUT_HEAD_LINES] == lines[:OUTPUT_HEAD_LINES]
+    assert summary_lines[-OUTPUT_TAIL_LINES:] == lines[-OUTPUT_TAIL_LINES:]
+    assert summary_lines[OUTPUT_HEAD_LINES : OUTPUT_HEAD_LINES + 9] == [
+        "... 省略 960 行 ...",
+        *lines[1000:1007],
+        f"... 省略 {1000 - OUTPUT_TAIL_LINES} 行 ...",
+    ]
+
+
+def test_summarize_output_max_length() -> None:
+    """摘要仍然过长时截断中间的内容，优先保留结尾"""
+    from src.utils.plugin_test import summarize_output
+
+    output = generate_output(1000)
+
+    summary = summarize_output(output, 2000)
+
+    assert len(summary) <= 2000
+    assert "测试输出过长，已省略部分内容" in summary
+    assert summary.endswith(output[-1000:])
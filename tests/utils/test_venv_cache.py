@@ -0,0 +1,126 @@
+# ruff: noqa: ASYNC221
+
+import os
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+
+def create_venv(path: Path, size: int = 100) -> None:
+    """创建一个简单的虚拟环境目录"""
+    (path / "bin").mkdir(parents=True)
+    (path / "bin" / "python3").write_bytes(b"python")
+    (path / "bin" / "python").symlink_to("python3")
+    (path / "lib.py").write_bytes(b"a" * size)
+
+
+def test_parse_requirements() -> None:
+    """写法不同的相同依赖得到相同的结果"""
+    from src.utils.plugin_test import get_venv_key, parse_requirements
+
+    requirements = parse_requirements("# 注释\nHttpx >= 0.24\n\nnonebot2\nhttpx>=0.24")
+    assert requirements == ["httpx>=0.24", "nonebot2"]
+    assert get_venv_key("base", requirements) == get_venv_key(
+        "base", parse_requirements("nonebot2  # 注释\nhttpx>=0.24")
+    )
+    assert get_venv_key("base", requirements) != get_venv_key("new", requirements)
+
+
+def test_venv_cache(tmp_path: Path) -> None:
+    """缓存命中时复制环境，修改复制的环境不影响缓存"""
+    from src.utils.plugin_test import VenvCache
+
+    cache = VenvCache(tmp_path / "cache")
+    venv = tmp_path / "project" / ".venv"
+    create_venv(venv)
+
+    assert not cache.restore("key", venv)
+    cache.save("key", venv)
+    (venv / "lib.py").unlink()
+
+    assert cache.restore("key", venv)
+    assert (venv / "lib.py").read_bytes() == b"a" * 100
+    assert (venv / "bin" / "python").is_symlink()
+    assert not os.path.samefile(venv / "lib.py", cache.envs_dir / "key" / "lib.py")
+    with open(venv / "lib.py", "ab") as f:
+        f.write(b"b")
+    assert (cache.envs_dir / "key" / "lib.py").read_bytes() == b"a" * 100
+
+
+def test_venv_cache_evict(tmp_path: Path) -> None:
+    """总大小超出限制时删除最久未使用的环境"""
+    from src.utils.plugin_test import VenvCache
+
+    cache = VenvCache(tmp_path / "cache", max_size=3100)
+    for i, key in enumerate(["old", "used", "new"]):
+        venv = tmp_path / key / ".venv"
+        create_venv(venv, 1000)
+        cache.save(key, venv)
+        os.utime(cache.envs_dir / key, (i, i))
+
+    # 使用过的环境不会被优先删除
+    cache.restore("old", tmp_path / "restored")
+    venv = tmp_path / "latest" / ".venv"
+    create_venv(venv, 1000)
+    cache.save("latest", venv)
+
+    assert sorted(path.name for path in cache.envs_dir.iterdir()) == [
+        "latest",
+        "new",
+        "old",
+    ]
+
+
+async def test_overlay_venv(tmp_path: Path, mocker: MockerFixture) -> None:
+    """叠加环境可以导入基础环境中的包，安装的包不影响基础环境
+
+    叠加环境创建在真寻虚拟环境旁边，真寻虚拟环境保持不变
+    """
+    import subprocess
+    import sys
+
+    from src.utils.plugin_test import (
+        PluginTest,
+        VenvCache,
+        get_site_packages,
+        is_overlay_venv,
+    )
+
+    project = tmp_path / "project"
+    venv = project / ".venv"
+    subprocess.run(
+        [sys.executable, "-m", "venv", "--without-pip", str(venv)], check=True
+    )
+    (get_site_packages(venv) / "base_module.py").write_text("VALUE = 1")  # type: ignore
+
+    cache = VenvCache(tmp_path / "cache")
+    base = cache.snapshot_base("base", venv)
+    assert base is not None
+
+    mocker.patch.object(
+        PluginTest, "path", new_callable=mocker.PropertyMock, return_value=project
+    )
+    test = PluginTest("name", "module", "module", "https://github.com/a/b", True)
+    await test.create_overlay_venv(base)
+
+    overlay = test.venv_path
+    assert overlay == project / ".venv.overlay"
+    assert is_overlay_venv(overlay)
+    assert not is_overlay_venv(venv)
+    assert test.get_env()["VIRTUAL_ENV"] == str(overlay.resolve())
+    # 叠加环境不会被当作基础环境
+    assert cache.snapshot_base("other", overlay) is None
+    (get_site_packages(overlay) / "plugin_module.py").write_text("VALUE = 2")  # type: ignore
+    output = subprocess.run(
+        [
+            str(overlay / "bin" / "python"),
+            "-c",
+            "import base_module, plugin_module; print(base_module.VALUE + plugin_module.VALUE)",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    assert output.strip() == "3"
+    assert not (get_site_packages(base) / "plugin_module.py").exists()  # type: ignore
+    assert not (get_site_packages(venv) / "plugin_module.py").exists()  # type: ignore
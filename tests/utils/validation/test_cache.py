@@ -0,0 +1,106 @@
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+from respx import MockRouter
+
+
+def test_url_cache_ttl(mocker: MockerFixture) -> None:
+    """成功、失败与出错的结果使用不同的有效期"""
+    from src.utils.validation.cache import URLCache
+    from src.utils.validation.models import URLCheckResult
+
+    mock_time = mocker.patch("time.time", return_value=1000)
+
+    cache = URLCache(success_ttl=100, failure_ttl=50, error_ttl=10)
+    cache.set("https://example.com/ok", URLCheckResult(200))
+    cache.set("https://example.com/404", URLCheckResult(404))
+    cache.set("https://example.com/error", URLCheckResult(-1, "timeout"))
+
+    mock_time.return_value = 1020
+    assert cache.get("https://example.com/ok") == URLCheckResult(200)
+    assert cache.get("https://example.com/404") == URLCheckResult(404)
+    assert cache.get("https://example.com/error") is None
+
+    mock_time.return_value = 1060
+    assert cache.get("https://example.com/ok") == URLCheckResult(200)
+    assert cache.get("https://example.com/404") is None
+
+    mock_time.return_value = 1110
+    assert cache.get("https://example.com/ok") is None
+
+
+def test_url_cache_lru(mocker: MockerFixture) -> None:
+    """超出最大条数时淘汰最久未使用的结果"""
+    from src.utils.validation.cache import URLCache
+    from src.utils.validation.models import URLCheckResult
+
+    mock_time = mocker.patch("time.time", return_value=1000)
+
+    cache = URLCache(max_size=2)
+    cache.set("https://example.com/1", URLCheckResult(200))
+    mock_time.return_value = 1001
+    cache.set("https://example.com/2", URLCheckResult(200))
+    mock_time.return_value = 1002
+    assert cache.get("https://example.com/1") == URLCheckResult(200)
+
+    mock_time.return_value = 1003
+    cache.set("https://example.com/3", URLCheckResult(200))
+
+    assert len(cache) == 2
+    assert cache.get("https://example.com/1") == URLCheckResult(200)
+    assert cache.get("https://example.com/2") is None
+    assert cache.get("https://example.com/3") == URLCheckResult(200)
+
+
+def test_url_cache_persistent(tmp_path: Path) -> None:
+    """缓存保存在文件中，可以在多次运行间复用"""
+    from src.utils.validation.cache import URLCache
+    from src.utils.validation.models import URLCheckResult
+
+    path = tmp_path / "cache" / "url_cache.db"
+    cache = URLCache(path)
+    cache.set("https://example.com/", URLCheckResult(200))
+    cache.close()
+
+    assert URLCache(path).get("https://example.com/") == URLCheckResult(200)
+
+
+async def test_check_urls_cached(respx_mock: MockRouter) -> None:
+    """已缓存的网址不会重新检查"""
+    from src.utils.validation.cache import URLCache
+    from src.utils.validation.models import URLCheckResult
+    from src.utils.validation.utils import check_urls
+
+    route = respx_mock.head("https://example.com/").respond(200)
+    cache = URLCache()
+
+    assert await check_urls(["https://example.com/"], cache=cache) == {
+        "https://example.com/": URLCheckResult(200)
+    }
+    assert await check_urls(["https://example.com/"], cache=cache) == {
+        "https://example.com/": URLCheckResult(200)
+    }
+    assert route.call_count == 1
+
+
+async def test_check_urls_allow_stale(
+    respx_mock: MockRouter, mocker: MockerFixture
+) -> None:
+    """未变化的网址可以直接使用过期的成功结果"""
+    from src.utils.validation.cache import URLCache
+    from src.utils.validation.models import URLCheckResult
+    from src.utils.validation.utils import check_urls
+
+    mock_time = mocker.patch("time.time", return_value=1000)
+    route = respx_mock.head("https://example.com/").respond(200)
+    cache = URLCache(success_ttl=10)
+    cache.set("https://example.com/", URLCheckResult(200))
+
+    mock_time.return_value = 2000
+    await check_urls(
+        ["https://example.com/"], cache=cache, allow_stale=["https://example.com/"]
+    )
+    assert not route.called
+
+    await check_urls(["https://example.com/"], cache=cache)
+    assert route.called
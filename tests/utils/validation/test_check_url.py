@@ -0,0 +1,153 @@
+import asyncio
+
+import httpx
+from pytest_mock import MockerFixture
+from respx import MockRouter
+
+
+async def test_check_url_head(respx_mock: MockRouter) -> None:
+    """HEAD 请求成功时不会再发送 GET 请求"""
+    from src.utils.validation.models import URLCheckResult
+    from src.utils.validation.utils import check_url
+
+    head = respx_mock.head("https://example.com/").respond(200)
+    get = respx_mock.get("https://example.com/").respond(200)
+
+    assert await check_url("https://example.com/") == URLCheckResult(200)
+    assert head.called
+    assert not get.called
+
+
+async def test_check_url_fallback_to_get(respx_mock: MockRouter) -> None:
+    """服务器不支持 HEAD 请求时，改用 GET 请求"""
+    from src.utils.validation.models import URLCheckResult
+    from src.utils.validation.utils import check_url
+
+    respx_mock.head("https://example.com/").respond(405)
+    get = respx_mock.get("https://example.com/").respond(200, text="x" * 1024)
+
+    assert await check_url("https://example.com/") == URLCheckResult(200)
+    assert get.called
+
+
+async def test_check_url_error(respx_mock: MockRouter) -> None:
+    """请求出错时返回 -1"""
+    from src.utils.validation.utils import check_url
+
+    respx_mock.head("https://example.com/").mock(side_effect=httpx.ConnectTimeout)
+
+    result = await check_url("https://example.com/")
+    assert result.status_code == -1
+    assert result.msg
+
+
+async def test_check_urls(respx_mock: MockRouter) -> None:
+    """并发检查多个网址，相同网址只检查一次，同时不超过并发上限"""
+    from src.utils.validation.models import URLCheckResult
+    from src.utils.validation.utils import check_urls
+
+    running = 0
+    max_running = 0
+
+    async def side_effect(request: httpx.Request) -> httpx.Response:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return httpx.Response(200 if request.url.path != "/404" else 404)
+
+    route = respx_mock.head(host="example.com").mock(side_effect=side_effect)
+
+    urls = [f"https://example.com/{i}" for i in range(10)]
+    results = await check_urls([*urls, *urls, "https://example.com/404"], 2)
+
+    assert route.call_count == 11
+    assert max_running <= 2
+    assert results["https://example.com/0"] == URLCheckResult(200)
+    assert results["https://example.com/404"] == URLCheckResult(404)
+
+
+async def test_check_github_repo_by_api(
+    respx_mock: MockRouter, mocker: MockerFixture
+) -> None:
+    """GitHub 仓库通过 API 检查，同时获取默认分支与最新提交"""
+    from src.utils.validation.models import URLCheckResult
+    from src.utils.validation.utils import check_url
+
+    mocker.patch("src.utils.validation.utils._github_token", "token")
+
+    repo = respx_mock.get("https://api.github.com/repos/owner/repo").respond(
+        json={"default_branch": "main"}
+    )
+    sha = respx_mock.get(
+        "https://api.github.com/repos/owner/repo/commits/main"
+    ).respond(text="0123456789abcdef0123456789abcdef01234567")
+    missing = respx_mock.get("https://api.github.com/repos/owner/missing").respond(404)
+
+    assert await check_url("https://github.com/owner/repo") == URLCheckResult(
+        200, "", "main", "0123456789abcdef0123456789abcdef01234567"
+    )
+    result = await check_url("https://github.com/owner/missing/")
+
+    assert result.status_code == 404
+    assert repo.calls.last.request.headers["Authorization"] == "Bearer token"
+    assert sha.called
+    assert missing.called
+
+
+async def test_check_github_repo_by_git(
+    respx_mock: MockRouter, mocker: MockerFixture
+) -> None:
+    """API 被限流时改用 git ls-remote 检查"""
+    from src.utils.validation.models import URLCheckResult
+    from src.utils.validation.utils import check_url
+
+    mocker.patch("src.utils.validation.utils._github_token", "token")
+
+    respx_mock.get("https://api.github.com/repos/owner/repo").respond(403)
+
+    mock_proc = mocker.MagicMock()
+    mock_proc.returncode = 0
+    mock_proc.communicate = mocker.AsyncMock(
+        return_value=(
+            b"ref: refs/heads/dev\tHEAD\n0123456789abcdef0123456789abcdef01234567\tHEAD\n",
+            b"",
+        )
+    )
+    mock_exec = mocker.patch(
+        "asyncio.create_subprocess_exec", new=mocker.AsyncMock(return_value=mock_proc)
+    )
+
+    result = await check_url("https://github.com/owner/repo")
+
+    assert result == URLCheckResult(
+        200, "", "dev", "0123456789abcdef0123456789abcdef01234567"
+    )
+    assert mock_exec.call_args.args[:5] == (
+        "git",
+        "ls-remote",
+        "--symref",
+        "https://github.com/owner/repo",
+        "HEAD",
+    )
+
+
+async def test_check_github_repo_by_git_not_found(mocker: MockerFixture) -> None:
+    """未设置令牌时使用 git ls-remote 检查，找不到仓库时返回 404"""
+    from src.utils.validation.utils import check_url
+
+    mocker.patch("src.utils.validation.utils._github_token", None)
+
+    mock_proc = mocker.MagicMock()
+    mock_proc.returncode = 128
+    mock_proc.communicate = mocker.AsyncMock(
+        return_value=(b"", b"remote: Repository not found.\n")
+    )
+    mocker.patch(
+        "asyncio.create_subprocess_exec", new=mocker.AsyncMock(return_value=mock_proc)
+    )
+
+    result = await check_url("https://github.com/owner/missing")
+
+    assert result.status_code == 404
@@ -0,0 +1,101 @@
+import tracemalloc
+from typing import Any
+
+import pytest
+from nonebug import App
+from respx import MockRouter
+
+
+def generate_raw_data(count: int) -> dict[str, Any]:
+    """生成插件列表中有 count 个插件时的验证数据"""
+    data = {
+        "module": "module",
+        "module_path": "module_path",
+        "description": "description",
+        "usage": "usage",
+        "author": "author",
+        "version": "0.1",
+        "plugin_type": "NORMAL",
+        "is_dir": True,
+        "github_url": "https://github.com/author/module",
+    }
+    previous_data = {
+        f"plugin_{i}": {**data, "module": f"module_{i}"} for i in range(count)
+    }
+    previous_data["plugin_name"] = data
+    return {
+        **data,
+        "name": "plugin_name",
+        "skip_plugin_test": True,
+        "previous_data": previous_data,
+    }
+
+
+async def test_previous_data_error(app: App, mocked_api: MockRouter) -> None:
+    """与上次发布的数据相同时，错误信息中只包含冲突的数据"""
+    from src.utils.validation import PublishType, validate_info
+
+    raw_data = generate_raw_data(10)
+    result = await validate_info(PublishType.PLUGIN, raw_data)
+
+    assert not result.valid
+    assert result.errors == [
+        {
+            "loc": ("previous_data",),
+            "msg": "与上次发布的数据相同。",
+            "type": "previous_data",
+            "ctx": {"previous_data": raw_data["previous_data"]["plugin_name"]},
+            "input": None,
+        }
+    ]
+    # 错误信息中的数据为副本，不引用原始数据
+    old_data = result.errors[0].get("ctx", {})["previous_data"]
+    assert old_data is not raw_data["previous_data"]["plugin_name"]
+
+
+@pytest.mark.parametrize("count", [10, 10000])
+async def test_memory_and_log_flat(
+    app: App, mocked_api: MockRouter, count: int
+) -> None:
+    """插件数量增长时，验证与输出日志的内存占用和日志大小保持不变"""
+    from nonebot import logger
+
+    from src.plugins.publish.constants import LOG_MAX_LENGTH
+    from src.plugins.publish.utils import log_validation_result
+    from src.utils.validation import PublishType, validate_info
+
+    # 先检查一次网址，避免创建客户端的内存计入结果
+    await validate_info(PublishType.PLUGIN, generate_raw_data(0))
+
+    logs: list[str] = []
+    handler_id = logger.add(logs.append, level="INFO", format="{message}")
+    raw_data = generate_raw_data(count)
+
+    tracemalloc.start()
+    try:
+        result = await validate_info(PublishType.PLUGIN, raw_data)
+        log_validation_result(result)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        logger.remove(handler_id)
+
+    # 插件列表本身占用数 MB，验证过程中不应复制或序列化整个列表
+    assert peak < 256 * 1024
+    assert sum(len(log) for log in logs) < 2 * LOG_MAX_LENGTH
+
+
+async def test_validate_info_many(app: App, mocked_api: MockRouter) -> None:
+    """批量验证时相同的网址只检查一次"""
+    from src.utils.validation import PublishType, validate_info_many
+
+    raw_data = generate_raw_data(0)
+    raw_data.pop("previous_data")
+    results = await validate_info_many(
+        PublishType.PLUGIN,
+        [raw_data, {**raw_data, "name": "plugin_1", "plugin_type": None}],
+    )
+
+    assert [result.valid for result in results] == [True, False]
+    assert [error["loc"] for error in results[1].errors] == [("plugin_type",)]
+    assert mocked_api["github_url"].call_count == 1
@@ -0,0 +1,106 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from nonebug import App
+
+
+def generate_raw_data(index: int = 0) -> dict[str, Any]:
+    return {
+        "name": f"plugin_{index}",
+        "module": f"module_{index}",
+        "module_path": "module_path",
+        "description": "description",
+        "usage": "usage",
+        "author": "author",
+        "version": "0.1",
+        "plugin_type": "NORMAL",
+        "is_dir": True,
+        "github_url": "https://github.com/author/module",
+    }
+
+
+def get_context() -> dict[str, Any]:
+    from src.utils.validation.models import URLCheckResult
+
+    return {"url_results": {"https://github.com/author/module": URLCheckResult(200)}}
+
+
+async def test_validate(app: App) -> None:
+    """验证通过时返回转换后的数据"""
+    from src.utils.validation import PublishType, validators
+
+    data, errors = validators[PublishType.PLUGIN].validate(
+        {**generate_raw_data(), "is_dir": "true", "extra": "extra"}, get_context()
+    )
+
+    assert errors == []
+    assert data == generate_raw_data()
+
+
+async def test_validate_collect_valid_values(app: App) -> None:
+    """验证失败时只保留通过验证的字段"""
+    from src.utils.validation import PublishType, validators
+
+    raw_data = generate_raw_data()
+    raw_data["name"] = "a" * 100
+    raw_data["is_dir"] = "true"
+    raw_data.pop("usage")
+
+    data, errors = validators[PublishType.PLUGIN].validate(raw_data, get_context())
+
+    assert [error["loc"] for error in errors] == [("name",), ("usage",)]
+    expected = generate_raw_data()
+    expected.pop("name")
+    expected.pop("usage")
+    assert data == expected
+
+
+async def test_validate_many(app: App) -> None:
+    """批量验证的结果与逐条验证一致"""
+    from src.utils.validation import PublishType, validators
+
+    validator = validators[PublishType.PLUGIN]
+    raw_data_list = [generate_raw_data(i) for i in range(3)]
+    raw_data_list[1]["github_url"] = "https://www.baidu.com"
+    raw_data_list[2]["is_dir"] = "maybe"
+
+    results = validator.validate_many(raw_data_list, get_context())
+
+    assert results == [
+        validator.validate(raw_data, get_context()) for raw_data in raw_data_list
+    ]
+    assert [[error["loc"] for error in errors] for _, errors in results] == [
+        [],
+        [("github_url",)],
+        [("is_dir",)],
+    ]
+
+
+@pytest.mark.parametrize("count", [1, 10000])
+async def test_validate_benchmark(
+    app: App, count: int, record_property: Callable[[str, object], None]
+) -> None:
+    """逐条验证与批量验证的耗时"""
+    from src.utils.validation import PublishType, validators
+
+    validator = validators[PublishType.PLUGIN]
+    raw_data_list = [generate_raw_data(i) for i in range(count)]
+    context = get_context()
+
+    start = time.perf_counter()
+    for raw_data in raw_data_list:
+        validator.validate(raw_data, context)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = validator.validate_many(raw_data_list, context)
+    batch = time.perf_counter() - start
+
+    record_property("validate", single)
+    record_property("validate_many", batch)
+    assert all(not errors for _, errors in results)
+    # 每条数据的验证耗时应在毫秒以内
+    assert single < count * 0.001 + 0.1
+    assert batch < count * 0.001 + 0.1